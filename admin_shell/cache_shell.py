@@ -1,5 +1,5 @@
 
-from utils.api import get, delete
+from utils.api import get, delete, post
 from utils.print_helper import print_response
 
 BASE = "http://localhost:8000"
@@ -14,6 +14,15 @@ def cache_shell():
         elif cmd == "statistics":
             print_response(get("/cache/statistics"))
 
+        elif cmd == "rebuild-stats":
+            print_response(post("/cache/statistics/rebuild"))
+
+        elif cmd == "llm-stats":
+            print_response(get("/cache/llm-responses/statistics"))
+
+        elif cmd == "llm-clear":
+            print_response(delete("/cache/llm-responses"))
+
         elif cmd.startswith("check "):
             _, file_id = cmd.split(maxsplit=1)
             print_response(get(f"/cache/check/{file_id}"))
@@ -29,6 +38,14 @@ def cache_shell():
             _, file_id = cmd.split(maxsplit=1)
             print_response(delete(f"/cache/summary/{file_id}"))
 
+        elif cmd.startswith("bulk-delete "):
+            file_ids = cmd.split()[1:]
+            print_response(post("/cache/bulk-delete", {"file_ids": file_ids}))
+
+        elif cmd.startswith("delete-range "):
+            _, start, end = cmd.split(maxsplit=2)
+            print_response(delete(f"/cache/range?start={start}&end={end}"))
+
         elif cmd == "all":
             print_response(delete("/cache/all"))
 
@@ -43,9 +60,14 @@ def cache_shell():
         elif cmd == "help":
             print("""📝 명령어 목록:
   statistics                  → 캐시 통계 조회
+  rebuild-stats              → 통계 카운터 재구성 (전체 스캔)
+  llm-stats                  → LLM 응답 캐시 적중률 조회
+  llm-clear                  → LLM 응답 캐시 전체 삭제
   check <file_id>            → 특정 캐시 존재 확인
   list <YYYY-MM-DD>          → 특정 날짜 저장 캐시 조회
   delete <file_id>           → 특정 캐시 삭제
+  bulk-delete <id> <id> ...  → 여러 캐시 일괄 삭제
+  delete-range <시작> <종료>  → 저장일 기준 기간 캐시 삭제 (YYYY-MM-DD)
   cleanup                    → TTL 만료된 캐시 정리
   all                        → 전체 캐시 삭제
   log <YYYY-MM-DD>           → 삭제 로그 조회
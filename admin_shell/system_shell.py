@@ -1,5 +1,5 @@
 
-from utils.api import delete
+from utils.api import admin_headers, delete, get, post
 from utils.print_helper import print_response
 
 BASE = "http://localhost:8000"
@@ -10,6 +10,52 @@ def system_shell():
         if cmd == "back":
             break
 
+        elif cmd == "profile":
+            # 질의·URL 은 대소문자를 유지해야 하므로 항목별로 입력받는다
+            data = {
+                "file_id": input("  file_id : ").strip(),
+                "pdf_url": input("  pdf_url : ").strip(),
+                "query": input("  query   : ").strip(),
+                "lang": input("  lang    : ").strip() or "ko",
+            }
+            print_response(post("/api/summary?profile=1", data, headers=admin_headers()))
+
+        elif cmd == "profiles":
+            print_response(get("/system/profiles", headers=admin_headers()))
+
+        elif cmd.startswith("profile-get "):
+            _, profile_id = cmd.split(maxsplit=1)
+            res = get(f"/system/profiles/{profile_id}", headers=admin_headers())
+            if getattr(res, "status_code", None) == 200:
+                path = f"{profile_id}.collapsed"
+                with open(path, "w") as f:
+                    f.write(res.text)
+                print(f"✅ 저장됨: {path} (flamegraph.pl {path} > {profile_id}.svg)")
+            else:
+                print_response(res)
+
+        elif cmd == "ingest":
+            # 한 줄에 "file_id,pdf_url" (또는 공백 구분) 형식의 목록 파일
+            path = input("  목록 파일 경로 : ").strip()
+            langs = input("  번역 캐시 언어 (쉼표 구분, 생략 가능) : ").strip()
+            try:
+                with open(path, encoding="utf-8") as f:
+                    rows = [line.replace(",", " ").split() for line in f if line.strip()]
+            except OSError as e:
+                print(f"❌ 파일을 읽을 수 없습니다: {e}")
+                continue
+            items = [{"file_id": r[0], "pdf_url": r[1]} for r in rows if len(r) >= 2]
+            print(f"📦 {len(items)}건 사전 적재 요청")
+            data = {"items": items, "langs": [l.strip() for l in langs.split(",") if l.strip()]}
+            print_response(post("/api/ingest", data, headers=admin_headers()))
+
+        elif cmd == "ingests":
+            print_response(get("/api/ingest"))
+
+        elif cmd.startswith("ingest-get "):
+            _, batch_id = cmd.split(maxsplit=1)
+            print_response(get(f"/api/ingest/{batch_id}"))
+
         elif cmd == "all":
             confirm = input("⚠️ 정말 모든 데이터를 삭제하시겠습니까? (yes/no): ").strip().lower()
             if confirm == "yes":
@@ -20,6 +66,12 @@ def system_shell():
         elif cmd == "help":
             print("""📝 명령어 목록:
   all       → 벡터 + 캐시 + 메타데이터 전체 삭제
+  profile   → /api/summary 1건을 프로파일러로 실행 (ADMIN_TOKEN 필요)
+  profiles  → 저장된 프로파일 목록
+  profile-get <id> → collapsed-stack 파일로 저장
+  ingest    → 목록 파일(file_id,pdf_url)의 문서를 미리 적재·요약 (ADMIN_TOKEN 필요)
+  ingests   → 최근 사전 적재 배치 목록
+  ingest-get <id> → 배치 진행 상황·처리량 리포트
   back      → MainShell로 복귀
 """)
         else:
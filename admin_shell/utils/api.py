@@ -1,11 +1,16 @@
 
+import os
 import requests
 
 BASE_URL = "http://localhost:8000"
 
-def get(path: str):
+def admin_headers() -> dict:
+    """관리자 전용 API 용 헤더 (서버와 같은 ADMIN_TOKEN 환경변수 사용)"""
+    return {"X-Admin-Token": os.getenv("ADMIN_TOKEN", "")}
+
+def get(path: str, headers=None):
     try:
-        return requests.get(f"{BASE_URL}{path}")
+        return requests.get(f"{BASE_URL}{path}", headers=headers)
     except Exception as e:
         return f"GET 요청 실패: {e}"
 
@@ -15,8 +20,8 @@ def delete(path: str):
     except Exception as e:
         return f"DELETE 요청 실패: {e}"
 
-def post(path: str, data=None):
+def post(path: str, data=None, headers=None):
     try:
-        return requests.post(f"{BASE_URL}{path}", json=data)
+        return requests.post(f"{BASE_URL}{path}", json=data, headers=headers)
     except Exception as e:
         return f"POST 요청 실패: {e}"
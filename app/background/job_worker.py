@@ -0,0 +1,121 @@
+# app/background/job_worker.py
+"""비동기 요약 작업 워커 — lifespan 에서 ``JOB_WORKERS`` 개의 태스크로 실행.
+
+각 워커는 ``job:queue`` 에서 작업을 가져와 :class:`SummaryServiceGraph` 로 실행하고
+결과를 작업 해시에 저장한 뒤, ``webhook_url`` 이 있으면 완료 알림을 POST 한다.
+여러 레플리카가 같은 Redis 큐를 소비하므로 레플리카 수만큼 처리량이 늘어난다.
+"""
+import asyncio
+import os
+import time
+from typing import List, Optional
+
+import httpx
+
+from app.infra.job_queue import JOB_LEASE_SEC, JobQueue, get_job_queue
+from app.service.summary_service_graph import get_summary_service_graph
+from app.utils.resilience import backoff_delay
+
+JOB_WORKERS          = int(os.getenv("JOB_WORKERS", "2"))
+JOB_DEADLINE_SEC     = float(os.getenv("JOB_DEADLINE_SEC", "1800"))  # Q&A 루프 예산 (대화형보다 길게)
+JOB_MAX_ATTEMPTS     = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))       # 과부하 거절 시 재시도 횟수
+JOB_REAP_SEC         = float(os.getenv("JOB_REAP_SEC", "30"))        # 고아 작업 점검 주기
+WEBHOOK_TIMEOUT_SEC  = float(os.getenv("JOB_WEBHOOK_TIMEOUT_SEC", "10"))
+WEBHOOK_ATTEMPTS     = 3
+
+async def _heartbeat(queue: JobQueue, job_id: str) -> None:
+    while True:
+        await asyncio.sleep(JOB_LEASE_SEC / 3)
+        try:
+            await queue.heartbeat(job_id)
+        except Exception as e:  # noqa: BLE001
+            print(f"[JobWorker] ⚠️ heartbeat 실패 {job_id}: {e}", flush=True)
+
+
+async def _notify(client: httpx.AsyncClient, queue: JobQueue, job: dict, body: dict) -> None:
+    """완료 webhook — 일시 오류는 백오프 후 재시도, 최종 실패는 작업에 기록"""
+    payload = {"job_id": job["job_id"], "status": body["status"], **body}
+    for attempt in range(1, WEBHOOK_ATTEMPTS + 1):
+        try:
+            resp = await client.post(job["webhook_url"], json=payload)
+            resp.raise_for_status()
+            await queue.set_field(job["job_id"], webhook_status=resp.status_code)
+            return
+        except Exception as e:  # noqa: BLE001
+            error = str(e) or type(e).__name__
+            if attempt < WEBHOOK_ATTEMPTS:
+                await asyncio.sleep(backoff_delay(attempt))
+    print(f"[JobWorker] ❌ webhook 실패 {job['job_id']}: {error}", flush=True)
+    await queue.set_field(job["job_id"], webhook_error=error)
+
+
+async def _process(queue: JobQueue, client: httpx.AsyncClient, job_id: str) -> None:
+    job = await queue.get(job_id)
+    if job is None:  # 만료된 작업
+        await queue.finish(job_id, "failed", error="job expired")
+        return
+
+    service = get_summary_service_graph()
+    # heartbeat 는 retry()/finish() 까지 유지 — 재시도 대기 중 lease 가 끊기면 reaper 가
+    # 같은 작업을 다시 줄 세워 중복 실행된다
+    hb = asyncio.create_task(_heartbeat(queue, job_id))
+    t0 = time.perf_counter()
+    try:
+        try:
+            result = await service.generate(
+                file_id=job["file_id"],
+                pdf_url=job["pdf_url"],
+                query=job["query"],
+                lang=job["lang"],
+                deadline_sec=JOB_DEADLINE_SEC,
+            )
+        except Exception as e:  # noqa: BLE001
+            result = {"file_id": job["file_id"], "error": str(e) or type(e).__name__}
+
+        if result.get("retry_after") is not None and int(job.get("attempts", 1)) < JOB_MAX_ATTEMPTS:
+            # LLM 과부하 / 서킷 open → 잠시 뒤 다시 줄 세움
+            await asyncio.sleep(min(float(result["retry_after"]), 60))
+            await queue.retry(job_id, result.get("error", ""))
+            print(f"[JobWorker] 🔁 재시도 대기열로 {job_id} (retry_after={result['retry_after']})", flush=True)
+            return
+
+        status = "failed" if result.get("error") else "done"
+        await queue.finish(job_id, status, result=result, error=result.get("error", ""))
+    finally:
+        hb.cancel()
+    print(f"[JobWorker] ✅ {job_id} {status} ({time.perf_counter() - t0:.1f}s)", flush=True)
+
+    if job.get("webhook_url"):
+        await _notify(client, queue, job, {"status": status, "result": result})
+
+
+async def job_worker(n: int) -> None:
+    queue = get_job_queue()
+    suspects: set = set()
+    next_reap = time.monotonic() + JOB_REAP_SEC
+    async with httpx.AsyncClient(timeout=WEBHOOK_TIMEOUT_SEC) as client:
+        while True:
+            try:
+                if n == 0 and time.monotonic() >= next_reap:
+                    suspects = await queue.reap(suspects)
+                    next_reap = time.monotonic() + JOB_REAP_SEC
+                job_id = await queue.claim()
+                if job_id:
+                    await _process(queue, client, job_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:  # noqa: BLE001
+                # Redis 장애 등 → 잠시 쉬고 계속
+                print(f"[JobWorker-{n}] ❌ 예외 발생: {e}", flush=True)
+                await asyncio.sleep(1)
+
+
+def start_job_workers(count: int = JOB_WORKERS) -> List[asyncio.Task]:
+    """FastAPI lifespan 에서 호출 — 워커 태스크 목록 반환"""
+    return [asyncio.create_task(job_worker(i), name=f"job-worker-{i}") for i in range(count)]
+
+
+async def stop_job_workers(tasks: Optional[List[asyncio.Task]]) -> None:
+    for t in tasks or ():
+        t.cancel()
+    await asyncio.gather(*(tasks or ()), return_exceptions=True)
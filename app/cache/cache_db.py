@@ -1,12 +1,111 @@
 
 import os
 import redis
+import base64
+import hashlib
+import time
 from functools import lru_cache
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
 from datetime import datetime, timedelta
 import json
 from zoneinfo import ZoneInfo
 
+import numpy as np
+
+# ─────────────────── 질의응답 캐시 설정 ──────────────────────────
+ANSWER_CACHE_THRESHOLD = float(os.getenv("ANSWER_CACHE_THRESHOLD", "0.92"))  # cosine 유사도
+ANSWER_CACHE_TTL_SEC   = int(os.getenv("ANSWER_CACHE_TTL_SEC", "86400"))
+ANSWER_CACHE_MAX       = int(os.getenv("ANSWER_CACHE_MAX", "200"))           # 문서당 최대 항목 수
+
+# ─────────────────── 통계 카운터 설정 ────────────────────────────
+STATS_DATES_KEY        = "pdf:stats:dates"                                   # 통계가 있는 날짜 SET
+STATS_MEMORY_SAMPLES   = int(os.getenv("STATS_MEMORY_SAMPLES", "5"))         # MEMORY USAGE 샘플 수
+
+# ─────────────────── file_id 인덱스 / 대량 작업 ─────────────────────
+FILE_INDEX_KEY         = "pdf:index"                                          # ZSET: file_id → 저장 시각
+CACHE_BULK_BATCH       = int(os.getenv("CACHE_BULK_BATCH", "1000"))          # 파이프라인 배치 크기
+
+# ─────────────────── 번역 캐시 ───────────────────────────────────────
+# 문서별 번역 HSET 은 Q&A 답변 번역까지 쌓이므로 항목 수 상한 (최근 사용 순 유지)
+TRANSLATION_MAX_PER_DOC = int(os.getenv("TRANSLATION_MAX_PER_DOC", "64"))
+
+# ─────────────────── map/reduce 요약 트리 ─────────────────────────────
+# 요약을 지우고 다시 만들 때 재사용되도록 요약과 별도 수명 (요약 삭제 시 유지, 전체 삭제 시에만 정리)
+SUMMARY_TREE_TTL_SEC   = int(os.getenv("SUMMARY_TREE_TTL_SEC", str(30 * 86400)))
+
+# ─────────────────── LLM 응답(exact-match) 캐시 ──────────────────────
+LLM_CACHE_INDEX_KEY    = "llm:resp:index"                                     # ZSET: prompt 해시 → 저장 시각
+LLM_CACHE_STATS_KEY    = "llm:resp:stats"                                     # HSET: hits, misses, stored
+LLM_CACHE_TTL_SEC      = int(os.getenv("LLM_CACHE_TTL_SEC", str(7 * 86400)))
+LLM_CACHE_MAX          = int(os.getenv("LLM_CACHE_MAX", "20000"))            # 최대 항목 수
+
+# ─────────────────── 프로파일 결과 (collapsed stacks) ─────────────────
+PROFILE_INDEX_KEY      = "profile:index"                                      # ZSET: profile_id → 생성 시각
+PROFILE_TTL_SEC        = int(os.getenv("PROFILE_TTL_SEC", str(7 * 86400)))
+
+# ─────────────────── 대량 사전 적재 리포트 ───────────────────────────
+INGEST_INDEX_KEY       = "ingest:index"                                       # ZSET: batch_id → 시작 시각
+INGEST_TTL_SEC         = int(os.getenv("INGEST_TTL_SEC", str(7 * 86400)))
+INGEST_STALE_SEC       = int(os.getenv("INGEST_STALE_SEC", "180"))           # running 리포트가 이만큼 갱신 없으면 interrupted
+
+# GET + hit/miss 카운트를 한 번의 왕복으로 처리
+# KEYS: entry_key, stats_key
+_LLM_CACHE_GET_LUA = """
+local v = redis.call('GET', KEYS[1])
+if v then
+    redis.call('HINCRBY', KEYS[2], 'hits', 1)
+else
+    redis.call('HINCRBY', KEYS[2], 'misses', 1)
+end
+return v
+"""
+
+# HSTRLEN → HDEL → 통계 차감 → 삭제 로그를 서버에서 원자적으로 처리
+# 통계 카운터가 없는 날짜(카운터 도입 이전 데이터)는 차감하지 않는다 — TTL 없는 음수 HSET 방지
+# KEYS: date_key, stats_key, log_key / ARGV: file_id, log_entry
+_DELETE_ENTRY_LUA = """
+local size = redis.call('HSTRLEN', KEYS[1], ARGV[1])
+if redis.call('HDEL', KEYS[1], ARGV[1]) == 1 then
+    if redis.call('EXISTS', KEYS[2]) == 1 then
+        if redis.call('HINCRBY', KEYS[2], 'count', -1) < 0 then
+            redis.call('HSET', KEYS[2], 'count', 0)
+        end
+        if redis.call('HINCRBY', KEYS[2], 'bytes', -size) < 0 then
+            redis.call('HSET', KEYS[2], 'bytes', 0)
+        end
+    end
+    if ARGV[2] ~= '' then
+        redis.call('RPUSH', KEYS[3], ARGV[2])
+    end
+    return 1
+end
+return 0
+"""
+
+# 캐시된 문서 요약 + (있으면) 그 요약의 lang 번역을 원자적으로 조회 (그래프 우회 경로)
+# 날짜 HSET 은 메타데이터를 먼저 읽어 KEYS 로 넘긴다 (스크립트 안에서 key 이름을 만들지 않음)
+# 번역 field 는 _get_translation_field 와 같은 "sha1(원문):lang", 적중 시 LRU 시각 갱신
+# KEYS: date_key, metadata_key, translation_key, translation_lru_key
+# ARGV: file_id, lang(정규화), ttl_sec, now
+_CACHED_SUMMARY_LUA = """
+local summary = redis.call('HGET', KEYS[1], ARGV[1])
+if not summary then
+    return false
+end
+redis.call('EXPIRE', KEYS[2], ARGV[3])
+local translated = false
+if ARGV[2] ~= '' then
+    local field = redis.sha1hex(summary) .. ':' .. ARGV[2]
+    translated = redis.call('HGET', KEYS[3], field)
+    if translated then
+        redis.call('EXPIRE', KEYS[3], ARGV[3])
+        redis.call('ZADD', KEYS[4], ARGV[4], field)
+        redis.call('EXPIRE', KEYS[4], ARGV[3])
+    end
+end
+return {summary, translated}
+"""
+
 class RedisCacheDB:
     def __init__(
         self,
@@ -17,6 +116,9 @@ class RedisCacheDB:
     ):
         self.r = redis.Redis(host=host, port=port, db=db, decode_responses=True)
         self.ttl_days = ttl_days
+        self._delete_entry = self.r.register_script(_DELETE_ENTRY_LUA)
+        self._llm_cache_get = self.r.register_script(_LLM_CACHE_GET_LUA)
+        self._cached_summary = self.r.register_script(_CACHED_SUMMARY_LUA)
         
     def _get_date_key(self, date: datetime = None) -> str:
         """날짜를 기준으로 HSET key 생성"""
@@ -28,6 +130,47 @@ class RedisCacheDB:
         """파일 메타데이터용 key"""
         return f"pdf:metadata:{file_id}"
 
+    def _get_stats_key(self, date_str: str) -> str:
+        """날짜별 통계 카운터(HSET: count, bytes) key"""
+        return f"pdf:stats:{date_str}"
+
+    def _get_answer_key(self, file_id: str) -> str:
+        """문서별 질의응답 캐시(HSET) key"""
+        return f"pdf:answers:{file_id}"
+
+    def _get_abstract_key(self, file_id: str) -> str:
+        """문서별 추출 초록(TextRank) key"""
+        return f"pdf:abstract:{file_id}"
+
+    def _get_summary_tree_key(self, file_id: str) -> str:
+        """문서별 map-reduce 요약 트리 노드(HSET) key"""
+        return f"pdf:summary_tree:{file_id}"
+
+    def _get_translation_key(self, file_id: str) -> str:
+        """문서별 번역 캐시(HSET) key"""
+        return f"pdf:translations:{file_id}"
+
+    def _get_translation_lru_key(self, file_id: str) -> str:
+        """문서별 번역 field → 마지막 사용 시각 (ZSET, 상한 초과 시 오래된 것부터 제거)"""
+        return f"pdf:translation_lru:{file_id}"
+
+    def _get_llm_response_key(self, prompt_hash: str) -> str:
+        """LLM 응답 캐시 key (model·temperature·prompt 해시)"""
+        return f"llm:resp:{prompt_hash}"
+
+    def _get_profile_key(self, profile_id: str) -> str:
+        """프로파일 결과(HSET: meta, stacks) key"""
+        return f"profile:{profile_id}"
+
+    def _get_ingest_key(self, batch_id: str) -> str:
+        """사전 적재 배치 리포트(JSON) key"""
+        return f"ingest:{batch_id}"
+
+    def _get_translation_field(self, content: str, lang: str) -> str:
+        """번역 원문 해시 + 대상 언어"""
+        digest = hashlib.sha1(content.encode("utf-8")).hexdigest()
+        return f"{digest}:{lang.strip().lower()}"
+
     def get_pdf(self, fid: str) -> Optional[str]:
         """file_id로 요약본 조회 (모든 날짜에서 검색)"""
         # 1. 먼저 메타데이터에서 저장된 날짜 확인
@@ -71,27 +214,39 @@ class RedisCacheDB:
         return False
 
     def set_pdf(self, fid: str, s: str):
-        """날짜별 HSET에 요약본 저장"""
+        """날짜별 HSET에 요약본 저장 (통계 카운터도 같은 트랜잭션에서 갱신)"""
         now = datetime.now(ZoneInfo("Asia/Seoul"))
+        date_str = now.strftime('%Y-%m-%d')
         date_key = self._get_date_key(now)
-        
-        # 1. HSET에 요약본 저장
-        self.r.hset(date_key, fid, s)
-        
-        # 2. 메타데이터 저장 (조회 성능 향상용)
+        stats_key = self._get_stats_key(date_str)
+        date_ttl = (self.ttl_days + 1) * 86400  # 8일로 설정해서 여유 확보
+
         metadata = {
-            'date': now.strftime('%Y-%m-%d'),
+            'date': date_str,
             'timestamp': now.isoformat(),
             'ttl_days': self.ttl_days
         }
-        self.r.setex(
-            self._get_metadata_key(fid), 
-            self.ttl_days * 86400,  # TTL in seconds
-            json.dumps(metadata)
-        )
-        
-        # 3. 날짜별 HSET에도 TTL 설정 (8일로 설정해서 여유 확보)
-        self.r.expire(date_key, (self.ttl_days + 1) * 86400)
+        size = len(s.encode("utf-8"))
+
+        def _tx(pipe):
+            # WATCH 상태에서 기존 값 확인 → 덮어쓰기면 개수는 그대로, 바이트는 차이만 반영
+            existed = pipe.hexists(date_key, fid)
+            old_size = pipe.hstrlen(date_key, fid) if existed else 0
+            pipe.multi()
+            # 1. HSET에 요약본 저장
+            pipe.hset(date_key, fid, s)
+            # 2. 메타데이터 저장 (조회 성능 향상용)
+            pipe.setex(self._get_metadata_key(fid), self.ttl_days * 86400, json.dumps(metadata))
+            # 3. 날짜별 HSET 및 통계 TTL 설정
+            pipe.expire(date_key, date_ttl)
+            pipe.hincrby(stats_key, "count", 0 if existed else 1)
+            pipe.hincrby(stats_key, "bytes", size - old_size)
+            pipe.expire(stats_key, date_ttl)
+            pipe.sadd(STATS_DATES_KEY, date_str)
+            # 4. 전역 file_id 인덱스
+            pipe.zadd(FILE_INDEX_KEY, {fid: now.timestamp()})
+
+        self.r.transaction(_tx, date_key)
 
     def get_summaries_by_date(self, date: datetime) -> Dict[str, str]:
         """특정 날짜의 모든 요약본 조회"""
@@ -103,6 +258,12 @@ class RedisCacheDB:
         date_key = self._get_date_key(date)
         return self.r.hlen(date_key)
 
+    def _delete_from_date(self, date_key: str, fid: str, log_entry: str = "", pipe=None):
+        """날짜 HSET에서 fid 삭제 + 통계 카운터 차감 (Lua 로 원자 처리)"""
+        date_str = date_key.split(':')[-1]
+        keys = [date_key, self._get_stats_key(date_str), self._get_deletion_log_key()]
+        return self._delete_entry(keys=keys, args=[fid, log_entry], client=pipe or self.r)
+
     def delete_pdf(self, fid: str) -> bool:
         metadata_key = self._get_metadata_key(fid)
         metadata = self.r.get(metadata_key)
@@ -111,7 +272,7 @@ class RedisCacheDB:
         if metadata:
             meta = json.loads(metadata)
             date_key = f"pdf:summaries:{meta['date']}"
-            deleted = bool(self.r.hdel(date_key, fid))
+            deleted = bool(self._delete_from_date(date_key, fid))
             self.r.delete(metadata_key)
         else:
         # 메타데이터가 없으면 최근 날짜 중 찾아서 삭제
@@ -119,24 +280,71 @@ class RedisCacheDB:
                 date = datetime.now(ZoneInfo("Asia/Seoul")) - timedelta(days=i)
                 date_key = self._get_date_key(date)
                 if self.r.hexists(date_key, fid):
-                    deleted = bool(self.r.hdel(date_key, fid))
+                    deleted = bool(self._delete_from_date(date_key, fid))
                     break
 
-    # ✅ 삭제 성공했으면 무조건 로그 남기기
+        self.r.zrem(FILE_INDEX_KEY, fid)
+        # ✅ 삭제 성공했으면 무조건 로그 남기기
         if deleted:
+            self.r.delete(self._get_translation_key(fid), self._get_translation_lru_key(fid))
             self._log_cache_deletion(fid)
 
         return deleted
 
+    def delete_pdfs(self, fids: List[str]) -> int:
+        """여러 file_id 를 배치 단위로 삭제. 배치당 왕복 2회 (조회 1 + 삭제 1)."""
+        deleted_count = 0
+        now = datetime.now(ZoneInfo("Asia/Seoul"))
+        recent_dates = [(now - timedelta(days=i)).strftime('%Y-%m-%d') for i in range(self.ttl_days)]
+
+        for i in range(0, len(fids), CACHE_BULK_BATCH):
+            batch = fids[i : i + CACHE_BULK_BATCH]
+
+            # 1) 메타데이터·인덱스 점수로 저장 날짜 파악
+            pipe = self.r.pipeline(transaction=False)
+            for fid in batch:
+                pipe.get(self._get_metadata_key(fid))
+                pipe.zscore(FILE_INDEX_KEY, fid)
+            results = pipe.execute()
+
+            # 2) 삭제 + 통계 차감 + 로그 + 인덱스 정리를 한 번에
+            pipe = self.r.pipeline(transaction=False)
+            script_pos = []  # 파이프라인 결과 중 Lua 삭제 결과 위치
+            for fid, metadata, score in zip(batch, results[0::2], results[1::2]):
+                if metadata:
+                    dates = [json.loads(metadata)['date']]
+                elif score is not None:
+                    dates = [datetime.fromtimestamp(score, ZoneInfo("Asia/Seoul")).strftime('%Y-%m-%d')]
+                else:
+                    dates = recent_dates
+                entry = f"{fid}|{now.isoformat()}"
+                for date_str in dates:
+                    script_pos.append(len(pipe))
+                    self._delete_from_date(f"pdf:summaries:{date_str}", fid, entry, pipe=pipe)
+                pipe.delete(
+                    self._get_metadata_key(fid), self._get_translation_key(fid), self._get_translation_lru_key(fid)
+                )
+            pipe.zrem(FILE_INDEX_KEY, *batch)
+            results = pipe.execute()
+            deleted_count += sum(results[pos] for pos in script_pos)
+
+        print(f"[LOG] Bulk deleted {deleted_count} cache entries → {self._get_deletion_log_key()}")
+        return deleted_count
+
+    def delete_by_date_range(self, start: datetime, end: datetime) -> int:
+        """저장 시각이 [start, end] 인 요약본 일괄 삭제 (날짜 단위, end 포함)"""
+        tz = ZoneInfo("Asia/Seoul")
+        lo = start.replace(hour=0, minute=0, second=0, microsecond=0, tzinfo=tz).timestamp()
+        hi = (end.replace(hour=0, minute=0, second=0, microsecond=0, tzinfo=tz) + timedelta(days=1)).timestamp()
+        fids = self.r.zrangebyscore(FILE_INDEX_KEY, lo, f"({hi}")
+        return self.delete_pdfs(fids)
+
     def get_all_file_ids(self) -> List[str]:
-        """현재 저장된 모든 file_id 조회"""
-        file_ids = []
-        pattern = "pdf:summaries:*"
-        
-        for key in self.r.scan_iter(match=pattern):
-            file_ids.extend(self.r.hkeys(key))
-        
-        return list(set(file_ids))  # 중복 제거
+        """현재 저장된 모든 file_id 조회 (전역 인덱스 사용)"""
+        # 날짜 HSET 이 TTL 로 사라진 항목은 인덱스에서도 정리
+        cutoff = datetime.now(ZoneInfo("Asia/Seoul")) - timedelta(days=self.ttl_days + 1)
+        self.r.zremrangebyscore(FILE_INDEX_KEY, "-inf", cutoff.timestamp())
+        return self.r.zrange(FILE_INDEX_KEY, 0, -1)
 
     def cleanup_expired_summaries(self):
         """수동으로 만료된 요약본 정리 (백업용)"""
@@ -148,38 +356,346 @@ class RedisCacheDB:
             date_key = self._get_date_key(check_date)
             
             if self.r.exists(date_key):
-                self.r.delete(date_key)
+                date_str = check_date.strftime('%Y-%m-%d')
+                pipe = self.r.pipeline()
+                pipe.delete(date_key, self._get_stats_key(date_str))
+                pipe.srem(STATS_DATES_KEY, date_str)
+                pipe.execute()
                 print(f"Deleted expired summaries for {check_date.strftime('%Y-%m-%d')}")
 
     def get_statistics(self) -> Dict:
-        """캐시 통계 정보 조회"""
+        """캐시 통계 정보 조회 — 날짜별 카운터만 읽으므로 O(날짜 수)"""
         stats = {
             'total_summaries': 0,
             'summaries_by_date': {},
+            'payload_bytes_by_date': {},
             'memory_usage': {},
             'total_memory_bytes': 0
         }
-        
-        # 날짜별 요약본 개수 집계
-        pattern = "pdf:summaries:*"
-        for key in self.r.scan_iter(match=pattern):
-            date_str = key.split(':')[-1]
-            count = self.r.hlen(key)
+
+        dates = sorted(self.r.smembers(STATS_DATES_KEY))
+        if not dates:
+            return stats
+
+        pipe = self.r.pipeline(transaction=False)
+        for date_str in dates:
+            pipe.hgetall(self._get_stats_key(date_str))
+            pipe.memory_usage(f"pdf:summaries:{date_str}", samples=STATS_MEMORY_SAMPLES)
+        results = pipe.execute()
+
+        expired = []
+        largest_date, largest_count = None, 0
+        for date_str, counters, memory_info in zip(dates, results[0::2], results[1::2]):
+            if not counters:
+                # 날짜 HSET·통계가 TTL 로 만료됨
+                expired.append(date_str)
+                continue
+            count = int(counters.get('count', 0))
             stats['summaries_by_date'][date_str] = count
+            stats['payload_bytes_by_date'][date_str] = int(counters.get('bytes', 0))
             stats['total_summaries'] += count
-            
-            # 메모리 사용량 추정
-            memory_info = self.r.memory_usage(key)
             if memory_info:
                 stats['memory_usage'][date_str] = memory_info
                 stats['total_memory_bytes'] += memory_info
-        for key in self.r.scan_iter(match="pdf:metadata:*"):
-            mem = self.r.memory_usage(key)
-            if mem:
-                stats['total_memory_bytes'] += mem
-                stats['memory_usage'][key] = mem
+            if count > largest_count:
+                largest_date, largest_count = date_str, count
+        if expired:
+            self.r.srem(STATS_DATES_KEY, *expired)
+
+        # 메타데이터 key 는 몇 개만 샘플링해 평균 크기 × 전체 개수로 추정
+        if largest_date:
+            sample_ids = self.r.hrandfield(f"pdf:summaries:{largest_date}", STATS_MEMORY_SAMPLES) or []
+            pipe = self.r.pipeline(transaction=False)
+            for fid in sample_ids:
+                pipe.memory_usage(self._get_metadata_key(fid))
+            sizes = [m for m in pipe.execute() if m]
+            if sizes:
+                estimate = int(sum(sizes) / len(sizes) * stats['total_summaries'])
+                stats['memory_usage']['metadata_estimate'] = estimate
+                stats['total_memory_bytes'] += estimate
         return stats
 
+    def rebuild_statistics(self) -> Dict:
+        """전체 keyspace 를 한 번 스캔해 통계 카운터·file_id 인덱스 재구성 (관리자용, 느림)"""
+        pipe = self.r.pipeline()
+        pipe.delete(FILE_INDEX_KEY)
+        for key in self.r.scan_iter(match="pdf:stats:*"):
+            pipe.delete(key)
+        for key in self.r.scan_iter(match="pdf:summaries:*"):
+            date_str = key.split(':')[-1]
+            stats_key = self._get_stats_key(date_str)
+            entries = self.r.hgetall(key)
+            lengths = [len(v.encode("utf-8")) for v in entries.values()]
+            pipe.hset(stats_key, mapping={'count': len(lengths), 'bytes': sum(lengths)})
+            if entries:
+                score = datetime.strptime(date_str, '%Y-%m-%d').replace(tzinfo=ZoneInfo("Asia/Seoul")).timestamp()
+                pipe.zadd(FILE_INDEX_KEY, {fid: score for fid in entries})
+            ttl = self.r.ttl(key)
+            if ttl and ttl > 0:
+                pipe.expire(stats_key, ttl)
+            pipe.sadd(STATS_DATES_KEY, date_str)
+        pipe.execute()
+        return self.get_statistics()
+
+    # ------------------------------------------------------------------
+    # 질의응답(semantic) 캐시
+    # ------------------------------------------------------------------
+    def get_answer(self, fid: str, embedding: List[float]) -> Optional[str]:
+        """질의 임베딩과 가장 유사한 캐시 답변 반환 (임계값 미만이면 None).
+
+        저장된 임베딩(float32 base64)을 행렬로 모아 NumPy 로 한 번에 cosine 계산.
+        """
+        now = time.time()
+        entries = [
+            e for e in map(json.loads, self.r.hvals(self._get_answer_key(fid)))
+            if now - e["ts"] <= ANSWER_CACHE_TTL_SEC
+        ]
+        if not entries:
+            return None
+        q = np.asarray(embedding, dtype=np.float32)
+        vecs = [_decode_vector(e) for e in entries]
+        keep = [i for i, v in enumerate(vecs) if v.shape == q.shape]  # 임베딩 모델이 바뀐 항목은 제외
+        if not keep:
+            return None
+        mat = np.stack([vecs[i] for i in keep])
+        norms = np.linalg.norm(mat, axis=1) * np.linalg.norm(q)
+        scores = np.divide(mat @ q, norms, out=np.zeros(len(keep), dtype=np.float32), where=norms > 0)
+        best = int(np.argmax(scores))
+        return entries[keep[best]]["answer"] if scores[best] >= ANSWER_CACHE_THRESHOLD else None
+
+    def set_answer(self, fid: str, query: str, embedding: List[float], answer: str):
+        """질의 임베딩과 함께 답변 저장. 문서당 ANSWER_CACHE_MAX 개까지만 유지."""
+        key = self._get_answer_key(fid)
+        field = hashlib.sha1(query.strip().encode("utf-8")).hexdigest()
+        entry = {
+            "query": query,
+            "vec": base64.b64encode(np.asarray(embedding, dtype=np.float32).tobytes()).decode("ascii"),
+            "answer": answer,
+            "ts": time.time(),
+        }
+        pipe = self.r.pipeline()
+        pipe.hset(key, field, json.dumps(entry))
+        pipe.expire(key, ANSWER_CACHE_TTL_SEC)
+        pipe.hlen(key)
+        _, _, size = pipe.execute()
+
+        # 오래된 항목부터 제거
+        if size > ANSWER_CACHE_MAX:
+            items = [(f, json.loads(v)["ts"]) for f, v in self.r.hgetall(key).items()]
+            items.sort(key=lambda x: x[1])
+            self.r.hdel(key, *[f for f, _ in items[: size - ANSWER_CACHE_MAX]])
+
+    def delete_answers(self, fid: str) -> bool:
+        """문서의 질의응답 캐시 전체 무효화 (벡터 삭제 시 호출)."""
+        return bool(self.r.delete(self._get_answer_key(fid)))
+
+    # ------------------------------------------------------------------
+    # 추출 초록 (LLM 요약이 없을 때 Q&A 문맥으로 사용)
+    # ------------------------------------------------------------------
+    def get_abstract(self, fid: str) -> Optional[str]:
+        return self.r.get(self._get_abstract_key(fid))
+
+    def set_abstract(self, fid: str, abstract: str):
+        self.r.setex(self._get_abstract_key(fid), self.ttl_days * 86400, abstract)
+
+    def delete_abstract(self, fid: str) -> bool:
+        return bool(self.r.delete(self._get_abstract_key(fid)))
+
+    # ------------------------------------------------------------------
+    # 요약 트리 (map/reduce 중간 결과, 내용 해시 기반 key)
+    # 요약 삭제(delete_pdf/delete_pdfs) 후 재요약에서 노드를 재사용하도록 요약과 따로
+    # SUMMARY_TREE_TTL_SEC 로 만료되며, delete_all_summaries 에서만 함께 지운다.
+    # ------------------------------------------------------------------
+    def get_summary_nodes(self, fid: str, keys: List[str]) -> List[Optional[str]]:
+        if not keys:
+            return []
+        return self.r.hmget(self._get_summary_tree_key(fid), keys)
+
+    def set_summary_nodes(self, fid: str, nodes: Dict[str, str]):
+        key = self._get_summary_tree_key(fid)
+        pipe = self.r.pipeline()
+        pipe.hset(key, mapping=nodes)
+        pipe.expire(key, SUMMARY_TREE_TTL_SEC)
+        pipe.execute()
+
+    # ------------------------------------------------------------------
+    # 번역 캐시 (file_id, 원문 해시, lang)
+    # ------------------------------------------------------------------
+    def get_translation(self, fid: str, content: str, lang: str) -> Optional[str]:
+        """원문(content)을 lang 으로 번역한 결과 조회"""
+        key = self._get_translation_key(fid)
+        field = self._get_translation_field(content, lang)
+        translated = self.r.hget(key, field)
+        if translated:
+            # 원본 요약과 동일하게 접근 시 TTL 갱신 + LRU 시각 갱신
+            lru_key = self._get_translation_lru_key(fid)
+            pipe = self.r.pipeline()
+            pipe.expire(key, self.ttl_days * 86400)
+            pipe.zadd(lru_key, {field: time.time()})
+            pipe.expire(lru_key, self.ttl_days * 86400)
+            pipe.execute()
+        return translated
+
+    def get_cached_summary(self, fid: str, lang: str) -> Tuple[Optional[str], Optional[str]]:
+        """(요약, 요약의 lang 번역) 을 조회 — 요약이 없으면 (None, None)
+
+        메타데이터 GET 으로 날짜를 확인한 뒤 스크립트 1회로 요약·번역을 읽는다 (왕복 2회).
+        메타데이터가 있는 요약만 찾는다 (메타데이터 없는 옛 데이터는 get_pdf 경로가 처리).
+        """
+        metadata_key = self._get_metadata_key(fid)
+        metadata = self.r.get(metadata_key)
+        if not metadata:
+            return None, None
+        res = self._cached_summary(
+            keys=[
+                f"pdf:summaries:{json.loads(metadata)['date']}",
+                metadata_key,
+                self._get_translation_key(fid),
+                self._get_translation_lru_key(fid),
+            ],
+            args=[fid, lang.strip().lower(), self.ttl_days * 86400, time.time()],
+        )
+        if not res:
+            return None, None
+        return res[0], res[1]
+
+    def set_translation(self, fid: str, content: str, lang: str, translated: str):
+        """번역 결과 저장 (원본 요약과 같은 TTL), TRANSLATION_MAX_PER_DOC 초과분은 오래 안 쓴 것부터 제거"""
+        key, lru_key = self._get_translation_key(fid), self._get_translation_lru_key(fid)
+        field = self._get_translation_field(content, lang)
+        pipe = self.r.pipeline()
+        pipe.hset(key, field, translated)
+        pipe.expire(key, self.ttl_days * 86400)
+        pipe.zadd(lru_key, {field: time.time()})
+        pipe.expire(lru_key, self.ttl_days * 86400)
+        pipe.zcard(lru_key)
+        size = pipe.execute()[-1]
+
+        if size > TRANSLATION_MAX_PER_DOC:
+            victims = [f for f, _ in self.r.zpopmin(lru_key, size - TRANSLATION_MAX_PER_DOC)]
+            if victims:
+                self.r.hdel(key, *victims)
+
+    # ------------------------------------------------------------------
+    # LLM 응답 캐시 (byte-identical prompt → 응답)
+    # ------------------------------------------------------------------
+    def get_llm_response(self, prompt_hash: str) -> Optional[str]:
+        return self._llm_cache_get(
+            keys=[self._get_llm_response_key(prompt_hash), LLM_CACHE_STATS_KEY]
+        )
+
+    def set_llm_response(self, prompt_hash: str, response: str):
+        """응답 저장 후 TTL 로 만료된 인덱스 항목과 LLM_CACHE_MAX 초과분(오래된 순)을 제거"""
+        now = time.time()
+        pipe = self.r.pipeline()
+        pipe.setex(self._get_llm_response_key(prompt_hash), LLM_CACHE_TTL_SEC, response)
+        pipe.zadd(LLM_CACHE_INDEX_KEY, {prompt_hash: now})
+        pipe.zremrangebyscore(LLM_CACHE_INDEX_KEY, "-inf", now - LLM_CACHE_TTL_SEC)  # 키는 이미 만료됨
+        pipe.hincrby(LLM_CACHE_STATS_KEY, "stored", 1)
+        pipe.zcard(LLM_CACHE_INDEX_KEY)
+        size = pipe.execute()[-1]
+
+        if size > LLM_CACHE_MAX:
+            victims = [h for h, _ in self.r.zpopmin(LLM_CACHE_INDEX_KEY, size - LLM_CACHE_MAX)]
+            if victims:
+                self.r.unlink(*[self._get_llm_response_key(h) for h in victims])
+
+    def get_llm_cache_statistics(self) -> Dict:
+        pipe = self.r.pipeline()
+        pipe.hgetall(LLM_CACHE_STATS_KEY)
+        pipe.zcard(LLM_CACHE_INDEX_KEY)
+        stats, entries = pipe.execute()
+        hits, misses = int(stats.get("hits", 0)), int(stats.get("misses", 0))
+        lookups = hits + misses
+        return {
+            "entries": entries,
+            "max_entries": LLM_CACHE_MAX,
+            "ttl_sec": LLM_CACHE_TTL_SEC,
+            "hits": hits,
+            "misses": misses,
+            "stored": int(stats.get("stored", 0)),
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+        }
+
+    def clear_llm_responses(self) -> int:
+        """LLM 응답 캐시·통계 전체 삭제, 삭제한 응답 수 반환"""
+        deleted = 0
+        while True:
+            hashes = self.r.zrange(LLM_CACHE_INDEX_KEY, 0, CACHE_BULK_BATCH - 1)
+            if not hashes:
+                break
+            pipe = self.r.pipeline()
+            pipe.unlink(*[self._get_llm_response_key(h) for h in hashes])
+            pipe.zrem(LLM_CACHE_INDEX_KEY, *hashes)
+            deleted += pipe.execute()[0]
+        self.r.delete(LLM_CACHE_STATS_KEY)
+        return deleted
+
+    # ------------------------------------------------------------------
+    # 프로파일 결과 (관리자 전용 API 에서 사용)
+    # ------------------------------------------------------------------
+    def set_profile(self, profile_id: str, stacks: str, meta: Dict):
+        key = self._get_profile_key(profile_id)
+        pipe = self.r.pipeline()
+        pipe.hset(key, mapping={"meta": json.dumps(meta, ensure_ascii=False), "stacks": stacks})
+        pipe.expire(key, PROFILE_TTL_SEC)
+        pipe.zadd(PROFILE_INDEX_KEY, {profile_id: time.time()})
+        pipe.zremrangebyscore(PROFILE_INDEX_KEY, "-inf", time.time() - PROFILE_TTL_SEC)
+        pipe.execute()
+
+    def get_profile_stacks(self, profile_id: str) -> Optional[str]:
+        return self.r.hget(self._get_profile_key(profile_id), "stacks")
+
+    def list_profiles(self, limit: int = 50) -> List[Dict]:
+        """최근 프로파일 메타데이터 (최신순)"""
+        ids = self.r.zrevrange(PROFILE_INDEX_KEY, 0, limit - 1)
+        if not ids:
+            return []
+        pipe = self.r.pipeline()
+        for pid in ids:
+            pipe.hget(self._get_profile_key(pid), "meta")
+        return [
+            {"profile_id": pid, **json.loads(meta)}
+            for pid, meta in zip(ids, pipe.execute())
+            if meta
+        ]
+
+    # ------------------------------------------------------------------
+    # 대량 사전 적재 리포트
+    # ------------------------------------------------------------------
+    def set_ingest_report(self, batch_id: str, report: Dict):
+        report["updated_at"] = time.time()  # 진행 중 배치의 heartbeat
+        pipe = self.r.pipeline()
+        pipe.set(self._get_ingest_key(batch_id), json.dumps(report, ensure_ascii=False), ex=INGEST_TTL_SEC)
+        pipe.zadd(INGEST_INDEX_KEY, {batch_id: report.get("started_at", time.time())})
+        pipe.zremrangebyscore(INGEST_INDEX_KEY, "-inf", time.time() - INGEST_TTL_SEC)
+        pipe.execute()
+
+    def get_ingest_report(self, batch_id: str) -> Optional[Dict]:
+        raw = self.r.get(self._get_ingest_key(batch_id))
+        return self._ingest_view(json.loads(raw)) if raw else None
+
+    def list_ingest_reports(self, limit: int = 50) -> List[Dict]:
+        """최근 배치 리포트 (최신순, 실패 목록 제외)"""
+        ids = self.r.zrevrange(INGEST_INDEX_KEY, 0, limit - 1)
+        if not ids:
+            return []
+        reports = self.r.mget([self._get_ingest_key(b) for b in ids])
+        return [
+            {k: v for k, v in self._ingest_view(json.loads(raw)).items() if k != "failures"}
+            for raw in reports
+            if raw
+        ]
+
+    @staticmethod
+    def _ingest_view(report: Dict) -> Dict:
+        """heartbeat 가 끊긴 running 배치(프로세스 재시작·장애)는 interrupted 로 표시"""
+        if report.get("status") == "running":
+            last = report.get("updated_at") or report.get("started_at") or 0
+            if time.time() - last > INGEST_STALE_SEC:
+                report["status"] = "interrupted"
+        return report
+
     # 기존 메서드는 비활성화 유지
     def get_chat(self, cid: str) -> Optional[str]:
         return None
@@ -187,29 +703,53 @@ class RedisCacheDB:
     def set_chat(self, cid, s: str):
         pass
 
+    def _get_deletion_log_key(self) -> str:
+        now = datetime.now(ZoneInfo("Asia/Seoul"))
+        return f"cache:deleted:{now.strftime('%Y-%m-%d')}"
+
     def _log_cache_deletion(self, file_id: str):
         now = datetime.now(ZoneInfo("Asia/Seoul"))
-        date_str = now.strftime('%Y-%m-%d')
-        date_key = f"cache:deleted:{date_str}"
+        date_key = self._get_deletion_log_key()
         entry = f"{file_id}|{now.isoformat()}"
         self.r.rpush(date_key, entry)
         print(f"[LOG] Deleted cache entry for {file_id} → {date_key} / {entry}")
 
     def delete_all_summaries(self) -> int:
+        """인덱스 기준 배치 삭제 후 남은 날짜 HSET·보조 key 정리"""
         deleted_count = 0
-        for key in self.r.scan_iter(match="pdf:summaries:*"):
-            file_ids = self.r.hkeys(key)
-            for fid in file_ids:
-                self._log_cache_deletion(fid)
-            
-            deleted_count += self.r.hlen(key)
-            self.r.delete(key)
+        while True:
+            fids = self.r.zrange(FILE_INDEX_KEY, 0, CACHE_BULK_BATCH - 1)
+            if not fids:
+                break
+            deleted_count += self.delete_pdfs(fids)
+
+        # 인덱스 도입 이전 데이터 등 잔여 key 정리 (SCAN 페이지 단위로 파이프라인 삭제)
+        # LLM 응답 캐시(llm:resp:*)는 요약과 별개 — clear_llm_responses 로만 지운다
+        for pattern in (
+            "pdf:summaries:*", "pdf:metadata:*", "pdf:translations:*", "pdf:translation_lru:*", "pdf:stats:*",
+            "pdf:summary_tree:*",
+        ):
+            swept = 0
+            batch = []
+            for key in self.r.scan_iter(match=pattern, count=CACHE_BULK_BATCH):
+                batch.append(key)
+                if len(batch) >= CACHE_BULK_BATCH:
+                    swept += self.r.unlink(*batch)
+                    batch = []
+            if batch:
+                swept += self.r.unlink(*batch)
+            if swept:
+                print(f"[LOG] delete_all_summaries sweep: {pattern} → {swept} keys removed")
 
-        for key in self.r.scan_iter(match="pdf:metadata:*"):
-            self.r.delete(key)
-            
         return deleted_count
 
+def _decode_vector(entry: Dict) -> np.ndarray:
+    """답변 캐시 항목의 임베딩 (float32 base64, 이전 형식은 JSON float 목록)"""
+    if "vec" in entry:
+        return np.frombuffer(base64.b64decode(entry["vec"]), dtype=np.float32)
+    return np.asarray(entry["embedding"], dtype=np.float32)
+
+
 @lru_cache(maxsize=1)
 def get_cache_db() -> "RedisCacheDB":
     return RedisCacheDB()
@@ -2,6 +2,7 @@
 from fastapi import APIRouter, Depends
 from datetime import datetime, timedelta
 from app.cache.cache_db import get_cache_db
+from app.model.cache_dto import BulkDeleteRequestDTO
 from fastapi import Query
 import json
 
@@ -12,6 +13,21 @@ async def get_cache_statistics(cache = Depends(get_cache_db)):
     """캐시 통계 정보 조회"""
     return cache.get_statistics()
 
+@router.post("/statistics/rebuild")
+async def rebuild_cache_statistics(cache = Depends(get_cache_db)):
+    """통계 카운터를 전체 스캔으로 재구성 (카운터 도입 이전 데이터 보정용)"""
+    return cache.rebuild_statistics()
+
+@router.get("/llm-responses/statistics")
+async def get_llm_cache_statistics(cache = Depends(get_cache_db)):
+    """LLM 응답 캐시 적중률 (hits = 절약된 vLLM 호출 수)"""
+    return cache.get_llm_cache_statistics()
+
+@router.delete("/llm-responses")
+async def clear_llm_responses(cache = Depends(get_cache_db)):
+    """LLM 응답 캐시 전체 삭제 (프롬프트·모델 변경 후 사용)"""
+    return {"deleted": cache.clear_llm_responses()}
+
 @router.get("/summaries/{date}")
 async def get_summaries_by_date(
     date: str,
@@ -47,6 +63,37 @@ async def delete_specific_summary(
         "deleted": success
     }
 
+@router.post("/bulk-delete")
+async def bulk_delete_summaries(
+    req: BulkDeleteRequestDTO,
+    cache = Depends(get_cache_db)
+):
+    """file_id 목록 일괄 삭제 (배치 파이프라인)"""
+    deleted = cache.delete_pdfs(req.file_ids)
+    return {
+        "requested": len(req.file_ids),
+        "deleted_count": deleted
+    }
+
+@router.delete("/range")
+async def delete_summaries_by_range(
+    start: str = Query(..., description="YYYY-MM-DD 시작일"),
+    end: str = Query(..., description="YYYY-MM-DD 종료일 (포함)"),
+    cache = Depends(get_cache_db)
+):
+    """저장일 기준 기간 내 요약본 일괄 삭제"""
+    try:
+        start_dt = datetime.strptime(start, "%Y-%m-%d")
+        end_dt = datetime.strptime(end, "%Y-%m-%d")
+    except ValueError:
+        return {"error": "Invalid date format. Use YYYY-MM-DD"}
+    deleted = cache.delete_by_date_range(start_dt, end_dt)
+    return {
+        "start": start,
+        "end": end,
+        "deleted_count": deleted
+    }
+
 @router.get("/deletion-log")
 async def get_cache_deletion_log(
     date: str = Query(..., description="YYYY-MM-DD 형식의 날짜"),
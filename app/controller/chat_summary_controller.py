@@ -1,4 +1,5 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException
+from app.domain.interfaces import LlmOverloadedError
 from app.model.chat_summary_dto import ChatSummaryRequestDTO
 from app.service.chat_summary_service import ChatSummaryService
 
@@ -11,6 +12,10 @@ async def summarize_chat(req: ChatSummaryRequestDTO):
         f"[{chat.timestamp.strftime('%Y-%m-%d %H:%M:%S')}] {chat.sender}: {chat.plaintext}"
         for chat in sorted_chats
     ]
-    summary = ChatSummaryService().generate(messages)
+    try:
+        summary = await ChatSummaryService().generate(messages)
+    except LlmOverloadedError as e:
+        raise HTTPException(
+            status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)}
+        )
     return {"summary": summary}
-
@@ -0,0 +1,45 @@
+# app/controller/ingest_controller.py
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from app.cache.cache_db import get_cache_db
+from app.model.ingest_dto import BulkIngestRequestDTO
+from app.service.ingest_service import IngestService, get_ingest_service
+from app.utils.admin_auth import require_admin
+
+router = APIRouter(prefix="/api/ingest", tags=["ingest"])
+
+
+@router.post(
+    "",
+    status_code=202,
+    summary="문서 대량 사전 적재 (벡터 + 요약 캐시)",
+    dependencies=[Depends(require_admin)],
+)
+async def bulk_ingest(
+    req: BulkIngestRequestDTO,
+    service: IngestService = Depends(get_ingest_service),
+):
+    """
+    • items : [{file_id, pdf_url}, ...] — 다운로드/OCR → 임베딩 → 요약을 백그라운드로 수행  
+    • langs : 요약 번역까지 캐시할 언어 목록 (선택)
+
+    즉시 `batch_id` 와 초기 리포트를 반환한다. 진행 상황은 `GET /api/ingest/{batch_id}`.
+    관리자 전용 (`X-Admin-Token`).
+    """
+    try:
+        return service.start([(i.file_id, str(i.pdf_url)) for i in req.items], req.langs)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("", summary="최근 사전 적재 배치 목록")
+async def list_ingests(limit: int = Query(20, ge=1, le=200)):
+    return {"batches": get_cache_db().list_ingest_reports(limit)}
+
+
+@router.get("/{batch_id}", summary="사전 적재 진행 상황·처리량 리포트")
+async def get_ingest(batch_id: str):
+    report = get_cache_db().get_ingest_report(batch_id)
+    if report is None:
+        raise HTTPException(status_code=404, detail="batch not found")
+    return report
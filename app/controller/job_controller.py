@@ -0,0 +1,51 @@
+# app/controller/job_controller.py
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import JSONResponse
+
+from app.infra.job_queue import get_job_queue
+from app.model.job_dto import JobRequestDTO
+
+router = APIRouter(prefix="/api/jobs", tags=["jobs"])
+
+# 상태 조회에 노출하는 작업 필드 (결과 본문 제외)
+_STATUS_FIELDS = (
+    "job_id", "status", "file_id", "lang", "attempts",
+    "created_at", "started_at", "finished_at", "error", "webhook_status", "webhook_error",
+)
+
+
+@router.post("", status_code=202, summary="PDF 요약 작업 제출 (비동기)")
+async def submit_job(req: JobRequestDTO):
+    """
+    `/api/summary` 와 같은 입력 + 선택적 `webhook_url`. 즉시 `job_id` 를 반환한다.
+
+    같은 (file_id, query, lang) 작업이 대기·실행 중이거나 완료돼 있으면
+    새 작업을 만들지 않고 그 `job_id` 를 돌려준다 (`created: false`).
+    """
+    job_id, created = await get_job_queue().submit(
+        file_id=req.file_id,
+        pdf_url=str(req.pdf_url),
+        query=req.query,
+        lang=req.lang,
+        webhook_url=str(req.webhook_url) if req.webhook_url else None,
+    )
+    return {"job_id": job_id, "created": created}
+
+
+@router.get("/{job_id}", summary="작업 상태 조회")
+async def get_job_status(job_id: str):
+    job = await get_job_queue().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="job not found")
+    return {k: job[k] for k in _STATUS_FIELDS if k in job}
+
+
+@router.get("/{job_id}/result", summary="작업 결과 조회")
+async def get_job_result(job_id: str):
+    """완료(`done`/`failed`)면 `/api/summary` 와 같은 본문, 아직이면 202 + 상태"""
+    job = await get_job_queue().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="job not found")
+    if job["status"] not in ("done", "failed"):
+        return JSONResponse(status_code=202, content={"job_id": job_id, "status": job["status"]})
+    return {"job_id": job_id, "status": job["status"], **(job.get("result") or {})}
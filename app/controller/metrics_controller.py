@@ -0,0 +1,9 @@
+from fastapi import APIRouter, Response
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+
+router = APIRouter(tags=["metrics"])
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus scrape endpoint (노드·의존성 지연, 캐시 적중, OCR 페이지, 토큰, in-flight)"""
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
@@ -1,6 +1,15 @@
 # app/controller/pdf_summary_controller.py
-from fastapi import APIRouter, Depends, HTTPException
+import uuid
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from app.cache.cache_db import get_cache_db
 from app.model.summary_dto import SummaryRequestDTO
+from app.utils.admin_auth import require_admin
+from app.utils.disconnect import cancel_on_disconnect
+from app.utils.profiler import PROFILE_INTERVAL_SEC, ProfilerBusyError, profiling
 
 # 새로 만든 LangGraph 서비스 래퍼
 from app.service.summary_service_graph import (
@@ -13,22 +22,99 @@ router = APIRouter(prefix="/api")  # 필요에 따라 prefix 조정
 @router.post("/summary", summary="PDF 요약 생성")
 async def summarize_pdf(
     req: SummaryRequestDTO,
+    request: Request,
+    trace: bool = Query(False, description="응답에 span 워터폴 포함 (?trace=1)"),
+    profile: bool = Query(False, description="관리자 전용: 샘플링 프로파일러로 실행 (?profile=1)"),
+    x_admin_token: Optional[str] = Header(None),
     service: SummaryServiceGraph = Depends(get_summary_service_graph),
 ):
     """
     • file_id : 문서 고유 식별자  
     • pdf_url : PDF 위치(URL)  
     • query   : 사용자가 알고 싶은 질문/키워드
+    • ?trace=1 : 노드·재시도·의존성 호출별 소요 시간(워터폴) 포함
+    • ?profile=1 (X-Admin-Token 필요) : 실행 중 스택 샘플링 → `profile_id` 반환,
+      결과는 `GET /system/profiles/{profile_id}` (collapsed stacks)
+
+    클라이언트가 응답 전에 연결을 끊으면 실행을 취소한다
+    (같은 질의를 기다리는 다른 요청이 있으면 실행은 계속된다).
     """
     try:
-        result = await service.generate(
-            file_id=req.file_id,
-            pdf_url=str(req.pdf_url),
-            query=req.query,
-            lang=req.lang,
-        )
+        if profile:
+            require_admin(x_admin_token)
+            result = await _generate_profiled(service, req, trace, request)
+        else:
+            result = await cancel_on_disconnect(request, service.generate(
+                file_id=req.file_id,
+                pdf_url=str(req.pdf_url),
+                query=req.query,
+                lang=req.lang,
+                trace=trace,
+            ))
     except ValueError as e:
         # Service 층에서 검증 실패 시 400 에러로 매핑
         raise HTTPException(status_code=400, detail=str(e))
 
+    if result.get("retry_after") is not None:
+        # LLM 스케줄러가 admission 거절 → 503 + Retry-After
+        raise HTTPException(
+            status_code=503,
+            detail=result.get("error"),
+            headers={"Retry-After": str(result["retry_after"])},
+        )
     return result  # {file_id, summary, cached} 형식
+
+
+async def _generate_profiled(
+    service: SummaryServiceGraph, req: SummaryRequestDTO, trace: bool, request: Request
+):
+    """요청 1건을 샘플링 프로파일러 아래에서 실행하고 결과를 Redis 에 저장
+    (연결 종료 시 취소·과부하 503 은 일반 경로와 동일하게 호출 측에서 처리)"""
+    profile_id = f"{datetime.now():%Y%m%d-%H%M%S}-{uuid.uuid4().hex[:6]}"
+    try:
+        with profiling() as prof:
+            result = await cancel_on_disconnect(request, service.generate(
+                file_id=req.file_id,
+                pdf_url=str(req.pdf_url),
+                query=req.query,
+                lang=req.lang,
+                trace=trace,
+            ))
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+    get_cache_db().set_profile(profile_id, prof.collapsed(), {
+        "file_id": req.file_id,
+        "query": req.query,
+        "lang": req.lang,
+        "created_at": datetime.now().isoformat(),
+        "elapsed_sec": round(prof.elapsed, 3),
+        "ticks": prof.ticks,
+        "interval_sec": PROFILE_INTERVAL_SEC,
+    })
+    result["profile_id"] = profile_id
+    return result
+
+
+@router.post("/summary/stream", summary="PDF 요약 생성 (SSE 스트리밍)")
+async def summarize_pdf_stream(
+    req: SummaryRequestDTO,
+    trace: bool = Query(False, description="result 이벤트에 span 워터폴 포함"),
+    service: SummaryServiceGraph = Depends(get_summary_service_graph),
+):
+    """
+    `/summary` 와 같은 입력, 응답은 `text/event-stream`.
+
+    start → node(진행 상황) → token(generate/translate 출력 조각) → result
+    """
+    return StreamingResponse(
+        service.stream(
+            file_id=req.file_id,
+            pdf_url=str(req.pdf_url),
+            query=req.query,
+            lang=req.lang,
+            trace=trace,
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
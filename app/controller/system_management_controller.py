@@ -1,7 +1,11 @@
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import PlainTextResponse
 from app.cache.cache_db import get_cache_db
 from app.vectordb.vector_db import get_vector_db
+from app.infra.llm_scheduler import LlmScheduler, get_llm_scheduler
+from app.utils.resilience import breaker_stats
+from app.utils.admin_auth import require_admin
 
 router = APIRouter(prefix="/system", tags=["system-management"])
 
@@ -21,3 +25,33 @@ async def delete_all_data(
         "deleted_vectors": deleted_vectors,
         "deleted_cache_entries": deleted_cache_count
     }
+
+
+@router.get("/llm-scheduler")
+async def llm_scheduler_stats(scheduler: LlmScheduler = Depends(get_llm_scheduler)):
+    """LLM 스케줄러 상태 (in-flight / 클래스별 대기 수 / 평균·최대 대기 시간 / 거절 수)"""
+    return scheduler.stats()
+
+
+@router.get("/breakers")
+async def circuit_breakers():
+    """의존성별 서킷 브레이커 상태 (closed / open / half_open)"""
+    return breaker_stats()
+
+
+@router.get("/profiles", dependencies=[Depends(require_admin)])
+async def list_profiles(cache = Depends(get_cache_db)):
+    """저장된 요청 프로파일 목록 (관리자 전용)"""
+    return cache.list_profiles()
+
+
+@router.get("/profiles/{profile_id}", dependencies=[Depends(require_admin)])
+async def get_profile(profile_id: str, cache = Depends(get_cache_db)):
+    """collapsed-stack 텍스트 (flamegraph.pl / speedscope 입력, 관리자 전용)"""
+    stacks = cache.get_profile_stacks(profile_id)
+    if stacks is None:
+        raise HTTPException(status_code=404, detail="profile not found")
+    return PlainTextResponse(
+        stacks,
+        headers={"Content-Disposition": f'attachment; filename="{profile_id}.collapsed"'},
+    )
@@ -1,9 +1,22 @@
 # app/domain/interfaces.py
 from abc import ABC, abstractmethod
-from typing import List, Optional, Protocol
+from typing import Dict, List, Optional, Protocol, Tuple
 
 TextChunk = str
 
+# LLM 호출 우선순위 (작을수록 먼저 처리)
+PRIORITY_INTERACTIVE = 0  # 사용자 Q&A / 채팅 요약
+PRIORITY_TRANSLATE   = 1  # 답변 번역
+PRIORITY_BULK        = 2  # 문서 map-reduce 요약
+
+
+class LlmOverloadedError(RuntimeError):
+    """LLM 대기열이 가득 차 호출을 받지 않음 — ``retry_after`` 초 후 재시도"""
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"LLM is overloaded, retry after {retry_after}s")
+        self.retry_after = retry_after
+
 
 class PdfLoaderIF(Protocol):
     @abstractmethod
@@ -20,18 +33,31 @@ class VectorStoreIF(Protocol):
     @abstractmethod
     async def similarity_search(self, doc_id: str, query: str, k: int = 5) -> List[TextChunk]: ...
     
+    @abstractmethod
+    async def similarity_search_with_scores(
+        self, doc_id: str, query: str, k: int = 5
+    ) -> List[Tuple[TextChunk, float]]: ... # (청크, 0~1 관련도)
+
     @abstractmethod
     async def get_all(self, doc_id: str) -> List[TextChunk]: ... #문서 전체 갖고오기
 
+    @abstractmethod
+    async def get_all_with_embeddings(
+        self, doc_id: str
+    ) -> Tuple[List[TextChunk], List[List[float]]]: ... # 문서 전체 + 임베딩
+
     @abstractmethod
     async def has_chunks(self, doc_id: str) -> bool: ...
 
+    @abstractmethod
+    async def embed_query(self, query: str) -> List[float]: ... # 질의 임베딩
+
 class LlmChainIF(Protocol):
     @abstractmethod
-    async def execute(self, prompt: str) -> str: ...
+    async def execute(self, prompt: str, priority: int = PRIORITY_INTERACTIVE) -> str: ...
 
     @abstractmethod
-    async def summarize(self, docs: List[TextChunk]) -> str: ...
+    async def summarize(self, docs: List[TextChunk], doc_id: Optional[str] = None) -> str: ... # doc_id 가 있으면 요약 트리 재사용
 
 class CacheIF(Protocol):
     """요약 결과 캐싱을 위한 최소 계약(Port)"""
@@ -45,3 +71,48 @@ class CacheIF(Protocol):
     @abstractmethod
     def exists_summary(self, key: str) -> bool: ...
 
+    @abstractmethod
+    def get_answer(self, key: str, embedding: List[float]) -> Optional[str]: ...
+
+    @abstractmethod
+    def set_answer(self, key: str, query: str, embedding: List[float], answer: str) -> None: ...
+
+    @abstractmethod
+    def get_abstract(self, key: str) -> Optional[str]: ...
+
+    @abstractmethod
+    def set_abstract(self, key: str, abstract: str) -> None: ...
+
+    @abstractmethod
+    def get_summary_nodes(self, key: str, node_keys: List[str]) -> List[Optional[str]]: ...
+
+    @abstractmethod
+    def set_summary_nodes(self, key: str, nodes: Dict[str, str]) -> None: ...
+
+    @abstractmethod
+    def get_translation(self, key: str, content: str, lang: str) -> Optional[str]: ...
+
+    @abstractmethod
+    def set_translation(self, key: str, content: str, lang: str, translated: str) -> None: ...
+
+    @abstractmethod
+    def get_cached_summary(self, key: str, lang: str) -> Tuple[Optional[str], Optional[str]]: ... # (요약, 그 번역) 한 번에
+
+    @abstractmethod
+    def get_llm_response(self, prompt_hash: str) -> Optional[str]: ...
+
+    @abstractmethod
+    def set_llm_response(self, prompt_hash: str, response: str) -> None: ...
+
+
+class LeaseIF(Protocol):
+    """여러 레플리카 간 문서 단위 작업 중복을 막는 분산 lease"""
+
+    @abstractmethod
+    async def acquire(self, name: str) -> Optional[str]: ... # 성공 시 토큰
+
+    @abstractmethod
+    async def release(self, name: str, token: str) -> bool: ...
+
+    @abstractmethod
+    async def wait(self, name: str) -> bool: ... # 해제/만료 시 True
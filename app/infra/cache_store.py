@@ -1,7 +1,8 @@
 # app/infra/cache_store.py
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 from app.domain.interfaces import CacheIF
 from app.cache.cache_db import get_cache_db  # RedisCacheDB 싱글턴 반환
+from app.utils.resilience import guarded
 
 
 class CacheStore(CacheIF):
@@ -15,17 +16,64 @@ class CacheStore(CacheIF):
     def __init__(self):
         self.cache = get_cache_db()   # RedisCacheDB 인스턴스
 
-    # ---- CacheIF 구현 ----
+    # ---- CacheIF 구현 (Redis 연속 실패 시 ``redis`` 브레이커가 열려 즉시 CircuitOpenError) ----
+    @guarded("redis")
     def get_summary(self, key: str) -> Optional[str]:
         return self.cache.get_pdf(key)
 
+    @guarded("redis")
     def set_summary(self, key: str, summary: str) -> None:
         # RedisCacheDB.set_pdf 가 ttl 파라미터를 받아들인다면 전달,
         # 아니라면 기본 TTL 로 저장
         self.cache.set_pdf(key, summary)
 
+    @guarded("redis")
     def exists_summary(self, key: str) -> bool:
         return self.cache.exists_pdf(key)
+
+    @guarded("redis")
+    def get_answer(self, key: str, embedding: List[float]) -> Optional[str]:
+        return self.cache.get_answer(key, embedding)
+
+    @guarded("redis")
+    def set_answer(self, key: str, query: str, embedding: List[float], answer: str) -> None:
+        self.cache.set_answer(key, query, embedding, answer)
+
+    @guarded("redis")
+    def get_abstract(self, key: str) -> Optional[str]:
+        return self.cache.get_abstract(key)
+
+    @guarded("redis")
+    def set_abstract(self, key: str, abstract: str) -> None:
+        self.cache.set_abstract(key, abstract)
+
+    @guarded("redis")
+    def get_summary_nodes(self, key: str, node_keys: List[str]) -> List[Optional[str]]:
+        return self.cache.get_summary_nodes(key, node_keys)
+
+    @guarded("redis")
+    def set_summary_nodes(self, key: str, nodes: Dict[str, str]) -> None:
+        self.cache.set_summary_nodes(key, nodes)
+
+    @guarded("redis")
+    def get_translation(self, key: str, content: str, lang: str) -> Optional[str]:
+        return self.cache.get_translation(key, content, lang)
+
+    @guarded("redis")
+    def set_translation(self, key: str, content: str, lang: str, translated: str) -> None:
+        self.cache.set_translation(key, content, lang, translated)
+
+    @guarded("redis")
+    def get_cached_summary(self, key: str, lang: str) -> Tuple[Optional[str], Optional[str]]:
+        return self.cache.get_cached_summary(key, lang)
+
+    @guarded("redis")
+    def get_llm_response(self, prompt_hash: str) -> Optional[str]:
+        return self.cache.get_llm_response(prompt_hash)
+
+    @guarded("redis")
+    def set_llm_response(self, prompt_hash: str, response: str) -> None:
+        self.cache.set_llm_response(prompt_hash, response)
 # -------------------------------
 # ✅ FastAPI Depends용 provider
 # -------------------------------
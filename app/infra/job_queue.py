@@ -0,0 +1,222 @@
+# app/infra/job_queue.py
+"""Redis 기반 비동기 요약 작업 큐.
+
+* ``job:{id}``        HASH – 상태(queued / running / done / failed), 요청, 결과(JSON), 시각
+* ``job:key:{sha1}``  (file_id, query, lang) → job_id 멱등 키. 같은 요청의 재제출은
+  실패하지 않은 기존 작업에 붙는다.
+* ``job:queue``       LIST – 대기 중인 job_id (LPUSH → BLMOVE RIGHT)
+* ``job:processing``  LIST – 워커가 가져간 job_id. 워커는 ``job:lease:{id}`` 를
+  주기적으로 갱신하며, lease 가 사라진 작업(워커/레플리카 장애)은 :meth:`JobQueue.reap`
+  이 대기열로 되돌린다.
+
+모든 키는 ``JOB_TTL_SEC`` 후 만료된다.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+import uuid
+from typing import List, Optional, Tuple
+
+import redis.asyncio as aioredis
+
+from app.utils.resilience import guarded
+
+JOB_TTL_SEC   = int(os.getenv("JOB_TTL_SEC", "86400"))   # 작업·결과 보관 기간
+JOB_LEASE_SEC = int(os.getenv("JOB_LEASE_SEC", "60"))    # 워커 heartbeat 만료
+
+QUEUE_KEY      = "job:queue"
+PROCESSING_KEY = "job:processing"
+
+# 멱등 제출: 살아 있는(실패하지 않은) 기존 작업이 있으면 그 id, 없으면 새로 등록
+# 기존 작업 해시는 클라이언트가 멱등 키를 먼저 읽어 KEYS[4] 로 넘긴다. 그 사이 멱등 키가
+# 바뀌었으면 {현재 id, -1} 을 돌려주고 클라이언트가 다시 시도한다.
+# KEYS[1]=멱등 키 KEYS[2]=새 job 해시 KEYS[3]=대기열 KEYS[4]=기존 job 해시
+# ARGV[1]=job_id ARGV[2]=TTL ARGV[3]=읽어 둔 기존 id('' = 없음) ARGV[4..]=필드
+_SUBMIT_LUA = """
+local existing = redis.call('GET', KEYS[1])
+if (existing or '') ~= ARGV[3] then
+    return {existing or '', -1}
+end
+if existing then
+    local status = redis.call('HGET', KEYS[4], 'status')
+    if status and status ~= 'failed' then
+        return {existing, 0}
+    end
+end
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+redis.call('HSET', KEYS[2], unpack(ARGV, 4))
+redis.call('EXPIRE', KEYS[2], ARGV[2])
+redis.call('LPUSH', KEYS[3], ARGV[1])
+return {ARGV[1], 1}
+"""
+
+# lease 없는 processing 항목을 대기열로 되돌림 (LREM 으로 한 레플리카만 성공)
+# KEYS[1]=lease KEYS[2]=processing KEYS[3]=queue KEYS[4]=job 해시 / ARGV[1]=job_id
+_REQUEUE_LUA = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return 0
+end
+if redis.call('LREM', KEYS[2], 1, ARGV[1]) == 0 then
+    return 0
+end
+if redis.call('EXISTS', KEYS[4]) == 1 then
+    redis.call('HSET', KEYS[4], 'status', 'queued')
+    redis.call('RPUSH', KEYS[3], ARGV[1])
+end
+return 1
+"""
+
+
+def job_key(file_id: str, query: str, lang: str) -> str:
+    """(file_id, query, lang) 멱등 키 — single-flight 와 같은 정규화"""
+    raw = f"{file_id}\0{query.strip()}\0{lang.strip().lower()}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+class JobQueue:
+    def __init__(
+        self,
+        host: str = os.getenv("REDIS_HOST", "localhost"),
+        port: int = int(os.getenv("REDIS_PORT", "6379")),
+        db: int = int(os.getenv("REDIS_DB", "0")),
+        ttl_sec: int = JOB_TTL_SEC,
+    ):
+        self.r = aioredis.Redis(host=host, port=port, db=db, decode_responses=True)
+        self.ttl_sec = ttl_sec
+        self._submit = self.r.register_script(_SUBMIT_LUA)
+        self._requeue = self.r.register_script(_REQUEUE_LUA)
+
+    # ---- key helpers ----
+    def _job(self, job_id: str) -> str:
+        return f"job:{job_id}"
+
+    def _lease(self, job_id: str) -> str:
+        return f"job:lease:{job_id}"
+
+    # ---- producer ----
+    @guarded("redis")
+    async def submit(
+        self, file_id: str, pdf_url: str, query: str, lang: str, webhook_url: Optional[str] = None
+    ) -> Tuple[str, bool]:
+        """Enqueue a job; returns ``(job_id, created)``.
+
+        ``created`` is False when an identical job is already queued, running or done.
+        """
+        job_id = uuid.uuid4().hex
+        fields = {
+            "status": "queued",
+            "file_id": file_id,
+            "pdf_url": pdf_url,
+            "query": query,
+            "lang": lang,
+            "webhook_url": webhook_url or "",
+            "attempts": 0,
+            "created_at": time.time(),
+        }
+        idem = f"job:key:{job_key(file_id, query, lang)}"
+        pairs: List = []
+        for k, v in fields.items():
+            pairs += [k, v]
+        existing = await self.r.get(idem) or ""
+        while True:
+            found, created = await self._submit(
+                keys=[idem, self._job(job_id), QUEUE_KEY, self._job(existing or job_id)],
+                args=[job_id, self.ttl_sec, existing, *pairs],
+            )
+            if int(created) >= 0:
+                return found, bool(int(created))
+            existing = found  # 동시 제출로 멱등 키가 바뀜 → 새 값으로 다시 확인
+
+    @guarded("redis")
+    async def get(self, job_id: str) -> Optional[dict]:
+        data = await self.r.hgetall(self._job(job_id))
+        if not data:
+            return None
+        data["job_id"] = job_id
+        if data.get("result"):
+            data["result"] = json.loads(data["result"])
+        return data
+
+    # ---- consumer ----
+    async def claim(self, timeout: float = 5) -> Optional[str]:
+        """Block until a job is available; move it to the processing list and take its lease."""
+        job_id = await self.r.blmove(QUEUE_KEY, PROCESSING_KEY, timeout, "RIGHT", "LEFT")
+        if job_id is None:
+            return None
+        pipe = self.r.pipeline()
+        pipe.set(self._lease(job_id), "1", ex=JOB_LEASE_SEC)
+        pipe.hset(self._job(job_id), mapping={"status": "running", "started_at": time.time()})
+        pipe.hincrby(self._job(job_id), "attempts", 1)
+        await pipe.execute()
+        return job_id
+
+    async def heartbeat(self, job_id: str) -> None:
+        await self.r.set(self._lease(job_id), "1", ex=JOB_LEASE_SEC)
+
+    async def finish(self, job_id: str, status: str, result: Optional[dict] = None, error: str = "") -> None:
+        """Record the outcome (``done`` / ``failed``) and drop the job from the processing list."""
+        fields = {"status": status, "finished_at": time.time()}
+        if result is not None:
+            fields["result"] = json.dumps(result, ensure_ascii=False)
+        if error:
+            fields["error"] = error
+        pipe = self.r.pipeline()
+        pipe.hset(self._job(job_id), mapping=fields)
+        pipe.expire(self._job(job_id), self.ttl_sec)
+        pipe.lrem(PROCESSING_KEY, 1, job_id)
+        pipe.delete(self._lease(job_id))
+        await pipe.execute()
+
+    async def retry(self, job_id: str, error: str) -> None:
+        """Put a job back at the head of the queue (e.g. LLM admission rejected it)."""
+        pipe = self.r.pipeline()
+        pipe.hset(self._job(job_id), mapping={"status": "queued", "error": error})
+        pipe.lrem(PROCESSING_KEY, 1, job_id)
+        pipe.rpush(QUEUE_KEY, job_id)
+        pipe.delete(self._lease(job_id))
+        await pipe.execute()
+
+    async def set_field(self, job_id: str, **fields) -> None:
+        await self.r.hset(self._job(job_id), mapping=fields)
+
+    async def reap(self, suspects: set) -> set:
+        """Requeue processing jobs whose lease is gone.
+
+        A job is only requeued when it had no lease on the previous scan too
+        (*suspects*), so a job claimed between BLMOVE and its lease SET is never
+        stolen. Returns the new suspect set for the next scan.
+        """
+        missing = set()
+        for job_id in await self.r.lrange(PROCESSING_KEY, 0, -1):
+            if await self.r.exists(self._lease(job_id)):
+                continue
+            if job_id not in suspects:
+                missing.add(job_id)
+                continue
+            if await self._requeue(
+                keys=[self._lease(job_id), PROCESSING_KEY, QUEUE_KEY, self._job(job_id)],
+                args=[job_id],
+            ):
+                print(f"[JobQueue] ♻️ requeued stale job {job_id}", flush=True)
+        return missing
+
+    async def stats(self) -> dict:
+        pipe = self.r.pipeline()
+        pipe.llen(QUEUE_KEY)
+        pipe.llen(PROCESSING_KEY)
+        queued, processing = await pipe.execute()
+        return {"queued": queued, "processing": processing}
+
+
+# ---- process-wide singleton ----
+_job_queue_singleton: Optional[JobQueue] = None
+
+
+def get_job_queue() -> JobQueue:
+    global _job_queue_singleton
+    if _job_queue_singleton is None:
+        _job_queue_singleton = JobQueue()
+    return _job_queue_singleton
@@ -0,0 +1,124 @@
+# app/infra/lease_store.py
+"""Redis 기반 분산 lease — 여러 API 레플리카가 같은 문서를 중복 처리하지 않도록 한다.
+
+* ``acquire(name)`` : ``SET NX EX`` 로 lease 획득, 성공 시 토큰 반환
+* ``release(name, token)`` : 토큰이 일치할 때만 삭제하고 완료 채널에 publish
+* ``wait(name)`` : 완료 채널을 구독하며 lease 가 해제/만료될 때까지 대기
+
+보유 중에는 ``LEASE_TTL_SEC / 3`` 마다 토큰을 확인하며 만료를 연장하므로 5분을 넘는
+OCR·map-reduce 도 lease 를 잃지 않는다. 보유자가 죽으면 연장이 멈추고
+``LEASE_TTL_SEC`` 후 lease 가 만료되어 다른 레플리카가 이어받는다.
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+import uuid
+from typing import Dict, Optional
+
+import redis.asyncio as aioredis
+
+from app.domain.interfaces import LeaseIF
+from app.utils.resilience import guarded
+
+LEASE_TTL_SEC  = int(os.getenv("LEASE_TTL_SEC", "300"))    # 보유자 장애 시 자동 만료
+LEASE_WAIT_SEC = int(os.getenv("LEASE_WAIT_SEC", "600"))   # 대기 측 최대 대기 시간
+
+# 토큰이 일치할 때만 만료 연장 (이미 잃은 lease 는 되살리지 않음)
+_EXTEND_LUA = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+# 토큰이 일치할 때만 해제 + 완료 알림
+_RELEASE_LUA = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    redis.call('DEL', KEYS[1])
+    redis.call('PUBLISH', KEYS[2], 'done')
+    return 1
+end
+return 0
+"""
+
+
+class LeaseStore(LeaseIF):
+    def __init__(
+        self,
+        host: str = os.getenv("REDIS_HOST", "localhost"),
+        port: int = int(os.getenv("REDIS_PORT", "6379")),
+        db: int = int(os.getenv("REDIS_DB", "0")),
+        ttl_sec: int = LEASE_TTL_SEC,
+    ):
+        self.r = aioredis.Redis(host=host, port=port, db=db, decode_responses=True)
+        self.ttl_sec = ttl_sec
+        self._release = self.r.register_script(_RELEASE_LUA)
+        self._extend = self.r.register_script(_EXTEND_LUA)
+        self._renewals: Dict[str, asyncio.Task] = {}  # token → 연장 태스크
+
+    # ---- key helpers ----
+    def _key(self, name: str) -> str:
+        return f"lease:{name}"
+
+    def _channel(self, name: str) -> str:
+        return f"lease:done:{name}"
+
+    # ---- LeaseIF 구현 ----
+    @guarded("redis")
+    async def acquire(self, name: str) -> Optional[str]:
+        token = uuid.uuid4().hex
+        ok = await self.r.set(self._key(name), token, nx=True, ex=self.ttl_sec)
+        if not ok:
+            return None
+        self._renewals[token] = asyncio.create_task(self._renew(name, token))
+        return token
+
+    async def release(self, name: str, token: str) -> bool:
+        # 연장은 Redis 호출 성공 여부와 무관하게 멈춘다 (브레이커 open 이어도 TTL 로 만료)
+        renewal = self._renewals.pop(token, None)
+        if renewal is not None:
+            renewal.cancel()
+        return await self._unlock(name, token)
+
+    @guarded("redis")
+    async def _unlock(self, name: str, token: str) -> bool:
+        return bool(await self._release(keys=[self._key(name), self._channel(name)], args=[token]))
+
+    async def extend(self, name: str, token: str) -> bool:
+        """Reset the TTL of a lease we still hold; False if it was lost."""
+        return bool(await self._extend(keys=[self._key(name)], args=[token, self.ttl_sec * 1000]))
+
+    async def _renew(self, name: str, token: str) -> None:
+        while True:
+            await asyncio.sleep(self.ttl_sec / 3)
+            try:
+                if not await self.extend(name, token):
+                    print(f"[LeaseStore] ⚠️ lease {name} lost", flush=True)
+                    self._renewals.pop(token, None)
+                    return
+            except Exception as e:  # noqa: BLE001 — 일시 오류는 다음 주기에 재시도
+                print(f"[LeaseStore] ⚠️ lease {name} extend failed: {e}", flush=True)
+
+    async def wait(self, name: str, timeout: float = LEASE_WAIT_SEC) -> bool:
+        """lease 가 해제(완료 알림) 또는 만료되면 True, timeout 이면 False."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        pubsub = self.r.pubsub()
+        await pubsub.subscribe(self._channel(name))
+        try:
+            while True:
+                # 구독 이후에 확인해야 해제 알림을 놓치지 않는다
+                pttl = await self.r.pttl(self._key(name))
+                if pttl == -2:   # key 없음 → 해제 또는 만료
+                    return True
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return False
+                step = min(remaining, pttl / 1000 if pttl > 0 else 1.0)
+                msg = await pubsub.get_message(ignore_subscribe_messages=True, timeout=step)
+                if msg:
+                    return True
+        finally:
+            await pubsub.unsubscribe(self._channel(name))
+            await pubsub.aclose()
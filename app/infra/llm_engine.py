@@ -4,62 +4,166 @@
 Implements the revised ``LlmChainIF``::
 
     class LlmChainIF(Protocol):
-        async def execute(self, prompt: str) -> str: ...
+        async def execute(self, prompt: str, priority: int = PRIORITY_INTERACTIVE) -> str: ...
         async def summarize(self, docs: List[TextChunk]) -> str: ...
 
-* **execute(prompt)** – takes a *fully‑formatted* prompt string and returns the
-  LLM's answer.
-* **summarize(docs)** – performs map‑reduce summarization (LangChain's
-  ``load_summarize_chain(chain_type="map_reduce")``) on the given text chunks.
+* **execute(prompt, priority)** – takes a *fully‑formatted* prompt string and
+  returns the LLM's answer.
+* **summarize(docs, doc_id)** – token‑budgeted map‑reduce summarization
+  (:class:`app.infra.map_reduce.MapReduceSummarizer`) over the given text
+  chunks, with at most ``MAP_CONCURRENCY`` map calls in flight. With a
+  ``doc_id`` the map/reduce nodes are persisted as a summary tree and reused.
+
+Byte-identical prompts are answered from an exact-match response cache in
+Redis (key: model, temperature, sha256 of the prompt) before they reach the
+scheduler (map/reduce calls are excluded — the summary tree already stores
+them). Only engines at or below ``LLM_CACHE_MAX_TEMPERATURE`` (default
+``0``) cache: in the service graph that is the ``temperature=0`` judge engine
+used for routing, answer verification, chunk grading and translation, while
+the default ``0.3`` engine (answers, refinement, summaries) never caches.
+
+Calls are guarded by the ``llm`` circuit breaker. With ``LLM_HEDGE=1``,
+interactive calls are hedged: a second request is sent when the first has
+not answered within the recent p95 latency, and the first answer wins.
+
+Every LLM call that misses the cache goes through the process-wide
+:class:`app.infra.llm_scheduler.LlmScheduler`; map/reduce calls run at
+``PRIORITY_BULK`` so interactive Q&A and translations overtake them.
 """
 
 from __future__ import annotations
 
-from typing import List
+import hashlib
+import os
+import time
+from typing import List, Optional
 
-from langchain_core.output_parsers import StrOutputParser
 from langchain_core.runnables import RunnablePassthrough
-from langchain.chains.summarize import load_summarize_chain
-from langchain.docstore.document import Document
 
-from app.utils.llm_factory import get_llm_instance
-from app.domain.interfaces import LlmChainIF, TextChunk
+from app.utils.llm_factory import LLM_CONTEXT_TOKENS, LLM_MAX_TOKENS, get_llm_instance
+from app.domain.interfaces import PRIORITY_BULK, PRIORITY_INTERACTIVE, CacheIF, LlmChainIF, TextChunk
+from app.infra.cache_store import CacheStore
+from app.infra.llm_scheduler import LlmScheduler, get_llm_scheduler
+from app.infra.map_reduce import MapReduceSummarizer, SummaryTreeStore
+from app.utils.metrics import count_cache, llm_tokens, observe_dependency
+from app.utils.resilience import LatencyTracker, get_breaker, hedged
+from app.utils.tracing import annotate, span
+
+MAP_CONCURRENCY = int(os.getenv("MAP_CONCURRENCY", "4"))
+LLM_RESPONSE_CACHE = os.getenv("LLM_RESPONSE_CACHE", "1") == "1"
+LLM_CACHE_MAX_TEMPERATURE = float(os.getenv("LLM_CACHE_MAX_TEMPERATURE", "0"))
+LLM_HEDGE = os.getenv("LLM_HEDGE", "0") == "1"
 
 
 class LlmEngine(LlmChainIF):
     """Concrete implementation of :class:`LlmChainIF`."""
 
-    def __init__(self, *, temperature: float = 0.3):
+    def __init__(
+        self,
+        *,
+        temperature: float = 0.3,
+        tree_store: Optional[SummaryTreeStore] = None,
+        scheduler: Optional[LlmScheduler] = None,
+        response_cache: Optional[CacheIF] = None,
+    ):
         # Shared LLM instance
         self.llm = get_llm_instance(temperature=temperature)
+        self.scheduler = scheduler if scheduler is not None else get_llm_scheduler()
+
+        cache = CacheStore()
+        # 샘플링 결과가 매번 달라지는 설정이면 응답 캐시를 쓰지 않는다
+        self._response_cache = (
+            (response_cache if response_cache is not None else cache)
+            if LLM_RESPONSE_CACHE and temperature <= LLM_CACHE_MAX_TEMPERATURE
+            else None
+        )
+        self._breaker = get_breaker("llm")
+        self._latency = LatencyTracker()
+        self._cache_prefix = f"{getattr(self.llm, 'model_name', '')}\x00{temperature}\x00"
 
-        # prompt(str) → llm → str  (for *execute*)
+        # prompt(str) → llm → AIMessage  (for *execute*; 토큰 사용량을 읽기 위해 메시지 그대로)
         self._qa_chain = (
             RunnablePassthrough()
             | self.llm
-            | StrOutputParser()
         )
 
-        # docs(list[str]) → map‑reduce → str (for *summarize*)
-        self._summ_chain = load_summarize_chain(
-            self.llm,
-            chain_type="map_reduce",
-            return_intermediate_steps=False,
+        # docs(list[str]) → packed map → hierarchical reduce → str (for *summarize*)
+        self._summarizer = MapReduceSummarizer(
+            self._complete,
+            self.count_tokens,
+            context_tokens=LLM_CONTEXT_TOKENS,
+            output_tokens=LLM_MAX_TOKENS,
+            map_concurrency=MAP_CONCURRENCY,
+            tree_store=tree_store if tree_store is not None else cache,
         )
 
     # ------------------------------------------------------------------
     # LlmChainIF implementation
     # ------------------------------------------------------------------
-    async def execute(self, prompt: str) -> str:  # noqa: D401
+    async def execute(self, prompt: str, priority: int = PRIORITY_INTERACTIVE) -> str:  # noqa: D401
         """LLM call with a fully‑formatted *prompt* string."""
-        return (await self._qa_chain.ainvoke(prompt)).strip()
+        return await self._complete(prompt, priority)
 
-    async def summarize(self, docs: List[TextChunk]) -> str:  # noqa: D401
+    async def summarize(self, docs: List[TextChunk], doc_id: Optional[str] = None) -> str:  # noqa: D401
         """High‑level summary using map‑reduce over *docs*."""
-        lc_docs = [Document(page_content=t) for t in docs]
-        # ``ainvoke`` returns the final summary string when
-        # ``return_intermediate_steps=False``.
-        result = await self._summ_chain.ainvoke({"input_documents": lc_docs})
-
-        return str(result["output_text"]).strip()
+        return await self._summarizer.summarize(docs, doc_id)
 
+    # ------------------------------------------------------------------
+    # helpers
+    # ------------------------------------------------------------------
+    async def _complete(self, prompt: str, priority: int = PRIORITY_BULK) -> str:
+        with span("llm.complete", priority=priority, prompt_chars=len(prompt)):
+            prompt_hash = None
+            # map/reduce 결과는 요약 트리에 이미 저장되므로 bulk 호출은 캐시하지 않는다
+            if self._response_cache is not None and priority < PRIORITY_BULK:
+                prompt_hash = hashlib.sha256((self._cache_prefix + prompt).encode("utf-8")).hexdigest()
+                try:
+                    cached = self._response_cache.get_llm_response(prompt_hash)
+                except Exception as exc:  # noqa: BLE001
+                    # 응답 캐시는 최적화일 뿐 — Redis 장애·서킷 open 은 캐시 miss 로 처리
+                    print(f"[LlmEngine] ⚠️ response cache lookup failed: {exc}", flush=True)
+                    cached = None
+                count_cache("llm_response", cached is not None)
+                if cached is not None:
+                    annotate(cache_hit=True)
+                    return cached  # 캐시 적중은 스케줄러 슬롯을 쓰지 않는다
+
+            async def invoke() -> str:
+                t0 = time.perf_counter()
+                with span("llm.invoke") as sp:
+                    try:
+                        message = await self._qa_chain.ainvoke(prompt)
+                    except Exception:
+                        observe_dependency("llm", time.perf_counter() - t0, ok=False)
+                        raise
+                    elapsed = time.perf_counter() - t0
+                    observe_dependency("llm", elapsed)
+                    self._latency.observe(elapsed)
+                    usage = getattr(message, "usage_metadata", None)
+                    if usage:
+                        llm_tokens["prompt"].inc(usage.get("input_tokens", 0))
+                        llm_tokens["completion"].inc(usage.get("output_tokens", 0))
+                        if sp is not None:
+                            sp.set(input_tokens=usage.get("input_tokens", 0),
+                                   output_tokens=usage.get("output_tokens", 0))
+                    return message.content.strip()
+
+            async def call() -> str:
+                return await self.scheduler.run(priority, lambda: self._breaker.call(invoke))
+
+            delay = self._latency.p95() if LLM_HEDGE and priority == PRIORITY_INTERACTIVE else None
+            # hedge 요청도 스케줄러 슬롯을 따로 받는다 (먼저 끝난 쪽 사용, 나머지는 취소)
+            answer = await (hedged(call, delay) if delay is not None else call())
+            if prompt_hash is not None and answer:
+                try:
+                    self._response_cache.set_llm_response(prompt_hash, answer)
+                except Exception as exc:  # noqa: BLE001
+                    print(f"[LlmEngine] ⚠️ response cache store skipped: {exc}", flush=True)
+            return answer
+
+    def count_tokens(self, text: str) -> int:
+        """Model tokenizer when available, UTF‑8 byte heuristic otherwise."""
+        try:
+            return self.llm.get_num_tokens(text)
+        except Exception:  # noqa: BLE001
+            return max(1, len(text.encode("utf-8")) // 4)
@@ -0,0 +1,172 @@
+# app/infra/llm_scheduler.py
+"""프로세스 전역 LLM 호출 스케줄러 (우선순위 + admission control).
+
+* 동시에 vLLM 으로 나가는 호출은 ``LLM_MAX_INFLIGHT`` 개까지
+* 대기 호출은 우선순위 순으로 슬롯을 받는다
+  (interactive Q&A > translate > bulk map-reduce, 같은 클래스는 FIFO)
+* 자기보다 앞선(우선순위가 같거나 높은) 대기 호출이 ``LLM_MAX_QUEUE`` 개
+  이상이면 줄을 세우지 않고 :class:`LlmOverloadedError` 로 즉시 거절한다.
+  ``retry_after`` 는 앞선 대기 수 × 평균 호출 시간 / 동시 슬롯 으로 추정한다.
+
+bulk 요약은 앞선 대기에 모든 클래스가 포함되므로 가장 먼저 거절되고,
+interactive 호출은 bulk 대기열이 아무리 길어도 거절되지 않는다.
+"""
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import math
+import os
+import time
+from typing import Awaitable, Callable, Dict, List, Tuple, TypeVar
+
+from app.utils.metrics import (
+    LLM_INFLIGHT,
+    LLM_QUEUE_DEPTH,
+    LLM_QUEUE_WAIT,
+    LLM_REJECTED,
+    child,
+    llm_queue_depth,
+    llm_queue_wait,
+    llm_rejected,
+)
+from app.utils.tracing import span
+from app.domain.interfaces import (
+    PRIORITY_BULK,
+    PRIORITY_INTERACTIVE,
+    PRIORITY_TRANSLATE,
+    LlmOverloadedError,
+)
+
+LLM_MAX_INFLIGHT = int(os.getenv("LLM_MAX_INFLIGHT", "8"))    # vLLM 동시 호출 상한
+LLM_MAX_QUEUE    = int(os.getenv("LLM_MAX_QUEUE", "64"))      # 앞선 대기 호출 상한
+
+_CLASS_NAMES = {
+    PRIORITY_INTERACTIVE: "interactive",
+    PRIORITY_TRANSLATE:   "translate",
+    PRIORITY_BULK:        "bulk",
+}
+_EWMA_ALPHA = 0.2
+
+T = TypeVar("T")
+
+
+def _label(priority: int) -> str:
+    return _CLASS_NAMES.get(priority, str(priority))
+
+
+class LlmScheduler:
+    def __init__(self, max_inflight: int = LLM_MAX_INFLIGHT, max_queue: int = LLM_MAX_QUEUE):
+        self.max_inflight = max(1, max_inflight)
+        self.max_queue = max(0, max_queue)
+        self._inflight = 0
+        self._heap: List[Tuple[int, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+        self._service_sec = 2.0  # 호출 1건 평균 소요 시간 (EWMA)
+        self._stats: Dict[int, Dict[str, float]] = {
+            p: {"admitted": 0, "rejected": 0, "wait_sum": 0.0, "wait_max": 0.0}
+            for p in _CLASS_NAMES
+        }
+
+    # ------------------------------------------------------------------
+    async def run(self, priority: int, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run ``fn()`` once a slot of *priority* is granted."""
+        with span("llm.queue", priority=_label(priority)):
+            await self._acquire(priority)
+        t0 = time.perf_counter()
+        try:
+            return await fn()
+        finally:
+            elapsed = time.perf_counter() - t0
+            self._service_sec += _EWMA_ALPHA * (elapsed - self._service_sec)
+            self._release()
+
+    def retry_after(self, priority: int = PRIORITY_BULK) -> int:
+        ahead = self._ahead(priority) + self._inflight
+        return max(1, math.ceil(ahead * self._service_sec / self.max_inflight))
+
+    def stats(self) -> dict:
+        queued = {name: 0 for name in _CLASS_NAMES.values()}
+        for p, _, _ in self._heap:
+            queued[_label(p)] += 1
+        classes = {}
+        for p, s in self._stats.items():
+            admitted = int(s["admitted"])
+            classes[_label(p)] = {
+                "admitted": admitted,
+                "rejected": int(s["rejected"]),
+                "avg_wait_ms": round(s["wait_sum"] / admitted * 1000, 1) if admitted else 0.0,
+                "max_wait_ms": round(s["wait_max"] * 1000, 1),
+            }
+        return {
+            "max_inflight": self.max_inflight,
+            "max_queue": self.max_queue,
+            "inflight": self._inflight,
+            "queue_depth": len(self._heap),
+            "queued": queued,
+            "avg_call_ms": round(self._service_sec * 1000, 1),
+            "classes": classes,
+        }
+
+    # ------------------------------------------------------------------
+    def _ahead(self, priority: int) -> int:
+        return sum(1 for p, _, _ in self._heap if p <= priority)
+
+    async def _acquire(self, priority: int) -> None:
+        stats = self._stats.setdefault(
+            priority, {"admitted": 0, "rejected": 0, "wait_sum": 0.0, "wait_max": 0.0}
+        )
+        label = _label(priority)
+        if self._inflight < self.max_inflight and not self._heap:
+            self._inflight += 1
+            LLM_INFLIGHT.inc()
+            stats["admitted"] += 1
+            child(llm_queue_wait, label, LLM_QUEUE_WAIT).observe(0.0)
+            return
+        if self._ahead(priority) >= self.max_queue:
+            stats["rejected"] += 1
+            child(llm_rejected, label, LLM_REJECTED).inc()
+            raise LlmOverloadedError(self.retry_after(priority))
+
+        t0 = time.perf_counter()
+        fut = asyncio.get_running_loop().create_future()
+        entry = (priority, next(self._seq), fut)
+        heapq.heappush(self._heap, entry)
+        depth = child(llm_queue_depth, label, LLM_QUEUE_DEPTH)
+        depth.inc()
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                self._release()  # 슬롯을 넘겨받은 직후 취소 → 다음 대기자에게 반환
+            elif entry in self._heap:
+                self._heap.remove(entry)
+                heapq.heapify(self._heap)
+            raise
+        finally:
+            depth.dec()
+        waited = time.perf_counter() - t0
+        stats["admitted"] += 1
+        stats["wait_sum"] += waited
+        stats["wait_max"] = max(stats["wait_max"], waited)
+        child(llm_queue_wait, label, LLM_QUEUE_WAIT).observe(waited)
+
+    def _release(self) -> None:
+        # 슬롯을 다음 대기자에게 그대로 넘긴다 (in-flight 수 유지)
+        while self._heap:
+            _, _, fut = heapq.heappop(self._heap)
+            if not fut.done():
+                fut.set_result(None)
+                return
+        self._inflight -= 1
+        LLM_INFLIGHT.dec()
+
+
+# ---- process-wide singleton ----
+_scheduler_singleton = LlmScheduler()
+
+
+def get_llm_scheduler() -> LlmScheduler:
+    """모든 LlmEngine / ChatSummaryService 가 공유하는 스케줄러"""
+    return _scheduler_singleton
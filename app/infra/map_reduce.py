@@ -0,0 +1,248 @@
+# app/infra/map_reduce.py
+"""Token-budgeted map-reduce summarizer with bounded map concurrency.
+
+Replaces LangChain's ``load_summarize_chain(chain_type="map_reduce")``:
+
+* **pack**   – chunks are greedily packed into map calls so each prompt fills,
+  but never exceeds, the model's input budget
+  (``context_tokens - output_tokens - prompt overhead``)
+* **map**    – map calls run with at most ``map_concurrency`` in flight
+* **reduce** – partial summaries are packed the same way and collapsed level
+  by level until a single combine call fits the context window
+
+Every node of that tree (map leaves, intermediate collapses and the root) can
+be persisted through a :class:`SummaryTreeStore`. Nodes are keyed by a hash of
+*prompt template + input text* and record the chunk range they cover, so
+
+* re-running with a different prompt version simply misses and recomputes,
+* re-ingesting a document with a few changed pages recomputes only the leaves
+  whose text changed and the branches above them.
+
+Greedy packing keeps group boundaries stable as long as chunk token counts
+before an edit are unchanged; an edit that changes a chunk's size can shift
+the boundaries of the groups after it.
+
+The summarizer only needs an async ``call(prompt) -> str`` and a
+``count_tokens(text) -> int``; :class:`app.infra.llm_engine.LlmEngine`
+supplies both.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional, Protocol, Sequence, Tuple
+
+# LangChain map_reduce 기본 프롬프트와 동일 (출력 품질 유지)
+MAP_PROMPT = """Write a concise summary of the following:
+
+
+"{text}"
+
+
+CONCISE SUMMARY:"""
+
+COMBINE_PROMPT = MAP_PROMPT
+
+_SAFETY_TOKENS = 64        # 토큰 추정 오차 여유
+_MAX_REDUCE_LEVELS = 8     # 비정상 입력에서 무한 축약 방지
+
+
+class SummaryTreeStore(Protocol):
+    """Persistence for summary-tree nodes (``key → serialized node``)."""
+
+    def get_summary_nodes(self, doc_id: str, keys: List[str]) -> List[Optional[str]]: ...
+
+    def set_summary_nodes(self, doc_id: str, nodes: Dict[str, str]) -> None: ...
+
+
+@dataclass
+class _Node:
+    start: int      # 포함하는 첫 청크 index
+    end: int        # 마지막 청크 index + 1
+    text: str
+
+
+@dataclass
+class SummaryStats:
+    calls: int = 0
+    reused: int = 0          # 저장된 트리 노드 재사용 수
+    prompt_tokens: int = 0
+    output_tokens: int = 0
+    levels: int = 0          # reduce 단계 수 (0 = 단일 호출)
+    wall_sec: float = 0.0
+    map_groups: int = 0
+    level_sizes: List[int] = field(default_factory=list)
+
+
+class MapReduceSummarizer:
+    def __init__(
+        self,
+        call: Callable[[str], Awaitable[str]],
+        count_tokens: Callable[[str], int],
+        *,
+        context_tokens: int,
+        output_tokens: int,
+        map_concurrency: int = 4,
+        map_prompt: str = MAP_PROMPT,
+        combine_prompt: str = COMBINE_PROMPT,
+        tree_store: Optional[SummaryTreeStore] = None,
+    ):
+        self.call = call
+        self.count_tokens = count_tokens
+        self.map_prompt = map_prompt
+        self.combine_prompt = combine_prompt
+        self.map_concurrency = max(1, map_concurrency)
+        self.tree_store = tree_store
+
+        overhead = max(count_tokens(map_prompt.format(text="")), count_tokens(combine_prompt.format(text="")))
+        self.budget = context_tokens - output_tokens - overhead - _SAFETY_TOKENS
+        if self.budget <= 0:
+            raise ValueError("context window too small for the summarization prompt")
+
+    # ------------------------------------------------------------------
+    async def summarize(self, docs: Sequence[str], doc_id: Optional[str] = None) -> str:
+        summary, _ = await self.summarize_with_stats(docs, doc_id)
+        return summary
+
+    async def summarize_with_stats(
+        self, docs: Sequence[str], doc_id: Optional[str] = None
+    ) -> Tuple[str, SummaryStats]:
+        return await self._summarize_leaves(self._leaves(docs), doc_id)
+
+    # ------------------------------------------------------------------
+    async def _summarize_leaves(
+        self, leaves: List[_Node], doc_id: Optional[str]
+    ) -> Tuple[str, SummaryStats]:
+        stats = SummaryStats()
+        t0 = time.perf_counter()
+        if not leaves:
+            return "", stats
+
+        groups = self._pack(leaves)
+        stats.map_groups = len(groups)
+        if len(groups) == 1:
+            # 전체가 한 번에 들어가면 map 없이 단일 호출
+            summary = (await self._level(doc_id, self.combine_prompt, groups, stats))[0].text
+        else:
+            partials = await self._level(doc_id, self.map_prompt, groups, stats)
+            summary = await self._reduce(doc_id, partials, stats)
+
+        stats.wall_sec = time.perf_counter() - t0
+        return summary.strip(), stats
+
+    def _leaves(self, docs: Sequence[str]) -> List[_Node]:
+        return [_Node(i, i + 1, d) for i, d in enumerate(docs) if d and d.strip()]
+
+    def pack(self, texts: Sequence[str]) -> List[str]:
+        """Greedy packing of *texts* into groups that fit ``self.budget``."""
+        return [g.text for g in self._pack(self._leaves(texts))]
+
+    def _pack(self, nodes: Sequence[_Node]) -> List[_Node]:
+        groups: List[_Node] = []
+        cur: List[_Node] = []
+        cur_tokens = 0
+
+        def _flush() -> None:
+            groups.append(_Node(cur[0].start, cur[-1].end, "\n\n".join(n.text for n in cur)))
+
+        for node in nodes:
+            for piece in self._split_oversized(node.text):
+                n = self.count_tokens(piece)
+                if cur and cur_tokens + n > self.budget:
+                    _flush()
+                    cur, cur_tokens = [], 0
+                cur.append(_Node(node.start, node.end, piece))
+                cur_tokens += n
+        if cur:
+            _flush()
+        return groups
+
+    def _split_oversized(self, text: str) -> List[str]:
+        """Split a single text that alone exceeds the budget."""
+        n = self.count_tokens(text)
+        if n <= self.budget:
+            return [text]
+        parts = -(-n // self.budget)                # ceil
+        step = -(-len(text) // parts)
+        return [text[i : i + step] for i in range(0, len(text), step)]
+
+    async def _reduce(self, doc_id: Optional[str], partials: List[_Node], stats: SummaryStats) -> str:
+        for _ in range(_MAX_REDUCE_LEVELS):
+            stats.levels += 1
+            stats.level_sizes.append(len(partials))
+            groups = self._pack(partials)
+            if len(groups) == 1:
+                return (await self._level(doc_id, self.combine_prompt, groups, stats))[0].text
+            partials = await self._level(doc_id, self.combine_prompt, groups, stats)
+        # 수렴하지 않으면 모든 부분 요약을 같은 비율로 잘라 한 번의 결합 호출에 넣는다
+        final = self._squeeze(partials)
+        print(
+            f"[MapReduce] ⚠️ reduce did not converge in {_MAX_REDUCE_LEVELS} levels "
+            f"({len(partials)} partials) — forcing one combine over truncated partials",
+            flush=True,
+        )
+        return (await self._level(doc_id, self.combine_prompt, [final], stats))[0].text
+
+    def _squeeze(self, nodes: Sequence[_Node]) -> _Node:
+        """Join *nodes* into one group within ``self.budget``, truncating each proportionally."""
+        texts = [n.text for n in nodes]
+        ratio = 1.0
+        while True:
+            text = "\n\n".join(t[: max(1, int(len(t) * ratio))] for t in texts)
+            n = self.count_tokens(text)
+            if n <= self.budget or ratio < 1e-3:
+                return _Node(nodes[0].start, nodes[-1].end, text)
+            ratio *= 0.95 * self.budget / n
+
+    async def _level(
+        self, doc_id: Optional[str], template: str, groups: Sequence[_Node], stats: SummaryStats
+    ) -> List[_Node]:
+        """Summarize one tree level: stored nodes are reused, the rest fan out."""
+        keys = [_node_key(template, g.text) for g in groups]
+        stored: List[Optional[str]] = [None] * len(groups)
+        if doc_id and self.tree_store is not None:
+            stored = self.tree_store.get_summary_nodes(doc_id, keys)
+
+        sem = asyncio.Semaphore(self.map_concurrency)
+
+        async def _bounded(group: _Node) -> str:
+            async with sem:
+                return await self._run(template, group.text, stats)
+
+        todo = [i for i, raw in enumerate(stored) if raw is None]
+        fresh = await asyncio.gather(*(_bounded(groups[i]) for i in todo))
+
+        out: List[_Node] = []
+        for g, raw in zip(groups, stored):
+            if raw is not None:
+                stats.reused += 1
+                out.append(_Node(g.start, g.end, json.loads(raw)["summary"]))
+            else:
+                out.append(_Node(g.start, g.end, ""))
+        new_nodes: Dict[str, str] = {}
+        for i, text in zip(todo, fresh):
+            out[i].text = text
+            new_nodes[keys[i]] = json.dumps(
+                {"summary": text, "start": groups[i].start, "end": groups[i].end}, ensure_ascii=False
+            )
+        if new_nodes and doc_id and self.tree_store is not None:
+            self.tree_store.set_summary_nodes(doc_id, new_nodes)
+        return out
+
+    async def _run(self, template: str, text: str, stats: SummaryStats) -> str:
+        prompt = template.format(text=text)
+        out = (await self.call(prompt)).strip()
+        stats.calls += 1
+        stats.prompt_tokens += self.count_tokens(prompt)
+        stats.output_tokens += self.count_tokens(out)
+        return out
+
+
+def _node_key(template: str, text: str) -> str:
+    """Content address of a tree node: prompt version + input text."""
+    prompt_hash = hashlib.sha1(template.encode("utf-8")).hexdigest()[:8]
+    text_hash = hashlib.sha1(text.encode("utf-8")).hexdigest()
+    return f"{prompt_hash}:{text_hash}"
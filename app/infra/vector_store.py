@@ -1,27 +1,54 @@
 # app/infrastructure/vector_store.py
-from typing import List
+import asyncio
+from typing import List, Tuple
 from app.domain.interfaces import VectorStoreIF, TextChunk
 from app.vectordb.vector_db import get_vector_db
+from app.utils.resilience import guarded
 
 
 class VectorStore(VectorStoreIF):
     def __init__(self):
         self.vdb = get_vector_db()
 
+    @guarded("chroma")
     async def upsert(self, chunks: List[TextChunk], doc_id: str) -> None:
         self.vdb.store(chunks, doc_id)
 
+    @guarded("chroma")
     async def similarity_search(
         self, doc_id: str, query: str, k: int = 8
     ) -> List[TextChunk]:
         docs = self.vdb.get_docs(doc_id, query, k)
         return [d.page_content for d in docs]
 
+    @guarded("chroma")
+    async def similarity_search_with_scores(
+        self, doc_id: str, query: str, k: int = 8
+    ) -> List[Tuple[TextChunk, float]]:
+        """Like :meth:`similarity_search` but with relevance scores in [0, 1]."""
+        hits = self.vdb.get_docs_with_scores(doc_id, query, k)
+        return [(d.page_content, score) for d, score in hits]
+
+    @guarded("chroma")
     async def has_chunks(self, doc_id: str) -> bool:
         """Return *True* if *doc_id* already has at least one chunk stored."""
         return self.vdb.has_chunks(doc_id)
     
+    @guarded("embedding")
+    async def embed_query(self, query: str) -> List[float]:
+        """Embed *query* with the same model used for the stored chunks."""
+        # 임베딩 서버 호출은 동기 HTTP → 이벤트 루프를 막지 않도록 작업 스레드에서
+        return await asyncio.to_thread(self.vdb.embeddings.embed_query, query)
+
+    @guarded("chroma")
     async def get_all(self, doc_id: str) -> List[TextChunk]:
         """Return **all** stored chunks for *doc_id* (plain strings)."""
         docs = self.vdb.get_all_chunks(doc_id)
         return [d.page_content for d in docs]
+
+    @guarded("chroma")
+    async def get_all_with_embeddings(
+        self, doc_id: str
+    ) -> Tuple[List[TextChunk], List[List[float]]]:
+        """All stored chunks for *doc_id* together with their embeddings."""
+        return self.vdb.get_all_chunks_with_embeddings(doc_id)
@@ -3,9 +3,11 @@ from app.domain.interfaces import WebSearchIF, TextChunk
 import os
 from typing import List
 from langchain.text_splitter import RecursiveCharacterTextSplitter
+from app.utils.resilience import guarded
 
 
 class WebSearch(WebSearchIF):
+    @guarded("web")
     async def search(self, query: str, k: int = 5) -> List[TextChunk]:
         web_search_tool = TavilySearchResults(tavily_api_key=os.getenv("TAVILY_API_KEY"), max_results=k)
         result = web_search_tool.run(query)
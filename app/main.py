@@ -4,12 +4,16 @@ import asyncio
 from fastapi import FastAPI
 from contextlib import asynccontextmanager
 from app.background.cleanup_scheduler import register_cleanup_task
+from app.background.job_worker import start_job_workers, stop_job_workers
 from app.controller import (
     pdf_summary_controller,
     chat_summary_controller,
     cache_management_controller,
     vector_management_controller,
-    system_management_controller
+    system_management_controller,
+    metrics_controller,
+    job_controller,
+    ingest_controller,
 )
 print("[DEBUG] main.py 시작됨", flush=True)
 
@@ -23,10 +27,13 @@ async def lifespan(app: FastAPI):
         print("[LIFESPAN] 백그라운드 작업 등록 완료", flush=True)
     except Exception as e:
         print(f"[LIFESPAN] 백그라운드 작업 등록 중 오류: {e}", flush=True)
+    workers = start_job_workers()
+    print(f"[LIFESPAN] 요약 작업 워커 {len(workers)}개 시작", flush=True)
     yield
     if task:
         task.cancel()
         print("[LIFESPAN] 종료 시 백그라운드 작업 취소 완료", flush=True)
+    await stop_job_workers(workers)
 
 
 
@@ -37,3 +44,6 @@ app.include_router(chat_summary_controller.router)
 app.include_router(cache_management_controller.router)
 app.include_router(vector_management_controller.router)
 app.include_router(system_management_controller.router)
+app.include_router(metrics_controller.router)
+app.include_router(job_controller.router)
+app.include_router(ingest_controller.router)
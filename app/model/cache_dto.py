@@ -0,0 +1,5 @@
+from typing import List
+from pydantic import BaseModel
+
+class BulkDeleteRequestDTO(BaseModel):
+    file_ids: List[str]
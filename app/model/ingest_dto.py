@@ -0,0 +1,10 @@
+from typing import List
+from pydantic import BaseModel, HttpUrl
+
+class IngestItemDTO(BaseModel):
+    file_id: str
+    pdf_url: HttpUrl
+
+class BulkIngestRequestDTO(BaseModel):
+    items: List[IngestItemDTO]
+    langs: List[str] = []  # 요약 번역까지 미리 캐시할 언어 (비우면 번역 생략)
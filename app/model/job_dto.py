@@ -0,0 +1,9 @@
+from typing import Optional
+from pydantic import BaseModel, HttpUrl
+
+class JobRequestDTO(BaseModel):
+    file_id: str
+    pdf_url: HttpUrl
+    query: str
+    lang: str
+    webhook_url: Optional[HttpUrl] = None  # 완료 시 {job_id, status, result} POST
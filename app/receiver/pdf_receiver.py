@@ -1,49 +1,71 @@
+import asyncio
 import os
 import tempfile
-from typing import Final, List
+import threading
+import time
+from typing import Final, List, Optional
 
 import httpx                # ✅ async HTTP client
 from PIL import Image, ImageOps
 import pytesseract
 import fitz                 # PyMuPDF
 
+from app.utils.metrics import observe_dependency, pdf_pages
+from app.utils.tracing import span
+
 _TIMEOUT: Final[int] = 30  # seconds
 
 
 class PDFReceiver:
-    """PDF 링크 → 텍스트(이미지 OCR 포함). 100 % 비동기."""
+    """PDF 링크 → 텍스트(이미지 OCR 포함). 100 % 비동기.
+
+    파싱·OCR 은 CPU 작업이라 작업 스레드에서 돌리고, 호출이 취소되면
+    cancel 이벤트로 다음 페이지 경계에서 멈춘다.
+    """
 
     async def fetch_and_extract_text(self, url: str) -> str:
-        async with httpx.AsyncClient(timeout=_TIMEOUT, follow_redirects=True) as client:
-            resp = await client.get(url)
-            resp.raise_for_status()
+        with span("pdf.download") as sp:
+            async with httpx.AsyncClient(timeout=_TIMEOUT, follow_redirects=True) as client:
+                resp = await client.get(url)
+                resp.raise_for_status()
+            if sp is not None:
+                sp.set(bytes=len(resp.content))
 
         with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as fp:
             fp.write(resp.content)
             pdf_path = fp.name
 
+        cancel = threading.Event()
         try:
             parser = PDFParser()
-            elements: List[str] = parser.read(pdf_path)
+            with span("pdf.parse"):
+                elements: List[str] = await asyncio.to_thread(parser.read, pdf_path, cancel)
             return "\n".join(e for e in elements if e)
+        except asyncio.CancelledError:
+            cancel.set()  # 스레드는 현재 페이지까지만 처리하고 종료
+            raise
         finally:
-            os.remove(pdf_path)
+            os.remove(pdf_path)  # 열려 있는 파일이어도 unlink 가능 (스레드 종료 시 해제)
 
 
 class PDFParser:
     def __init__(self, ocr_lang: str = "kor+eng"):
         self.ocr_lang = ocr_lang
 
-    def read(self, pdf_path: str) -> List[str]:
-        """텍스트 추출 + OCR fallback."""
+    def read(self, pdf_path: str, cancel: Optional[threading.Event] = None) -> List[str]:
+        """텍스트 추출 + OCR fallback. ``cancel`` 이 설정되면 남은 페이지는 건너뛴다."""
         with fitz.open(pdf_path) as doc:
             texts = []
             for page in doc:
+                if cancel is not None and cancel.is_set():
+                    break
                 text = page.get_text("text")
                 if len(text.strip()) > 50:
+                    pdf_pages["text"].inc()
                     texts.append(text)
                 else:
-                    texts.append(self._ocr_page(page))
+                    with span("tesseract.ocr", page=page.number):
+                        texts.append(self._ocr_page(page))
         return texts
 
     # ------------------------------------------------------------------
@@ -55,6 +77,13 @@ class PDFParser:
             img = pix.pil_image
             gray = ImageOps.grayscale(img)
             bw = gray.point(lambda x: 0 if x < 180 else 255, "1")
-            return pytesseract.image_to_string(bw, lang=self.ocr_lang, timeout=10)
+            t0 = time.perf_counter()
+            try:
+                text = pytesseract.image_to_string(bw, lang=self.ocr_lang, timeout=10)
+            finally:
+                observe_dependency("tesseract", time.perf_counter() - t0)
+            pdf_pages["ocr"].inc()
+            return text
         except Exception:
+            pdf_pages["ocr_failed"].inc()
             return ""
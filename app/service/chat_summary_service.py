@@ -2,14 +2,22 @@ from langchain.chains.summarize import load_summarize_chain
 from langchain_openai import ChatOpenAI
 from langchain.schema import Document
 
+from app.domain.interfaces import PRIORITY_INTERACTIVE
+from app.infra.llm_scheduler import get_llm_scheduler
+
 class ChatSummaryService:
     def __init__(self):
         self.llm = ChatOpenAI(temperature=0.3)
+        self.scheduler = get_llm_scheduler()
 
-    def generate(self, messages: list[str]) -> str:
+    async def generate(self, messages: list[str]) -> str:
         combined_text = "\n".join(messages)
         docs = [Document(page_content=combined_text)]
         chain = load_summarize_chain(self.llm, chain_type="stuff")
-        summary = chain.run(docs)
-        return summary
 
+        # 그래프와 같은 LLM 스케줄러를 거쳐 동시 호출 수를 제한한다
+        async def call() -> str:
+            result = await chain.ainvoke({"input_documents": docs})
+            return result["output_text"]
+
+        return await self.scheduler.run(PRIORITY_INTERACTIVE, call)
@@ -0,0 +1,159 @@
+# app/service/chunk_grader.py
+"""Retrieved-chunk relevance grading for the ``grade`` node.
+
+Three modes (``GRADE_MODE``):
+
+* ``concurrent`` – one LLM call per chunk, at most ``GRADE_CONCURRENCY`` in flight
+* ``batch``      – a single prompt returning a JSON verdict list for every chunk;
+  falls back to ``concurrent`` if the reply cannot be parsed
+* ``sequential`` – the original one-after-another behaviour (for comparison)
+
+Verdicts are memoised per (original query, summary, chunk) so ``refine`` loops,
+which rewrite the query, do not re-grade chunks they have already seen. The
+summary is part of the prompt, so a regenerated summary is graded afresh.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+from collections import OrderedDict
+from typing import List, Optional, Sequence, Tuple
+
+from app.domain.interfaces import LlmChainIF, TextChunk
+
+GRADE_MODE        = os.getenv("GRADE_MODE", "concurrent")
+GRADE_CONCURRENCY = int(os.getenv("GRADE_CONCURRENCY", "4"))
+GRADE_CACHE_SIZE  = int(os.getenv("GRADE_CACHE_SIZE", "4096"))
+
+_SINGLE_PROMPT = """
+                You are a helpful assistant that can grade the retrieved information.
+                If the retrieved information is good, return 'good'.
+                If the retrieved information is bad, return 'bad'.
+                Query: {query}
+                Summary: {summary}
+                Retrieved: {retrieved}
+                """
+
+_BATCH_PROMPT = """
+                You are a helpful assistant that can grade the retrieved information.
+                For each numbered item below decide whether it is useful to answer the query.
+                Return ONLY a JSON array with exactly {n} strings, each 'good' or 'bad',
+                in the same order as the items. Do not return anything else.
+                Query: {query}
+                Summary: {summary}
+                Retrieved:
+                {retrieved}
+                """
+
+
+class ChunkGrader:
+    def __init__(
+        self,
+        llm: LlmChainIF,
+        *,
+        mode: str = GRADE_MODE,
+        concurrency: int = GRADE_CONCURRENCY,
+        cache_size: int = GRADE_CACHE_SIZE,
+    ):
+        self.llm = llm
+        self.mode = mode
+        self.concurrency = max(1, concurrency)
+        self.cache_size = cache_size
+        self._verdicts: "OrderedDict[Tuple[str, str, str], bool]" = OrderedDict()
+
+    # ------------------------------------------------------------------
+    async def grade(
+        self,
+        query: str,
+        summary: Optional[str],
+        chunks: Sequence[TextChunk],
+        *,
+        origin_query: Optional[str] = None,
+    ) -> List[TextChunk]:
+        """Return the chunks judged relevant, preserving their order.
+
+        Verdicts are cached under *origin_query* (the question before any
+        refinement) when given, so they carry over to refined queries.
+        """
+        key_query = origin_query or query
+        verdicts: List[Optional[bool]] = [self._cached(key_query, summary, c) for c in chunks]
+        todo = [i for i, v in enumerate(verdicts) if v is None]
+
+        if todo:
+            pending = [chunks[i] for i in todo]
+            if self.mode == "batch":
+                fresh = await self._grade_batch(query, summary, pending)
+            elif self.mode == "sequential":
+                fresh = [await self._grade_one(query, summary, c) for c in pending]
+            else:
+                fresh = await self._grade_concurrent(query, summary, pending)
+            for i, ok in zip(todo, fresh):
+                verdicts[i] = ok
+                self._remember(key_query, summary, chunks[i], ok)
+
+        return [c for c, ok in zip(chunks, verdicts) if ok]
+
+    # ------------------------------------------------------------------
+    async def _grade_one(self, query: str, summary: Optional[str], chunk: TextChunk) -> bool:
+        prompt = _SINGLE_PROMPT.format(query=query, summary=summary, retrieved=chunk)
+        result = await self.llm.execute(prompt)
+        return "good" in result.lower()
+
+    async def _grade_concurrent(
+        self, query: str, summary: Optional[str], chunks: Sequence[TextChunk]
+    ) -> List[bool]:
+        sem = asyncio.Semaphore(self.concurrency)
+
+        async def _bounded(chunk: TextChunk) -> bool:
+            async with sem:
+                return await self._grade_one(query, summary, chunk)
+
+        return list(await asyncio.gather(*(_bounded(c) for c in chunks)))
+
+    async def _grade_batch(
+        self, query: str, summary: Optional[str], chunks: Sequence[TextChunk]
+    ) -> List[bool]:
+        numbered = "\n".join(f"[{i}] {c}" for i, c in enumerate(chunks, 1))
+        prompt = _BATCH_PROMPT.format(n=len(chunks), query=query, summary=summary, retrieved=numbered)
+        verdicts = _parse_verdicts(await self.llm.execute(prompt), len(chunks))
+        if verdicts is None:
+            # 구조화 응답 실패 → 청크별 병렬 채점으로 대체
+            return await self._grade_concurrent(query, summary, chunks)
+        return verdicts
+
+    # ---- (query, summary, chunk) verdict cache -----------------------
+    def _key(self, query: str, summary: Optional[str], chunk: TextChunk) -> Tuple[str, str, str]:
+        return (
+            query,
+            hashlib.sha1((summary or "").encode("utf-8")).hexdigest(),
+            hashlib.sha1(str(chunk).encode("utf-8")).hexdigest(),
+        )
+
+    def _cached(self, query: str, summary: Optional[str], chunk: TextChunk) -> Optional[bool]:
+        key = self._key(query, summary, chunk)
+        if key in self._verdicts:
+            self._verdicts.move_to_end(key)
+            return self._verdicts[key]
+        return None
+
+    def _remember(self, query: str, summary: Optional[str], chunk: TextChunk, ok: bool) -> None:
+        self._verdicts[self._key(query, summary, chunk)] = ok
+        while len(self._verdicts) > self.cache_size:
+            self._verdicts.popitem(last=False)
+
+
+def _parse_verdicts(text: str, n: int) -> Optional[List[bool]]:
+    """Extract a JSON array of 'good'/'bad' of length *n* from *text*."""
+    match = re.search(r"\[.*\]", text, re.DOTALL)
+    if not match:
+        return None
+    try:
+        items = json.loads(match.group(0))
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(items, list) or len(items) != n:
+        return None
+    return ["good" in str(item).lower() for item in items]
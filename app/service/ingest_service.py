@@ -0,0 +1,173 @@
+# app/service/ingest_service.py
+"""대량 사전 적재 — 채팅방에 올라온 문서를 질의 전에 미리 다운로드·OCR·임베딩·요약한다.
+
+배치 하나는 백그라운드 태스크로 돌고, 문서 단위 작업은 프로세스 전역
+``INGEST_CONCURRENCY`` 슬롯을 나눠 쓴다 (여러 배치가 동시에 들어와도 상한 유지).
+요약 LLM 호출은 bulk 우선순위라 대화형 질의를 밀어내지 않는다.
+
+진행 상황과 처리량(문서/분, 단계별 누적 시간)은 문서가 끝날 때마다
+Redis 리포트(``ingest:{batch_id}``)로 갱신되어 어느 레플리카에서든 조회할 수 있다.
+배치는 프로세스 메모리에서 실행되므로 재시작 시 진행 중 배치는 중단된다. 실행 중에는
+``INGEST_HEARTBEAT_SEC`` 마다 리포트를 갱신하며, 갱신이 ``INGEST_STALE_SEC`` 이상 끊긴
+running 리포트는 조회 시 ``interrupted`` 로 표시된다.
+"""
+import asyncio
+import os
+import time
+import uuid
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from app.cache.cache_db import get_cache_db
+from app.service.summary_service_graph import SummaryServiceGraph, get_summary_service_graph
+
+INGEST_CONCURRENCY  = int(os.getenv("INGEST_CONCURRENCY", "4"))       # 동시 처리 문서 수 (프로세스 전역)
+INGEST_MAX_ITEMS    = int(os.getenv("INGEST_MAX_ITEMS", "1000"))      # 배치당 문서 수 상한
+INGEST_DEADLINE_SEC = float(os.getenv("INGEST_DEADLINE_SEC", "1800")) # 번역 예산 (적재·요약은 무제한)
+INGEST_HEARTBEAT_SEC = float(os.getenv("INGEST_HEARTBEAT_SEC", "30"))  # 리포트 갱신 주기 (INGEST_STALE_SEC 보다 짧게)
+_MAX_FAILURES = 50  # 리포트에 남길 실패 항목 수
+
+# 리포트에 합산할 그래프 노드 (trace 워터폴의 node:<name> span)
+_STAGES = ("load", "embed", "summarize", "translate")
+
+
+class IngestService:
+    def __init__(self, service: SummaryServiceGraph, concurrency: int = INGEST_CONCURRENCY):
+        self.service = service
+        self.concurrency = max(1, concurrency)
+        self._slots = asyncio.Semaphore(self.concurrency)
+        self._batches: Dict[str, asyncio.Task] = {}
+
+    # ------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------
+    def start(self, items: List[Tuple[str, str]], langs: Optional[List[str]] = None) -> dict:
+        """Start warming *items* ``(file_id, pdf_url)`` in the background; returns the initial report.
+
+        Each document is summarized once (``SUMMARY_ALL``); every language in
+        *langs* additionally gets its translation cached. Without *langs* the
+        translate step is skipped.
+        """
+        if not items:
+            raise ValueError("items is empty")
+        if len(items) > INGEST_MAX_ITEMS:
+            raise ValueError(f"too many items ({len(items)} > {INGEST_MAX_ITEMS})")
+        items = list(dict(items).items())  # file_id 중복 제거 (마지막 URL 사용)
+        langs = [l.strip() for l in (langs or []) if l.strip()] or [""]
+
+        batch_id = f"{datetime.now():%Y%m%d-%H%M%S}-{uuid.uuid4().hex[:6]}"
+        report = {
+            "batch_id": batch_id,
+            "status": "running",
+            "total": len(items),
+            "done": 0,
+            "cached": 0,
+            "failed": 0,
+            "langs": [l for l in langs if l],
+            "concurrency": self.concurrency,
+            "started_at": time.time(),
+            "finished_at": None,
+            "elapsed_sec": 0.0,
+            "docs_per_min": 0.0,
+            "stage_sec": {s: 0.0 for s in _STAGES},
+            "failures": [],
+        }
+        get_cache_db().set_ingest_report(batch_id, report)
+
+        task = asyncio.create_task(self._run_batch(report, items, langs))
+        self._batches[batch_id] = task
+        task.add_done_callback(lambda _t: self._batches.pop(batch_id, None))
+        return report
+
+    def running(self) -> List[str]:
+        return list(self._batches)
+
+    # ------------------------------------------------------
+    async def _run_batch(self, report: dict, items: List[Tuple[str, str]], langs: List[str]) -> None:
+        t0 = time.monotonic()
+
+        async def one(file_id: str, pdf_url: str) -> None:
+            async with self._slots:
+                error, cached, stages = await self._warm(file_id, pdf_url, langs)
+            report["done"] += 1
+            if error:
+                report["failed"] += 1
+                if len(report["failures"]) < _MAX_FAILURES:
+                    report["failures"].append({"file_id": file_id, "error": error})
+            elif cached:
+                report["cached"] += 1
+            for name, sec in stages.items():
+                report["stage_sec"][name] = round(report["stage_sec"][name] + sec, 3)
+            self._progress(report, t0)
+
+        async def heartbeat() -> None:
+            # 긴 문서 하나가 오래 걸려도 리포트가 살아 있음을 알림
+            while True:
+                await asyncio.sleep(INGEST_HEARTBEAT_SEC)
+                self._progress(report, t0)
+
+        hb = asyncio.create_task(heartbeat())
+        try:
+            await asyncio.gather(*(one(fid, url) for fid, url in items))
+            report["status"] = "done"
+        except asyncio.CancelledError:
+            report["status"] = "cancelled"
+            raise
+        finally:
+            hb.cancel()
+            report["finished_at"] = time.time()
+            self._progress(report, t0)
+            print(
+                f"[Ingest] {report['batch_id']} {report['status']}: "
+                f"{report['done']}/{report['total']} (cached {report['cached']}, failed {report['failed']}) "
+                f"in {report['elapsed_sec']}s",
+                flush=True,
+            )
+
+    async def _warm(self, file_id: str, pdf_url: str, langs: List[str]) -> Tuple[Optional[str], bool, Dict[str, float]]:
+        """Summarize one document (then cache its translations); returns (error, cached, stage seconds)."""
+        stages = {s: 0.0 for s in _STAGES}
+        cached = False
+        for i, lang in enumerate(langs):
+            try:
+                body = await self.service.generate(
+                    file_id=file_id,
+                    pdf_url=pdf_url,
+                    query="SUMMARY_ALL",
+                    lang=lang,
+                    trace=True,
+                    deadline_sec=INGEST_DEADLINE_SEC,
+                )
+            except Exception as e:  # noqa: BLE001
+                return str(e) or type(e).__name__, False, stages
+            for row in body.get("trace", {}).get("spans", ()):
+                name = row["name"].removeprefix("node:")
+                if name in stages and row["name"].startswith("node:"):
+                    stages[name] += row["ms"] / 1000
+            if body.get("error"):
+                return body["error"], False, stages
+            if i == 0:
+                cached = bool(body.get("cached"))  # 요약이 이미 있었는지 (이후 언어는 항상 캐시 사용)
+        return None, cached, stages
+
+    @staticmethod
+    def _progress(report: dict, t0: float) -> None:
+        elapsed = time.monotonic() - t0
+        report["elapsed_sec"] = round(elapsed, 1)
+        report["docs_per_min"] = round(report["done"] / elapsed * 60, 2) if elapsed > 0 else 0.0
+        try:
+            get_cache_db().set_ingest_report(report["batch_id"], report)
+        except Exception as e:  # noqa: BLE001
+            print(f"[Ingest] ⚠️ report save failed: {e}", flush=True)
+
+
+# ---- FastAPI DI provider ----
+_ingest_singleton: Optional[IngestService] = None
+
+
+def get_ingest_service() -> IngestService:
+    """FastAPI Depends용 싱글턴 반환"""
+    global _ingest_singleton
+    if _ingest_singleton is None:
+        _ingest_singleton = IngestService(get_summary_service_graph())
+    return _ingest_singleton
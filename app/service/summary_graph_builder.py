@@ -3,24 +3,44 @@
 
 노드가 I/O 오류를 내면 최대 3번까지 재시도하고 모두 실패하면
 `st.error`에 최종 예외 메시지를 기록한 뒤 `finish`로 단락(exit)한다.
+
+요청마다 마감 시각(`REQUEST_DEADLINE_SEC`)과 refine 루프 예산
+(`MAX_REFINE_LOOPS`)이 있다. 예산이 바닥나면 남은 노드를 건너뛰고
+지금까지의 최선 답변을 `translate`로 보낸다 (답변이 없으면 오류로 종료).
+
+실행이 취소되면(클라이언트 이탈) LLM·Chroma·웹 호출은 즉시 중단되지만,
+다른 요청이 재사용하는 작업 — 문서 적재(다운로드/OCR/임베딩)와 문서 요약 —
+은 `FINISH_REUSABLE_ON_CANCEL` 이 켜져 있으면 백그라운드에서 끝까지 수행한다.
 """
 from __future__ import annotations
 
 import asyncio
+import os
+import time
 from functools import wraps
-from typing import Awaitable, Callable, List, Optional
+from typing import Awaitable, Callable, Dict, List, Optional
 
 from langgraph.graph import StateGraph
 from pydantic import BaseModel
 
 from app.domain.interfaces import (
+    PRIORITY_TRANSLATE,
     CacheIF,
+    LeaseIF,
     LlmChainIF,
+    LlmOverloadedError,
     PdfLoaderIF,
     TextChunk,
     WebSearchIF,
     VectorStoreIF,
 )
+from .chunk_grader import ChunkGrader
+from .web_router import ROUTER_PROMPT, WEB_ROUTER_MODE, route_by_score
+from app.utils.lang_detect import is_same_language
+from app.utils.metrics import count_cache, observe_node
+from app.utils.resilience import CircuitOpenError, backoff_delay, is_retryable
+from app.utils.tracing import annotate, span
+from app.utils.textrank import extractive_abstract
 
 # ---------------------------------------------------------------------------
 # Shared state
@@ -35,44 +55,170 @@ class SummaryState(BaseModel):
     retrieved: Optional[List[TextChunk]] = None
     summary: Optional[str] = None
     answer:  Optional[str] = None
-    
-    log : Optional[List[str]] = [] # 임시 테스트용 로그
+    origin_query: Optional[str] = None             # refine 이전 원본 질의
+    query_embedding: Optional[List[float]] = None  # 원본 질의 임베딩 (답변 캐시 key)
 
     cached: bool = False
     embedded: bool = False
     is_summary: bool = False
     error: Optional[str] = None
+    retry_after: Optional[int] = None  # LLM 과부하로 거절됨 → 클라이언트 재시도 힌트(초)
     
     is_web: Optional[bool] = None
+    route_score: Optional[float] = None  # 질의↔청크 최대 유사도 (웹 라우팅 근거)
     is_good: Optional[bool] = None
 
+    deadline_sec: Optional[float] = None  # Q&A 예산 (None → REQUEST_DEADLINE_SEC)
+    deadline: Optional[float] = None      # time.monotonic() 기준 마감 시각 (첫 예산 노드에서 설정)
+    loops: int = 0                    # 수행한 refine 루프 수
+    timed_out: bool = False           # 마감 초과로 남은 노드를 건너뜀
+
+    leases: Dict[str, str] = {}  # 보유 중인 분산 lease (name → token)
+
 
 # ---------------------------------------------------------------------------
 # Helper: safe-retry decorator
 # ---------------------------------------------------------------------------
-_RETRY = 3
-_SLEEP = 1  # seconds between retries
-
-
-def safe_retry(fn: Callable[[SummaryState], Awaitable[SummaryState]]):
-    """Try ``fn`` up to `_RETRY` times; on final failure record error."""
+_RETRY = 3  # 재시도 간격은 resilience.backoff_delay (jitter 지수 백오프)
+
+REQUEST_DEADLINE_SEC = float(os.getenv("REQUEST_DEADLINE_SEC", "60"))  # Q&A 루프·번역 예산 (적재·요약 제외)
+MAX_REFINE_LOOPS     = int(os.getenv("MAX_REFINE_LOOPS", "2"))          # verify→refine 최대 반복
+TRANSLATE_GRACE_SEC  = float(os.getenv("TRANSLATE_GRACE_SEC", "15"))    # 마감 후 번역 유예
+FINISH_REUSABLE_ON_CANCEL = os.getenv("FINISH_REUSABLE_ON_CANCEL", "1") == "1"  # 취소 시 적재·요약은 마저 수행
+
+# 취소된 요청에서 떨어져 나와 계속 실행 중인 작업 (GC 방지)
+_detached: set = set()
+
+
+async def _shielded(
+    coro: Awaitable,
+    on_abandon: Optional[Callable[[], Callable[[object], Awaitable[None]]]] = None,
+):
+    """Await *coro* as reusable work.
+
+    If the caller is cancelled, *coro* keeps running detached when
+    ``FINISH_REUSABLE_ON_CANCEL`` is on (otherwise it is cancelled too).
+    ``on_abandon()`` is called at that moment — so it can take over state
+    such as held leases before ``finish`` sees them — and returns the
+    follow-up ``then(result)`` that runs once the work ends (``result`` is
+    ``None`` when it failed or was cancelled).
+    """
+    task = asyncio.ensure_future(coro)
+    try:
+        return await asyncio.shield(task)
+    except asyncio.CancelledError:
+        if not FINISH_REUSABLE_ON_CANCEL:
+            task.cancel()
+        then = on_abandon() if on_abandon is not None else None
+        bg = asyncio.ensure_future(_complete_abandoned(task, then))
+        _detached.add(bg)
+        bg.add_done_callback(_detached.discard)
+        raise
+
+
+async def _complete_abandoned(task: asyncio.Future, then) -> None:
+    result = None
+    try:
+        result = await task
+    except asyncio.CancelledError:
+        pass
+    except Exception as exc:  # noqa: BLE001
+        print(f"[graph] ⚠️ detached work failed: {exc}", flush=True)
+    if then is not None:
+        try:
+            await then(result)
+        except Exception as exc:  # noqa: BLE001
+            print(f"[graph] ⚠️ detached follow-up failed: {exc}", flush=True)
+
+
+def safe_retry(
+    fn: Optional[Callable[[SummaryState], Awaitable[SummaryState]]] = None,
+    *,
+    grace: float = 0.0,
+    budget: bool = True,
+):
+    """Try ``fn`` up to `_RETRY` times; on final failure record error.
+
+    Only transient errors (:func:`is_retryable`) are retried, with jittered
+    exponential backoff. LLM admission rejections and open circuits are not
+    retried: the request is marked with ``retry_after`` and every remaining
+    node becomes a no-op.
+
+    Attempts and retry sleeps are bounded by ``st.deadline`` (+ *grace*).
+    The deadline clock starts at the first budgeted node, so document
+    ingest and summarization (``budget=False``) never count against it and
+    are never cut short — a cold document only delays the Q&A loop.
+    Past the deadline the node is skipped or cancelled and ``st.timed_out``
+    is set; without an answer so far that is recorded as an error.
+    Usable bare (``@safe_retry``) or with options (``@safe_retry(grace=…)``).
+    """
+    if fn is None:
+        return lambda f: safe_retry(f, grace=grace, budget=budget)
+
+    def _remaining(st: SummaryState) -> Optional[float]:
+        if not budget:
+            return None
+        if st.deadline is None:
+            st.deadline = time.monotonic() + (st.deadline_sec or REQUEST_DEADLINE_SEC)
+        return st.deadline + grace - time.monotonic()
+
+    def _expire(st: SummaryState) -> SummaryState:
+        annotate(timed_out=True)
+        st.timed_out = True
+        if not st.answer:
+            st.error = f"{fn.__name__}: request deadline exceeded"
+        return st
 
     @wraps(fn)
     async def _wrap(st: SummaryState):  # type: ignore[override]
+        if st.retry_after is not None:
+            return st
         for attempt in range(1, _RETRY + 1):
+            remaining = _remaining(st)
+            if remaining is not None and remaining <= 0:
+                return _expire(st)
             try:
-                st.log.append(f"{fn.__name__} attempt {attempt}")
-                return await fn(st)
+                with span("attempt", n=attempt):
+                    return await asyncio.wait_for(fn(st), timeout=remaining)
+            except (LlmOverloadedError, CircuitOpenError) as exc:
+                annotate(rejected=type(exc).__name__)
+                st.error = str(exc)
+                st.retry_after = exc.retry_after
+                return st
             except Exception as exc:  # noqa: BLE001
+                # 3.11+ 에서 asyncio.TimeoutError 는 내장 TimeoutError (lease 대기 등) 와 같다
+                # → 예산이 실제로 소진됐을 때만 deadline 초과로 처리, 아니면 일반 오류
+                if isinstance(exc, asyncio.TimeoutError) and remaining is not None and _remaining(st) <= 0:
+                    return _expire(st)
+                if not is_retryable(exc):
+                    st.error = f"{fn.__name__} failed: {exc}"
+                    return st
                 if attempt == _RETRY:
                     st.error = f"{fn.__name__} failed after {_RETRY} tries: {exc}"
                     return st
-                await asyncio.sleep(_SLEEP)
+                delay, remaining = backoff_delay(attempt), _remaining(st)
+                await asyncio.sleep(delay if remaining is None else max(0.0, min(delay, remaining)))
         return st  # nothing should reach here
 
     return _wrap
 
 
+def _timed(name: str, fn: Callable[[SummaryState], Awaitable[SummaryState]]):
+    """Run the node inside a ``node:<name>`` trace span and record its
+    latency in the ``summary_node_seconds`` histogram."""
+
+    @wraps(fn)
+    async def _wrap(st: SummaryState):  # type: ignore[override]
+        t0 = time.perf_counter()
+        try:
+            with span(f"node:{name}"):
+                return await fn(st)
+        finally:
+            observe_node(name, time.perf_counter() - t0)
+
+    return _wrap
+
+
 # ---------------------------------------------------------------------------
 # Graph builder
 # ---------------------------------------------------------------------------
@@ -84,100 +230,270 @@ class SummaryGraphBuilder:
         web_search: WebSearchIF,
         llm: LlmChainIF,
         cache: CacheIF,
+        lease: Optional[LeaseIF] = None,
+        judge: Optional[LlmChainIF] = None,
     ):
         self.loader, self.store, self.web_search, self.llm, self.cache = loader, store, web_search, llm, cache
+        self.lease = lease
+        # 판정·라우팅·번역처럼 답이 하나로 정해지는 프롬프트용 (temperature 0 → 응답 캐시 대상)
+        self.judge = judge if judge is not None else llm
+        self.grader = ChunkGrader(self.judge)
+
+    # ------------------------------------------------------------------
+    # Distributed lease helpers
+    # ------------------------------------------------------------------
+    async def _hold(self, st: SummaryState, name: str, done: Callable[[], Awaitable[bool]]) -> bool:
+        """Acquire lease *name* for this request.
+
+        Returns ``True`` when this request should do the work. Returns
+        ``False`` when another replica already finished it (``done()``), in
+        which case the caller reads the shared result instead.
+        """
+        if self.lease is None or name in st.leases:
+            return True
+        while True:
+            token = await self.lease.acquire(name)
+            if token:
+                if await done():  # 획득 직전에 다른 레플리카가 끝냈을 수 있음
+                    await self.lease.release(name, token)
+                    return False
+                st.leases[name] = token
+                return True
+            if not await self.lease.wait(name):
+                raise TimeoutError(f"lease {name} wait timed out")
+            if await done():
+                return False
+            # 보유자가 결과 없이 종료(실패/만료) → 재획득 시도
+
+    async def _release(self, st: SummaryState, name: str) -> None:
+        token = st.leases.pop(name, None)
+        if self.lease is not None and token:
+            await self.lease.release(name, token)
+
+    def _hand_off(self, st: SummaryState, name: str) -> Callable[[], Awaitable[None]]:
+        """Take lease *name* away from the request and return its release callback.
+
+        Used when work outlives the request: ``finish`` no longer sees the
+        lease, so only the detached work releases it once it is done.
+        """
+        token = st.leases.pop(name, None)
+
+        async def release() -> None:
+            if self.lease is not None and token:
+                await self.lease.release(name, token)
+
+        return release
+
+    # ------------------------------------------------------------------
+    # Document summary (compute once, reuse everywhere)
+    # ------------------------------------------------------------------
+    async def _ensure_summary(self, st: SummaryState) -> None:
+        """Fill ``st.summary`` with the document summary, computing it at most once.
+
+        Order: already in state (refine loop) → summary cache → LLM
+        map-reduce under the ``summary:<file_id>`` lease, persisted to the
+        cache so every later Q&A request and SUMMARY_ALL call reuses it.
+        """
+        if st.summary:
+            return
+        name = f"summary:{st.file_id}"
+
+        async def summarized() -> bool:
+            return self.cache.exists_summary(st.file_id)
+
+        if await summarized() or not await self._hold(st, name, summarized):
+            st.summary = self.cache.get_summary(st.file_id)  # 캐시 / 다른 레플리카 결과 재사용
+            return
+        # lease 는 계산 작업이 직접 해제 (요청이 먼저 끝나도 finish 가 풀지 않도록)
+        release = self._hand_off(st, name)
+
+        async def compute() -> str:
+            try:
+                chunks = st.chunks
+                if chunks is None:
+                    chunks = await self.store.get_all(st.file_id)  # type: ignore[arg-type]
+                summary = await self.llm.summarize(chunks, st.file_id)  # type: ignore[arg-type]
+                self.cache.set_summary(st.file_id, summary)
+                return summary
+            finally:
+                await release()
+
+        # 요청이 취소돼도 요약은 캐시에 남겨 다음 요청이 재사용
+        st.summary = await _shielded(compute())
+
+    async def _ensure_context_summary(self, st: SummaryState) -> None:
+        """Context summary for Q&A prompts (router / grade / verify / refine).
+
+        Prefers the LLM summary when one is cached; otherwise uses the
+        LLM-free extractive abstract built from the stored chunk embeddings,
+        and only falls back to map-reduce when no abstract can be built.
+        """
+        if st.summary:
+            return
+        if self.cache.exists_summary(st.file_id):
+            st.summary = self.cache.get_summary(st.file_id)
+            return
+        abstract = self.cache.get_abstract(st.file_id)
+        count_cache("abstract", bool(abstract))
+        abstract = abstract or await self._build_abstract(st.file_id)
+        if abstract:
+            st.summary = abstract
+            return
+        await self._ensure_summary(st)
+
+    async def _store_chunks(self, file_id: str, chunks: List[TextChunk]) -> None:
+        """Embed and store *chunks*, then build the extractive abstract."""
+        await self.store.upsert(chunks, file_id)  # type: ignore[arg-type]
+        # 적재 직후 LLM 없이 추출 초록 생성 (Q&A 문맥용)
+        try:
+            await self._build_abstract(file_id)
+        except Exception as exc:  # noqa: BLE001
+            print(f"[embed] ⚠️ abstract build failed for {file_id}: {exc}", flush=True)
+
+    async def _build_abstract(self, file_id: str) -> Optional[str]:
+        """TextRank abstract over the stored chunk embeddings, persisted to the cache."""
+        texts, embeddings = await self.store.get_all_with_embeddings(file_id)
+        if not texts or len(embeddings) != len(texts):
+            return None
+        # n² 유사도 행렬 + power iteration → 이벤트 루프를 막지 않도록 작업 스레드에서
+        abstract = await asyncio.to_thread(extractive_abstract, texts, embeddings)
+        if abstract:
+            self.cache.set_abstract(file_id, abstract)
+        return abstract or None
 
     # ------------------------------------------------------------------
     def build(self):
         g = StateGraph(SummaryState)
 
         # 0. Entry ------------------------------------------------------
+        @safe_retry(budget=False)
         async def entry_router(st: SummaryState):
             st.is_summary = st.query.strip().upper() == "SUMMARY_ALL"
-            if st.is_summary and self.cache.exists_summary(st.file_id):
-                st.summary = self.cache.get_summary(st.file_id)
-                st.cached = True
+            if st.is_summary:
+                if self.cache.exists_summary(st.file_id):
+                    st.summary = self.cache.get_summary(st.file_id)
+                    st.cached = True
+                count_cache("summary", st.cached)
             st.embedded = await self.store.has_chunks(st.file_id)  # type: ignore[arg-type]
+
+            # 일반 질의: 임베딩 유사도 기반 답변 캐시 조회
+            if not st.is_summary:
+                st.origin_query = st.query
+                try:
+                    st.query_embedding = await self.store.embed_query(st.query)
+                    if st.embedded:
+                        answer = self.cache.get_answer(st.file_id, st.query_embedding)
+                        count_cache("answer", bool(answer))
+                        if answer:
+                            st.answer = answer
+                            st.cached = True
+                except Exception as exc:  # noqa: BLE001
+                    # 답변 캐시는 최적화일 뿐 — 임베딩·Redis 장애는 캐시 miss 로 처리
+                    print(f"[entry] ⚠️ answer cache lookup failed for {st.file_id}: {exc}", flush=True)
+                    st.query_embedding = None
             return st
 
         def entry_branch(st: SummaryState) -> str:
             if st.error:
                 return "finish"
-            if st.is_summary:
-                if st.cached:
-                    return "translate"
-                return "RAG_router" if st.embedded else "load"
-            return "RAG_router" if st.embedded else "load"
+            if st.cached:
+                return "translate"
+            if not st.embedded:
+                return "load"
+            # SUMMARY_ALL 은 웹 검색 판단이 필요 없으므로 곧장 요약
+            return "summarize" if st.is_summary else "RAG_router"
 
-        g.add_node("entry", entry_router)
+        g.add_node("entry", _timed("entry", entry_router))
 
         # 1. Load PDF ---------------------------------------------------
-        @safe_retry
+        @safe_retry(budget=False)
         async def load_pdf(st: SummaryState):
-            st.chunks = await self.loader.load(st.url)
+            async def ingested() -> bool:
+                return await self.store.has_chunks(st.file_id)  # type: ignore[arg-type]
+
+            if not await self._hold(st, f"ingest:{st.file_id}", ingested):
+                st.embedded = True  # 다른 레플리카가 적재 완료 → 벡터 재사용
+                return st
+
+            def abandoned():
+                # 요청은 떠났지만 다운로드·OCR 결과는 마저 적재해 둔다 (lease 도 함께 인계)
+                release = self._hand_off(st, f"ingest:{st.file_id}")
+
+                async def then(chunks) -> None:
+                    try:
+                        if chunks:
+                            await self._store_chunks(st.file_id, chunks)
+                    finally:
+                        await release()
+
+                return then
+
+            st.chunks = await _shielded(self.loader.load(st.url), abandoned)
             return st
 
-        g.add_node("load", load_pdf)
+        g.add_node("load", _timed("load", load_pdf))
 
         # 2. Embed ------------------------------------------------------
-        @safe_retry
+        @safe_retry(budget=False)
         async def embed(st: SummaryState):
-            if st.chunks is None:
-                raise ValueError("chunks is None — cannot embed")
             if not st.embedded:
-                await self.store.upsert(st.chunks, st.file_id)  # type: ignore[arg-type]
+                if st.chunks is None:
+                    raise ValueError("chunks is None — cannot embed")
+
+                def abandoned():
+                    release = self._hand_off(st, f"ingest:{st.file_id}")
+                    return lambda _: release()
+
+                await _shielded(self._store_chunks(st.file_id, st.chunks), abandoned)
                 st.embedded = True
+            await self._release(st, f"ingest:{st.file_id}")
             return st
 
-        g.add_node("embed", embed)
+        g.add_node("embed", _timed("embed", embed))
 
         # 3-S. Summarize -----------------------------------------------
-        @safe_retry
+        @safe_retry(budget=False)
         async def summarize(st: SummaryState):
-            if st.chunks is None:
-                st.chunks = await self.store.get_all(st.file_id)  # type: ignore[arg-type]
-            st.summary = await self.llm.summarize(st.chunks)  # type: ignore[arg-type]
+            await self._ensure_summary(st)
             return st
 
-        g.add_node("summarize", summarize)
+        g.add_node("summarize", _timed("summarize", summarize))
 
         # 3-Q. Retrieve -------------------------------------------------
         @safe_retry
         async def RAG_router(st: SummaryState):
-            if st.cached:
-                st.summary = self.cache.get_summary(st.file_id)
-            else:
-                st.chunks = await self.store.get_all(st.file_id)
-                st.summary = await self.llm.summarize(st.chunks)
-                
-            prompt = """
-                You are a helpful assistant that can determine if the answer of the query need extra information from the web.
-                If the answer need extra information from the web, return 'true'.
-                If the answer does not need extra information from the web, return 'false'.
-                Query: {query}
-                Summary: {summary}
-                """
-            prompt = prompt.format(query=st.query, summary=st.summary)
-            result = await self.llm.execute(prompt)
+            # 문서 요약(없으면 추출 초록)은 문서당 한 번만 만들고 refine 루프에서도 재사용
+            await self._ensure_context_summary(st)
+
+            # 질의와 문서 청크의 최대 유사도로 먼저 판단, 애매할 때만 LLM 호출
+            if WEB_ROUTER_MODE != "llm":
+                hits = await self.store.similarity_search_with_scores(st.file_id, st.query, k=1)
+                st.route_score = max((score for _, score in hits), default=None)
+                st.is_web = route_by_score(st.route_score)
+                if st.is_web is not None:
+                    return st
+
+            prompt = ROUTER_PROMPT.format(query=st.query, summary=st.summary)
+            result = await self.judge.execute(prompt)
             
             st.is_web = "true" in result.lower()
             
             return st
         
-        g.add_node("RAG_router", RAG_router)
+        g.add_node("RAG_router", _timed("RAG_router", RAG_router))
         
         def post_RAG_router(st: SummaryState) -> str:
             if st.error:
                 return "finish"
-            if st.is_summary:
-                return "summarize"
+            if st.timed_out:
+                return "translate"  # refine 루프 중 마감 → 이전 답변 반환
             return "retrieve_web" if st.is_web else "retrieve_vector"
     
     
         g.add_conditional_edges("RAG_router", post_RAG_router, {
             "retrieve_web":  "retrieve_web",
             "retrieve_vector":  "retrieve_vector",
-            "summarize":    "summarize",
+            "translate": "translate",
             "finish":    "finish",
         })
         
@@ -190,14 +506,14 @@ class SummaryGraphBuilder:
             
             return st
         
-        g.add_node("retrieve_web", retrieve_web)
+        g.add_node("retrieve_web", _timed("retrieve_web", retrieve_web))
         
         @safe_retry
         async def retrieve_vector(st: SummaryState):
             st.retrieved = await self.store.similarity_search(st.file_id, st.query, k=8)
             return st
         
-        g.add_node("retrieve_vector", retrieve_vector)
+        g.add_node("retrieve_vector", _timed("retrieve_vector", retrieve_vector))
         
         g.add_edge("retrieve_web", "grade")
         g.add_edge("retrieve_vector", "grade")
@@ -205,37 +521,25 @@ class SummaryGraphBuilder:
         @safe_retry
         async def grade(st: SummaryState):
             # 요약된 본문, Retrieved된 결과를 보고 문맥상 필요한지 확인
-            # 필요하다면 추가적인 정보를 찾아야 한다면 'true'를 반환
-            # 필요하지 않다면 'false'를 반환
-            
-            good_chunks = []
-            for chunk in st.retrieved:
-                prompt = """
-                You are a helpful assistant that can grade the retrieved information.
-                If the retrieved information is good, return 'good'.
-                If the retrieved information is bad, return 'bad'.
-                Query: {query}
-                Summary: {summary}
-                Retrieved: {retrieved}
-                """
-                prompt = prompt.format(query=st.query, summary=st.summary, retrieved=chunk)
-                result = await self.llm.execute(prompt)
-                if "good" in result.lower():
-                    good_chunks.append(chunk)
-            
-            st.retrieved = good_chunks
+            # 'good' 판정을 받은 청크만 남긴다 (병렬/배치 채점은 ChunkGrader 참고)
+            st.retrieved = await self.grader.grade(
+                st.query, st.summary, st.retrieved or [], origin_query=st.origin_query
+            )
             return st
         
-        g.add_node("grade", grade)
+        g.add_node("grade", _timed("grade", grade))
         
         def post_grade(st: SummaryState) -> str:
             if st.error:
                 return "finish"
+            if st.timed_out:
+                return "translate"
             else:
                 return "generate"
         
         g.add_conditional_edges("grade", post_grade, {
             "generate": "generate",
+            "translate": "translate",
             "finish": "finish",
         })
         
@@ -250,13 +554,16 @@ class SummaryGraphBuilder:
             st.answer = await self.llm.execute(prompt)
             return st
         
-        g.add_node("generate", generate)
+        g.add_node("generate", _timed("generate", generate))
         
         def post_generate(st: SummaryState) -> str:
-            return "finish" if st.error else "verify"
+            if st.error:
+                return "finish"
+            return "translate" if st.timed_out else "verify"
         
         g.add_conditional_edges("generate", post_generate, {
             "verify": "verify",
+            "translate": "translate",
             "finish": "finish",
         })
         
@@ -284,18 +591,21 @@ class SummaryGraphBuilder:
             Return 'good' if the answer meets all criteria, otherwise return 'bad'. Do not return anything else.
             """
             prompt = prompt.format(query=st.query, summary=st.summary, retrieved=st.retrieved, answer=st.answer)
-            result = await self.llm.execute(prompt)
+            result = await self.judge.execute(prompt)
             st.is_good = "good" in result.lower()
             return st
         
-        g.add_node("verify", verify)
+        g.add_node("verify", _timed("verify", verify))
         
         def post_verify(st: SummaryState) -> str:
             if st.error:
                 return "finish"
+            if st.timed_out:
+                return "translate"
             if not st.is_good:
-                return "refine"
-            return "save" if st.is_summary else "translate"
+                # 루프 예산 소진 → 검증은 못 받았지만 마지막 답변을 반환 (캐시 저장 X)
+                return "refine" if st.loops < MAX_REFINE_LOOPS else "translate"
+            return "save"
         
         g.add_conditional_edges("verify", post_verify, {
             "save": "save",
@@ -323,6 +633,7 @@ class SummaryGraphBuilder:
                 answer=st.answer
             )
             result = await self.llm.execute(prompt)
+            st.loops += 1
             # 관련 없는 경우
             if "not related to the document content" in result:
                 st.answer = result
@@ -331,11 +642,13 @@ class SummaryGraphBuilder:
             st.query = result
             return st
         
-        g.add_node("refine", refine)
+        g.add_node("refine", _timed("refine", refine))
         
         def post_refine(st: SummaryState) -> str:
             if st.error:
                 return "finish"
+            if st.timed_out:
+                return "translate"
             if "not related to the document content" in st.answer:
                 return "translate"
             else:
@@ -346,38 +659,64 @@ class SummaryGraphBuilder:
             "finish": "finish",
         })
         
-        # 5. Save summary ----------------------------------------------
+        # 5. Save answer -----------------------------------------------
         async def save_summary(st: SummaryState):
-            if st.is_summary and not st.cached and st.summary:
-                self.cache.set_summary(st.file_id, st.summary)
+            # 문서 요약은 _ensure_summary 에서 이미 저장됨
+            if not st.is_summary and not st.cached and st.answer and st.query_embedding:
+                self.cache.set_answer(st.file_id, st.origin_query, st.query_embedding, st.answer)
             return st
 
-        g.add_node("save", save_summary)
+        g.add_node("save", _timed("save", save_summary))
 
-        @safe_retry
+        @safe_retry(grace=TRANSLATE_GRACE_SEC)
         async def translate(st: SummaryState):
             if st.is_summary:
                 st.answer = self.cache.get_summary(st.file_id)
+            # 언어 미지정(사전 적재) → 원문 그대로
+            if not st.lang.strip():
+                return st
+
+            # 같은 원문·언어의 번역이 캐시에 있으면 LLM 호출 생략
+            source = st.answer
+            if not source:
+                raise ValueError("answer is empty — nothing to translate")
+            # 이미 요청 언어로 작성된 답변이면 번역 불필요
+            if is_same_language(source, st.lang):
+                st.answer = source
+                return st
+            translated = self.cache.get_translation(st.file_id, source, st.lang)
+            count_cache("translation", bool(translated))
+            if translated:
+                st.answer = translated
+                return st
             
             prompt = """
             You are a helpful assistant that can translate the answer to User language.
             User language: {lang}
             Answer: {answer}
             """
-            prompt = prompt.format(lang=st.lang, answer=st.answer)
-            st.answer = await self.llm.execute(prompt)
+            prompt = prompt.format(lang=st.lang, answer=source)
+            st.answer = await self.judge.execute(prompt, priority=PRIORITY_TRANSLATE)
+            self.cache.set_translation(st.file_id, source, st.lang, st.answer)
             return st
 
 
         # 6. Translate & finish ----------------------------------------
-        g.add_node("translate", translate)
-        g.add_node("finish",    lambda st: st)
+        g.add_node("translate", _timed("translate", translate))
+        async def finish(st: SummaryState):
+            # 오류 등으로 남은 lease 해제 (대기 중인 레플리카가 이어받도록)
+            for name in list(st.leases):
+                await self._release(st, name)
+            return st
+
+        g.add_node("finish",    _timed("finish", finish))
 
         # Routing -------------------------------------------------------
         g.set_entry_point("entry")
 
         g.add_conditional_edges("entry", entry_branch, {
             "translate": "translate",
+            "summarize": "summarize",
             "RAG_router":  "RAG_router",
             "load":      "load",
             "finish":    "finish",
@@ -392,9 +731,12 @@ class SummaryGraphBuilder:
         })
 
         def post_embed(st: SummaryState) -> str:
-            return "finish" if st.error else "RAG_router"
+            if st.error:
+                return "finish"
+            return "summarize" if st.is_summary else "RAG_router"
 
         g.add_conditional_edges("embed", post_embed, {
+            "summarize": "summarize",
             "RAG_router":  "RAG_router",
             "finish":    "finish",
         })
@@ -1,12 +1,28 @@
 # app/service/summary_service_graph.py
+import asyncio
+import json
+import os
+import time
+from typing import AsyncIterator, Dict, Optional, Tuple
+
 from app.infra.pdf_loader import PdfLoader
 from app.infra.vector_store import VectorStore
 from app.infra.llm_engine import LlmEngine
 from app.infra.cache_store import CacheStore          
 from app.infra.web_search import WebSearch
-from app.domain.interfaces import CacheIF
+from app.infra.lease_store import LeaseStore
+from app.domain.interfaces import CacheIF, LlmOverloadedError
+from app.utils.lang_detect import is_same_language
+from app.utils.metrics import count_cache, requests_cancelled, requests_in_flight
+from app.utils.tracing import start_trace
 from .summary_graph_builder import SummaryGraphBuilder, SummaryState
 
+# 토큰 단위로 스트리밍할 노드 (나머지 노드는 진행 이벤트만 전송)
+_TOKEN_NODES = {"generate", "translate"}
+
+# 캐시된 SUMMARY_ALL(번역 포함)은 그래프 없이 Redis 조회(왕복 2회)만으로 응답
+SUMMARY_FAST_PATH = os.getenv("SUMMARY_FAST_PATH", "1") == "1"
+
 # ──────────────────────────────────────────────
 # create graph only once at compile time
 # ──────────────────────────────────────────────
@@ -16,6 +32,8 @@ _builder_singleton = SummaryGraphBuilder(
     WebSearch(),
     LlmEngine(),
     CacheStore(),
+    LeaseStore(),
+    judge=LlmEngine(temperature=0),  # 라우터·검증·번역·청크 판정 (응답 캐시 사용)
 )
 _compiled_graph = _builder_singleton.build()
 
@@ -25,23 +43,180 @@ class SummaryServiceGraph:
 
     def __init__(self):
         self.graph = _compiled_graph   # compiled graph shared
+        self.cache: CacheIF = _builder_singleton.cache
+        self.fast_path = SUMMARY_FAST_PATH
+        # (file_id, query, lang) → 진행 중인 그래프 실행 (single-flight)
+        self._inflight: Dict[Tuple[str, str, str], asyncio.Task] = {}
+        self._waiters: Dict[asyncio.Task, int] = {}  # 실행별 대기 중인 호출자 수
 
     # ------------------------------------------------------
     # Public API
     # ------------------------------------------------------
-    async def generate(self, file_id: str, pdf_url: str, query: str, lang: str):
-        """Run the graph and return a dict tailored to the caller."""
-        result = await self.graph.ainvoke(
-            SummaryState(file_id=file_id, url=pdf_url, query=query, lang=lang)
-        )
+    async def generate(
+        self,
+        file_id: str,
+        pdf_url: str,
+        query: str,
+        lang: str,
+        trace: bool = False,
+        deadline_sec: Optional[float] = None,
+    ):
+        """Run the graph and return a dict tailored to the caller.
+
+        Concurrent identical (file_id, query, lang) requests attach to the
+        execution already in flight instead of starting another one. When
+        the last attached caller is cancelled (client disconnect) the
+        execution is cancelled too.
+        With ``trace=True`` the body includes the span waterfall of that execution.
+        ``deadline_sec`` overrides the Q&A budget ``REQUEST_DEADLINE_SEC`` for a
+        new execution (background jobs); an execution already in flight keeps
+        its own. Ingest and summarization are never bounded by it.
+        A cached ``SUMMARY_ALL`` is answered without running the graph
+        (see :meth:`_cached_summary_body`) unless a trace is requested.
+        """
+        if self.fast_path and not trace and _is_summary_query(query):
+            body = self._cached_summary_body(file_id, lang)
+            if body is not None:
+                return body
+
+        key = (file_id, query.strip(), lang.strip().lower())
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._run(file_id, pdf_url, query, lang, deadline_sec))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _t: self._inflight.pop(key, None))
+
+        # shield: 한 호출자가 취소돼도 다른 호출자가 남아 있으면 공유 실행은 계속된다
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        requests_in_flight["summary"].inc()
+        try:
+            body = await asyncio.shield(task)
+        finally:
+            requests_in_flight["summary"].dec()
+            left = self._waiters.pop(task) - 1
+            if left:
+                self._waiters[task] = left
+            elif not task.done():
+                requests_cancelled["summary"].inc()
+                task.cancel()  # 마지막 호출자가 떠남 → LLM·Chroma·OCR 작업 중단
+        body = dict(body)
+        if not trace:
+            body.pop("trace", None)
+        return body
+
+    async def stream(
+        self, file_id: str, pdf_url: str, query: str, lang: str, trace: bool = False
+    ) -> AsyncIterator[str]:
+        """Run the graph and yield server-sent events.
+
+        * ``start``  – sent immediately (time-to-first-byte)
+        * ``node``   – a graph node started / finished (with elapsed ms)
+        * ``token``  – incremental LLM output of ``generate`` / ``translate``
+        * ``result`` – the same body :meth:`generate` returns (with ``trace``)
+        * ``error``  – unexpected failure
+
+        Streaming runs are not coalesced with :meth:`generate` callers.
+        When the client disconnects the response cancels this generator,
+        which cancels the graph run.
+        """
+        yield _sse("start", {"file_id": file_id})
+        if self.fast_path and not trace and _is_summary_query(query):
+            body = self._cached_summary_body(file_id, lang)
+            if body is not None:
+                yield _sse("result", body)
+                return
+        started: Dict[str, float] = {}
+        requests_in_flight["stream"].inc()
+        with start_trace("summary.stream", file_id=file_id, lang=lang) as tr:
+            events = self.graph.astream_events(
+                SummaryState(file_id=file_id, url=pdf_url, query=query, lang=lang),
+                version="v2",
+            )
+            try:
+                async for ev in events:
+                    kind = ev["event"]
+                    node = ev.get("metadata", {}).get("langgraph_node")
+
+                    if kind == "on_chat_model_stream" and node in _TOKEN_NODES:
+                        text = getattr(ev["data"].get("chunk"), "content", "")
+                        if text:
+                            yield _sse("token", {"node": node, "text": text})
+                    elif kind == "on_chain_start" and node and ev["name"] == node:
+                        started[ev["run_id"]] = time.perf_counter()
+                        yield _sse("node", {"node": node, "status": "start"})
+                    elif kind == "on_chain_end" and node and ev["name"] == node:
+                        t0 = started.pop(ev["run_id"], None)
+                        elapsed = round((time.perf_counter() - t0) * 1000) if t0 else None
+                        yield _sse("node", {"node": node, "status": "end", "ms": elapsed})
+                    elif kind == "on_chain_end" and not ev.get("parent_ids"):
+                        # 최상위 그래프 종료 → 최종 상태
+                        body = self._to_body(file_id, ev["data"].get("output"))
+                        if trace:
+                            body["trace"] = tr.waterfall()
+                        yield _sse("result", body)
+            except (asyncio.CancelledError, GeneratorExit):
+                # 클라이언트 연결 종료 → 응답이 generator 를 닫음
+                requests_cancelled["stream"].inc()
+                raise
+            except LlmOverloadedError as exc:
+                yield _sse("error", {"error": str(exc), "retry_after": exc.retry_after})
+            except Exception as exc:  # noqa: BLE001
+                yield _sse("error", {"error": str(exc)})
+            finally:
+                await events.aclose()  # 진행 중인 그래프 실행 취소
+                requests_in_flight["stream"].dec()
+
+    async def _run(
+        self, file_id: str, pdf_url: str, query: str, lang: str, deadline_sec: Optional[float] = None
+    ):
+        with start_trace("summary", file_id=file_id, lang=lang) as tr:
+            result = await self.graph.ainvoke(
+                SummaryState(file_id=file_id, url=pdf_url, query=query, lang=lang, deadline_sec=deadline_sec)
+            )
+        body = self._to_body(file_id, result)
+        body["trace"] = tr.waterfall()  # generate() 가 요청한 호출자에게만 전달
+        return body
+
+    def _cached_summary_body(self, file_id: str, lang: str) -> Optional[dict]:
+        """Serve a cached document summary with one cache lookup; ``None`` → run the graph.
+
+        Hits when the summary is cached and either no translation is needed
+        (no ``lang`` / already in ``lang``) or its ``lang`` translation is
+        cached too. Skips state construction, the Chroma ``has_chunks``
+        check and the translate node.
+        """
+        try:
+            summary, translated = self.cache.get_cached_summary(file_id, lang)
+        except Exception:  # noqa: BLE001 — Redis 장애·서킷 open 은 그래프 경로가 처리
+            return None
+        if not summary:
+            return None
+        if translated:
+            count_cache("translation", True)
+            answer = translated
+        elif not lang.strip() or is_same_language(summary, lang):
+            answer = summary
+        else:
+            return None  # 번역이 필요 → 그래프의 translate 노드
+        count_cache("summary", True)
+        return {"file_id": file_id, "cached": True, "summary": answer}
+
+    @staticmethod
+    def _to_body(file_id: str, result) -> dict:
+        if hasattr(result, "model_dump"):
+            result = result.model_dump()
+        result = result or {}
 
         body = {
             "file_id": file_id,
             "cached": result.get("cached", False),
-            "log" : result.get("log"),
         }
+        if result.get("timed_out"):
+            body["timed_out"] = True  # 마감 초과 → 검증·번역이 덜 된 최선 답변
         if result.get("error"):
             body["error"] = result["error"]
+            if result.get("retry_after") is not None:
+                body["retry_after"] = result["retry_after"]
             return body
 
         # `is_summary` is set by the EntryRouter in the graph
@@ -53,6 +228,14 @@ class SummaryServiceGraph:
         return body
 
 
+def _is_summary_query(query: str) -> bool:
+    return query.strip().upper() == "SUMMARY_ALL"
+
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
 # ---- FastAPI DI provider ----
 _service_singleton = SummaryServiceGraph()  
 
@@ -0,0 +1,99 @@
+# app/service/web_router.py
+"""Web-search routing for ``RAG_router``.
+
+``WEB_ROUTER_MODE``:
+
+* ``llm``       – always ask the LLM (original behaviour, default)
+* ``embedding`` – decide from the best query↔chunk relevance score alone
+* ``hybrid``    – decide locally when the score is clearly high/low and fall
+  back to the LLM only inside the ambiguous band ``(LOW, HIGH)``
+
+Thresholds are calibrated offline with ``scripts/calibrate_web_router.py``.
+The defaults below are **uncalibrated placeholders** (no labelled production
+traffic yet), so the router stays on ``llm`` by default: run the script on real
+questions, set ``WEB_ROUTER_THRESHOLD`` / ``WEB_ROUTER_LOW`` / ``WEB_ROUTER_HIGH``
+from its output, then opt in with ``WEB_ROUTER_MODE=hybrid`` (or ``embedding``).
+"""
+from __future__ import annotations
+
+import os
+from typing import List, Optional, Sequence, Tuple
+
+WEB_ROUTER_MODE      = os.getenv("WEB_ROUTER_MODE", "llm")
+# 기본값은 보정 전 임시값 — calibrate_web_router.py 결과로 환경변수를 설정할 것
+WEB_ROUTER_THRESHOLD = float(os.getenv("WEB_ROUTER_THRESHOLD", "0.45"))  # embedding 모드
+WEB_ROUTER_LOW       = float(os.getenv("WEB_ROUTER_LOW", "0.30"))        # 이하 → 웹 검색
+WEB_ROUTER_HIGH      = float(os.getenv("WEB_ROUTER_HIGH", "0.60"))       # 이상 → 문서만
+
+ROUTER_PROMPT = """
+                You are a helpful assistant that can determine if the answer of the query need extra information from the web.
+                If the answer need extra information from the web, return 'true'.
+                If the answer does not need extra information from the web, return 'false'.
+                Query: {query}
+                Summary: {summary}
+                """
+
+
+def route_by_score(
+    score: Optional[float],
+    mode: str = WEB_ROUTER_MODE,
+    *,
+    threshold: float = WEB_ROUTER_THRESHOLD,
+    low: float = WEB_ROUTER_LOW,
+    high: float = WEB_ROUTER_HIGH,
+) -> Optional[bool]:
+    """Return ``True`` (needs web), ``False`` (document is enough) or
+    ``None`` when the LLM should decide."""
+    if mode == "llm" or score is None:
+        return None
+    if mode == "embedding":
+        return score < threshold
+    if score >= high:
+        return False
+    if score <= low:
+        return True
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Offline calibration helpers
+# ---------------------------------------------------------------------------
+def best_threshold(samples: Sequence[Tuple[float, bool]]) -> Tuple[float, float]:
+    """Threshold *t* maximising agreement of ``score < t`` with the LLM label.
+
+    *samples* are ``(max_score, llm_says_web)`` pairs. Returns ``(t, agreement)``.
+    """
+    best = (WEB_ROUTER_THRESHOLD, 0.0)
+    for t in _grid():
+        agree = sum((score < t) == web for score, web in samples) / len(samples)
+        if agree > best[1]:
+            best = (t, agree)
+    return best
+
+
+def best_band(
+    samples: Sequence[Tuple[float, bool]], target: float = 0.95
+) -> Tuple[float, float, float, float]:
+    """Widest-coverage ``(low, high)`` band whose local decisions agree with
+    the LLM at least *target* of the time.
+
+    Returns ``(low, high, agreement, coverage)`` where *coverage* is the
+    share of questions decided without the LLM.
+    """
+    best = (0.0, 1.0, 1.0, 0.0)
+    grid = _grid()
+    n = len(samples)
+    for i, low in enumerate(grid):
+        for high in grid[i:]:
+            decided = [(score <= low, web) for score, web in samples if score <= low or score >= high]
+            if not decided:
+                continue
+            agree = sum(pred == web for pred, web in decided) / len(decided)
+            coverage = len(decided) / n
+            if agree >= target and coverage > best[3]:
+                best = (low, high, agree, coverage)
+    return best
+
+
+def _grid() -> List[float]:
+    return [round(i * 0.01, 2) for i in range(101)]
@@ -0,0 +1,20 @@
+# app/utils/admin_auth.py
+"""관리자 전용 API 보호 — ``X-Admin-Token`` 헤더를 ``ADMIN_TOKEN`` 환경변수와 비교.
+
+``ADMIN_TOKEN`` 이 설정되지 않았으면 관리자 기능은 모두 비활성(403)이다.
+"""
+import hmac
+import os
+from typing import Optional
+
+from fastapi import Header, HTTPException
+
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN", "")
+
+
+def require_admin(x_admin_token: Optional[str] = Header(None)) -> None:
+    """FastAPI Depends 용. 직접 호출해도 된다."""
+    if not ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="admin API is disabled (ADMIN_TOKEN not set)")
+    if not hmac.compare_digest(x_admin_token or "", ADMIN_TOKEN):
+        raise HTTPException(status_code=403, detail="invalid admin token")
@@ -0,0 +1,36 @@
+# app/utils/disconnect.py
+"""클라이언트 연결 종료 감지 — 응답을 받을 사람이 없으면 실행 중인 작업을 취소한다.
+
+일반(비스트리밍) 응답은 핸들러가 끝날 때까지 연결 종료를 알 수 없으므로
+``DISCONNECT_POLL_SEC`` 마다 ``request.is_disconnected()`` 를 확인한다.
+(스트리밍 응답은 Starlette 가 연결 종료 시 generator 를 직접 취소한다.)
+"""
+import asyncio
+import os
+from typing import Awaitable, TypeVar
+
+from fastapi import HTTPException, Request
+
+DISCONNECT_POLL_SEC = float(os.getenv("DISCONNECT_POLL_SEC", "0.5"))
+
+# nginx 관례: 클라이언트가 응답 전에 연결을 닫음
+CLIENT_CLOSED_REQUEST = 499
+
+T = TypeVar("T")
+
+
+async def cancel_on_disconnect(request: Request, work: Awaitable[T], poll: float = DISCONNECT_POLL_SEC) -> T:
+    """Await *work*, cancelling it if the client goes away first."""
+    task = asyncio.ensure_future(work)
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=poll)
+            if done:
+                return task.result()
+            if await request.is_disconnected():
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)  # 취소 전파 완료까지 대기
+                raise HTTPException(status_code=CLIENT_CLOSED_REQUEST, detail="client closed request")
+    finally:
+        if not task.done():
+            task.cancel()  # 핸들러 자체가 취소된 경우
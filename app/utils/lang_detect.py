@@ -0,0 +1,109 @@
+# app/utils/lang_detect.py
+"""Local, network-free language identification for the ``translate`` node.
+
+Text is cut into runs of a single script (Hangul, Kana, Han, Latin, Cyrillic)
+and the runs are counted. Counting *runs* instead of characters keeps Korean
+text full of English technical terms ("Transformer 모델의 attention 구조") on
+the Korean side, and also works for Japanese/Chinese, which have no spaces.
+Korean only needs ``LANG_DETECT_KO_SHARE`` of the runs because Korean answers
+routinely embed English terms; every other script needs
+``LANG_DETECT_MIN_SHARE``. Latin-script text is only reported as English when
+enough words are common English function words. Anything uncertain returns
+``None`` so the caller falls back to the LLM translation.
+"""
+from __future__ import annotations
+
+import os
+from typing import Dict, Optional
+
+LANG_DETECT_MIN_SHARE = float(os.getenv("LANG_DETECT_MIN_SHARE", "0.75"))
+LANG_DETECT_KO_SHARE  = float(os.getenv("LANG_DETECT_KO_SHARE", "0.5"))
+
+_ALIASES: Dict[str, str] = {
+    "ko": "ko", "kor": "ko", "kr": "ko", "korean": "ko", "한국어": "ko", "한글": "ko",
+    "en": "en", "eng": "en", "english": "en", "영어": "en",
+    "ja": "ja", "jp": "ja", "jpn": "ja", "japanese": "ja", "日本語": "ja", "일본어": "ja",
+    "zh": "zh", "cn": "zh", "chinese": "zh", "中文": "zh", "중국어": "zh",
+    "ru": "ru", "russian": "ru", "русский": "ru",
+}
+
+_EN_FUNCTION_WORDS = frozenset(
+    "the a an and or of to in on for with is are was were be been it this that these those "
+    "as by from at not can will would should which what how why who has have had do does "
+    "its their they we you he she our your but if than then there so such also into".split()
+)
+
+
+def normalize_lang(lang: str) -> str:
+    """``"Korean"`` / ``"ko-KR"`` / ``"한국어"`` → ``"ko"``."""
+    key = lang.strip().lower()
+    if key in _ALIASES:
+        return _ALIASES[key]
+    return _ALIASES.get(key.replace("_", "-").split("-")[0], key)
+
+
+def _script(ch: str) -> Optional[str]:
+    o = ord(ch)
+    if 0xAC00 <= o <= 0xD7A3 or 0x1100 <= o <= 0x11FF or 0x3130 <= o <= 0x318F:
+        return "hangul"
+    if 0x3040 <= o <= 0x30FF:
+        return "kana"
+    if 0x4E00 <= o <= 0x9FFF or 0x3400 <= o <= 0x4DBF:
+        return "han"
+    if ("a" <= ch <= "z") or ("A" <= ch <= "Z") or 0x00C0 <= o <= 0x024F:
+        return "latin"
+    if 0x0400 <= o <= 0x04FF:
+        return "cyrillic"
+    return None
+
+
+def detect_lang(text: str) -> Optional[str]:
+    """Best-guess ISO code of *text*, or ``None`` when not confident."""
+    counts = {"hangul": 0, "kana": 0, "han": 0, "latin": 0, "cyrillic": 0}
+    en_hits = 0
+    run_script: Optional[str] = None
+    word: list = []
+
+    def _close() -> None:
+        nonlocal en_hits
+        if run_script:
+            counts[run_script] += 1
+            if run_script == "latin" and "".join(word).lower() in _EN_FUNCTION_WORDS:
+                en_hits += 1
+
+    for ch in text:
+        sc = _script(ch)
+        if sc != run_script:
+            _close()
+            run_script, word = sc, []
+        if sc == "latin":
+            word.append(ch)
+    _close()
+
+    total = sum(counts.values())
+    if total == 0:
+        return None
+
+    # 일본어 문장은 한자·가나가 번갈아 나오므로 가나 run 이 충분하면 일본어
+    cjk = counts["kana"] + counts["han"]
+    if cjk / total >= LANG_DETECT_MIN_SHARE and counts["kana"] >= 0.3 * cjk:
+        return "ja"
+
+    if counts["hangul"] / total >= LANG_DETECT_KO_SHARE:
+        return "ko"
+    script, n = max(counts.items(), key=lambda kv: kv[1])
+    if n / total < LANG_DETECT_MIN_SHARE:
+        return None
+    if script == "han":
+        return "zh"
+    if script == "cyrillic":
+        return "ru"
+    if script == "latin" and en_hits / n >= 0.15:
+        return "en"
+    return None
+
+
+def is_same_language(text: str, lang: str) -> bool:
+    """True when *text* is confidently already written in *lang*."""
+    detected = detect_lang(text)
+    return detected is not None and detected == normalize_lang(lang)
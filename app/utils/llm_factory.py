@@ -5,6 +5,8 @@ from langchain_openai import ChatOpenAI
 
 LLM_PROVIDER = os.getenv("LLM_PROVIDER", "openai")
 LLM_MODEL_NAME = os.getenv("LLM_MODEL_NAME")
+LLM_MAX_TOKENS = int(os.getenv("LLM_MAX_TOKENS", "1000"))          # 응답 최대 토큰
+LLM_CONTEXT_TOKENS = int(os.getenv("LLM_CONTEXT_TOKENS", "8192"))  # 모델 컨텍스트 크기
 
 def get_llm_instance(temperature: float = 0.5):
     """OpenAI 또는 HF 모델을 반환."""
@@ -14,8 +16,8 @@ def get_llm_instance(temperature: float = 0.5):
         return ChatOpenAI(
             model_name=LLM_MODEL_NAME,
             temperature=temperature,
-            max_tokens=1000,
+            max_tokens=LLM_MAX_TOKENS,
             openai_api_base="http://localhost:12000/v1",
         )
-    return ChatOpenAI(model_name=LLM_MODEL_NAME, temperature=temperature, max_tokens=1000)
+    return ChatOpenAI(model_name=LLM_MODEL_NAME, temperature=temperature, max_tokens=LLM_MAX_TOKENS)
 
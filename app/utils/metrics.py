@@ -0,0 +1,91 @@
+# app/utils/metrics.py
+"""Prometheus 메트릭 정의 (``GET /metrics`` 로 노출).
+
+라벨 조합은 모두 모듈 로드 시점에 미리 바인딩(child)해 두고, 계측 지점에서는
+``dict`` 조회 + ``observe()/inc()`` 만 수행한다 → 호출당 추가 할당 없음.
+알 수 없는 라벨은 처음 한 번만 바인딩해 캐시한다.
+"""
+from __future__ import annotations
+
+from prometheus_client import Counter, Gauge, Histogram
+
+# 노드·의존성 지연 버킷 (초) — Redis 수 ms ~ map-reduce 수 분
+_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+NODES = (
+    "entry", "load", "embed", "summarize", "RAG_router", "retrieve_web", "retrieve_vector",
+    "grade", "generate", "verify", "refine", "save", "translate", "finish",
+)
+DEPENDENCIES = ("redis", "chroma", "embedding", "llm", "web", "tesseract")
+CACHES = ("summary", "answer", "translation", "abstract", "llm_response")
+LLM_CLASSES = ("interactive", "translate", "bulk")
+
+NODE_SECONDS = Histogram(
+    "summary_node_seconds", "LangGraph node latency", ["node"], buckets=_BUCKETS
+)
+DEPENDENCY_SECONDS = Histogram(
+    "dependency_call_seconds", "External dependency call latency", ["dependency"], buckets=_BUCKETS
+)
+DEPENDENCY_ERRORS = Counter(
+    "dependency_errors_total", "Failed external dependency calls", ["dependency"]
+)
+CACHE_LOOKUPS = Counter(
+    "cache_lookups_total", "Cache lookups by cache and result", ["cache", "result"]
+)
+OCR_PAGES = Counter(
+    "pdf_pages_total", "PDF pages by extraction method", ["method"]   # text / ocr / ocr_failed
+)
+LLM_TOKENS = Counter(
+    "llm_tokens_total", "LLM tokens reported by the server", ["kind"]  # prompt / completion
+)
+REQUESTS_CANCELLED = Counter(
+    "summary_requests_cancelled_total", "Graph runs cancelled because every caller went away", ["endpoint"]
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    "summary_requests_in_flight", "Summary requests being processed", ["endpoint"]
+)
+LLM_INFLIGHT = Gauge("llm_scheduler_inflight", "LLM calls holding a scheduler slot")
+LLM_QUEUE_DEPTH = Gauge("llm_scheduler_queue_depth", "LLM calls waiting for a slot", ["priority"])
+LLM_QUEUE_WAIT = Histogram(
+    "llm_scheduler_wait_seconds", "Time LLM calls waited for a slot", ["priority"], buckets=_BUCKETS
+)
+LLM_REJECTED = Counter("llm_scheduler_rejected_total", "LLM calls rejected by admission control", ["priority"])
+
+
+node_seconds = {n: NODE_SECONDS.labels(n) for n in NODES}
+dependency_seconds = {d: DEPENDENCY_SECONDS.labels(d) for d in DEPENDENCIES}
+dependency_errors = {d: DEPENDENCY_ERRORS.labels(d) for d in DEPENDENCIES}
+cache_hits = {c: CACHE_LOOKUPS.labels(c, "hit") for c in CACHES}
+cache_misses = {c: CACHE_LOOKUPS.labels(c, "miss") for c in CACHES}
+pdf_pages = {m: OCR_PAGES.labels(m) for m in ("text", "ocr", "ocr_failed")}
+llm_tokens = {k: LLM_TOKENS.labels(k) for k in ("prompt", "completion")}
+requests_in_flight = {e: REQUESTS_IN_FLIGHT.labels(e) for e in ("summary", "stream")}
+requests_cancelled = {e: REQUESTS_CANCELLED.labels(e) for e in ("summary", "stream")}
+llm_queue_depth = {c: LLM_QUEUE_DEPTH.labels(c) for c in LLM_CLASSES}
+llm_queue_wait = {c: LLM_QUEUE_WAIT.labels(c) for c in LLM_CLASSES}
+llm_rejected = {c: LLM_REJECTED.labels(c) for c in LLM_CLASSES}
+
+
+def child(children: dict, key: str, metric, *labels):
+    """Pre-bound child for *key*; binds (once) when the label is new."""
+    found = children.get(key)
+    if found is None:
+        found = children[key] = metric.labels(*(labels or (key,)))
+    return found
+
+
+def observe_node(node: str, seconds: float) -> None:
+    child(node_seconds, node, NODE_SECONDS).observe(seconds)
+
+
+def observe_dependency(dependency: str, seconds: float, ok: bool = True) -> None:
+    child(dependency_seconds, dependency, DEPENDENCY_SECONDS).observe(seconds)
+    if not ok:
+        child(dependency_errors, dependency, DEPENDENCY_ERRORS).inc()
+
+
+def count_cache(cache: str, hit: bool) -> None:
+    if hit:
+        child(cache_hits, cache, CACHE_LOOKUPS, cache, "hit").inc()
+    else:
+        child(cache_misses, cache, CACHE_LOOKUPS, cache, "miss").inc()
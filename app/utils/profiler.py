@@ -0,0 +1,102 @@
+# app/utils/profiler.py
+"""관리자용 on-demand 샘플링 프로파일러.
+
+켜져 있는 동안 별도 스레드가 ``PROFILE_INTERVAL_SEC`` 마다 ``sys._current_frames()``
+로 이벤트 루프 스레드와 작업 스레드(OCR 등)의 스택을 찍어 집계하고, 결과를
+flamegraph.pl / speedscope 가 읽는 collapsed-stack 텍스트
+(``thread;outer;…;inner <count>``)로 돌려준다.
+
+꺼져 있을 때는 스레드도 훅도 없다 — 비용 0.
+"""
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+PROFILE_INTERVAL_SEC = float(os.getenv("PROFILE_INTERVAL_SEC", "0.005"))  # 샘플 간격
+PROFILE_MAX_SEC      = float(os.getenv("PROFILE_MAX_SEC", "600"))         # 안전 상한
+_MAX_DEPTH = 128
+
+# 작업 스레드가 일을 기다리는 중이면 샘플에서 제외 (이벤트 루프의 select 대기는 유휴 시간으로 남긴다)
+_IDLE_FILES = ("threading.py", "queue.py", "selectors.py", os.path.join("concurrent", "futures", "thread.py"))
+
+
+class ProfilerBusyError(RuntimeError):
+    """이미 다른 요청을 프로파일링 중"""
+
+
+class SamplingProfiler:
+    def __init__(self, interval: float = PROFILE_INTERVAL_SEC, max_seconds: float = PROFILE_MAX_SEC):
+        self.interval = interval
+        self.max_seconds = max_seconds
+        self.samples: Counter = Counter()
+        self.ticks = 0
+        self.started_at = 0.0
+        self.elapsed = 0.0
+        self._loop_thread = threading.get_ident()  # start() 를 부른 스레드 = 이벤트 루프
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self.started_at = time.monotonic()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.elapsed = time.monotonic() - self.started_at
+
+    def collapsed(self) -> str:
+        return "".join(f"{stack} {n}\n" for stack, n in self.samples.most_common())
+
+    # ------------------------------------------------------------------
+    def _run(self) -> None:
+        me = threading.get_ident()
+        names = {}
+        deadline = self.started_at + self.max_seconds
+        while not self._stop.wait(self.interval) and time.monotonic() < deadline:
+            for tid, frame in sys._current_frames().items():
+                if tid == me:
+                    continue
+                is_loop = tid == self._loop_thread
+                if not is_loop and frame.f_code.co_filename.endswith(_IDLE_FILES):
+                    continue
+                if tid not in names:
+                    names = {t.ident: t.name for t in threading.enumerate()}
+                root = "event-loop" if is_loop else names.get(tid, f"thread-{tid}")
+                self.samples[f"{root};{_collapse(frame)}"] += 1
+            self.ticks += 1
+
+
+def _collapse(frame) -> str:
+    labels = []
+    while frame is not None and len(labels) < _MAX_DEPTH:
+        code = frame.f_code
+        labels.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+        frame = frame.f_back
+    return ";".join(reversed(labels))
+
+
+_active: Optional[SamplingProfiler] = None
+
+
+@contextmanager
+def profiling() -> Iterator[SamplingProfiler]:
+    """Sample all threads while the block runs. One session at a time per process."""
+    global _active
+    if _active is not None:
+        raise ProfilerBusyError("another request is being profiled")
+    prof = _active = SamplingProfiler()
+    prof.start()
+    try:
+        yield prof
+    finally:
+        prof.stop()
+        _active = None
@@ -0,0 +1,250 @@
+# app/utils/resilience.py
+"""그래프 I/O 용 복원력 유틸 — 백오프, 재시도 판별, 서킷 브레이커, hedged 호출.
+
+* :func:`backoff_delay`  – full-jitter 지수 백오프 (``RETRY_BASE_SEC`` · 2^n, 상한 ``RETRY_MAX_SEC``)
+* :func:`is_retryable`   – 타임아웃·연결 오류·408/429/5xx 만 재시도, 4xx·검증 오류는 즉시 실패
+* :class:`CircuitBreaker` – 의존성별(llm / chroma / embedding / redis / web) 연속 실패가
+  ``BREAKER_FAILURES`` 회면 ``BREAKER_RESET_SEC`` 동안 호출 없이 :class:`CircuitOpenError`
+* :func:`hedged`         – 첫 호출이 ``delay`` 안에 끝나지 않으면 두 번째 호출을 띄워 먼저 끝난 쪽 사용
+* :class:`LatencyTracker` – 최근 호출 지연의 p95 (hedge 지연값)
+"""
+from __future__ import annotations
+
+import asyncio
+import inspect
+import os
+import random
+import time
+from collections import deque
+from functools import wraps
+from typing import Awaitable, Callable, Deque, Dict, Optional, TypeVar
+
+from app.utils.metrics import observe_dependency
+from app.utils.tracing import span
+
+RETRY_BASE_SEC    = float(os.getenv("RETRY_BASE_SEC", "0.5"))
+RETRY_MAX_SEC     = float(os.getenv("RETRY_MAX_SEC", "8"))
+BREAKER_FAILURES  = int(os.getenv("BREAKER_FAILURES", "5"))      # 연속 실패 → open
+BREAKER_RESET_SEC = float(os.getenv("BREAKER_RESET_SEC", "30"))  # open 유지 시간 → half-open
+
+T = TypeVar("T")
+
+# 예외 클래스 이름(MRO) 기준 판별 — openai / httpx / redis / chromadb 를 import 하지 않기 위함
+_RETRYABLE_NAMES = {
+    "TimeoutError", "ConnectionError", "APIConnectionError", "APITimeoutError",
+    "RateLimitError", "InternalServerError", "ServiceUnavailableError",
+    "ConnectError", "ReadTimeout", "ConnectTimeout", "RemoteProtocolError", "BusyLoadingError",
+    "TimeoutException", "NetworkError", "ReadError", "WriteError", "PoolTimeout", "WriteTimeout",
+}
+_RETRYABLE_STATUS = {408, 425, 429}
+
+
+class CircuitOpenError(RuntimeError):
+    """의존성 서킷이 열려 있어 호출하지 않음 — ``retry_after`` 초 후 재시도"""
+
+    def __init__(self, name: str, retry_after: int):
+        super().__init__(f"{name} circuit is open, retry after {retry_after}s")
+        self.name = name
+        self.retry_after = retry_after
+
+
+def backoff_delay(attempt: int, base: float = RETRY_BASE_SEC, cap: float = RETRY_MAX_SEC) -> float:
+    """Full-jitter delay before retry number *attempt* (1-based)."""
+    return random.uniform(0, min(cap, base * (2 ** (attempt - 1))))
+
+
+def _status_code(exc: BaseException) -> Optional[int]:
+    code = getattr(exc, "status_code", None)
+    if code is None:
+        code = getattr(getattr(exc, "response", None), "status_code", None)
+    return code if isinstance(code, int) else None
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """True for transient failures worth retrying (timeouts, connection errors, 408/429/5xx).
+
+    Allow-list: anything not recognised as transient (programming errors,
+    validation errors, unknown exception types) is treated as permanent, so
+    it is neither retried nor counted against a circuit breaker.
+    """
+    if isinstance(exc, CircuitOpenError):
+        return False
+    code = _status_code(exc)
+    if code is not None:
+        return code in _RETRYABLE_STATUS or code >= 500
+    if isinstance(exc, (asyncio.TimeoutError, TimeoutError, ConnectionError)):
+        return True
+    return any(cls.__name__ in _RETRYABLE_NAMES for cls in type(exc).__mro__)
+
+
+class CircuitBreaker:
+    """closed → (연속 실패) → open → (reset_timeout 경과) → half-open(시험 호출 1건) → closed/open"""
+
+    def __init__(self, name: str, failures: int = BREAKER_FAILURES, reset_timeout: float = BREAKER_RESET_SEC):
+        self.name = name
+        self.failure_threshold = max(1, failures)
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False
+        self._rejected = 0
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def before_call(self) -> None:
+        state = self.state
+        if state == "closed":
+            return
+        if state == "half_open" and not self._probing:
+            self._probing = True  # 시험 호출 1건만 통과
+            return
+        self._rejected += 1
+        remaining = self.reset_timeout - (time.monotonic() - self._opened_at)  # type: ignore[operator]
+        raise CircuitOpenError(self.name, max(1, int(remaining + 0.999)))
+
+    def on_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def on_failure(self, exc: BaseException) -> None:
+        if not is_retryable(exc):
+            # 4xx·검증 오류는 의존성 장애가 아님
+            if self._probing:
+                self._probing = False
+            return
+        self._failures += 1
+        if self._probing or self._failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+        self._probing = False
+
+    def on_cancel(self) -> None:
+        self._probing = False  # 시험 호출이 취소됨 → 다음 호출이 다시 시험
+
+    async def call(self, fn: Callable[[], Awaitable[T]]) -> T:
+        self.before_call()
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            self.on_cancel()
+            raise
+        except Exception as exc:  # noqa: BLE001
+            self.on_failure(exc)
+            raise
+        self.on_success()
+        return result
+
+    def stats(self) -> dict:
+        return {
+            "state": self.state,
+            "consecutive_failures": self._failures,
+            "rejected": self._rejected,
+        }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def get_breaker(name: str) -> CircuitBreaker:
+    """프로세스 전역 의존성별 브레이커"""
+    breaker = _breakers.get(name)
+    if breaker is None:
+        breaker = _breakers[name] = CircuitBreaker(name)
+    return breaker
+
+
+def breaker_stats() -> Dict[str, dict]:
+    return {name: b.stats() for name, b in _breakers.items()}
+
+
+def guarded(name: str):
+    """동기/비동기 메서드를 ``name`` 브레이커로 감싸는 데코레이터
+    (호출 지연은 메트릭, ``<name>.<method>`` trace span 으로 기록)"""
+
+    def decorator(fn):
+        breaker = get_breaker(name)
+        label = f"{name}.{fn.__name__}"
+        if inspect.iscoroutinefunction(fn):
+            @wraps(fn)
+            async def _async(*args, **kwargs):
+                breaker.before_call()
+                t0 = time.perf_counter()
+                try:
+                    with span(label):
+                        result = await fn(*args, **kwargs)
+                except asyncio.CancelledError:
+                    breaker.on_cancel()
+                    raise
+                except Exception as exc:  # noqa: BLE001
+                    observe_dependency(name, time.perf_counter() - t0, ok=False)
+                    breaker.on_failure(exc)
+                    raise
+                observe_dependency(name, time.perf_counter() - t0)
+                breaker.on_success()
+                return result
+            return _async
+
+        @wraps(fn)
+        def _sync(*args, **kwargs):
+            breaker.before_call()
+            t0 = time.perf_counter()
+            try:
+                with span(label):
+                    result = fn(*args, **kwargs)
+            except Exception as exc:  # noqa: BLE001
+                observe_dependency(name, time.perf_counter() - t0, ok=False)
+                breaker.on_failure(exc)
+                raise
+            observe_dependency(name, time.perf_counter() - t0)
+            breaker.on_success()
+            return result
+        return _sync
+
+    return decorator
+
+
+class LatencyTracker:
+    """최근 ``window`` 건 성공 호출 지연의 p95"""
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self._samples: Deque[float] = deque(maxlen=window)
+        self.min_samples = min_samples
+
+    def observe(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def p95(self) -> Optional[float]:
+        if len(self._samples) < self.min_samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+
+async def hedged(fn: Callable[[], Awaitable[T]], delay: float) -> T:
+    """Run ``fn()``; if it has not finished after *delay* seconds start a second
+    ``fn()`` and return whichever succeeds first (the other is cancelled)."""
+    tasks = [asyncio.ensure_future(fn())]
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=delay)
+        if not done:
+            tasks.append(asyncio.ensure_future(fn()))
+
+        pending = set(tasks)
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = task.exception()
+        raise error  # type: ignore[misc]
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
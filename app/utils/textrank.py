@@ -0,0 +1,89 @@
+# app/utils/textrank.py
+"""LLM-free extractive abstract — NumPy TextRank over stored chunk embeddings.
+
+청크 임베딩 간 코사인 유사도 그래프에서 PageRank(power iteration)로 중심성을
+구하고, 상위 청크를 문서 순서대로 이어 붙여 짧은 초록을 만든다. 임베딩은
+이미 벡터 DB 에 저장된 것을 재사용하므로 추가 모델 호출이 없다.
+"""
+from __future__ import annotations
+
+import os
+import re
+from typing import List, Sequence
+
+import numpy as np
+
+ABSTRACT_MAX_CHUNKS = int(os.getenv("ABSTRACT_MAX_CHUNKS", "5"))
+ABSTRACT_MAX_CHARS  = int(os.getenv("ABSTRACT_MAX_CHARS", "3000"))
+ABSTRACT_MAX_NODES  = int(os.getenv("ABSTRACT_MAX_NODES", "800"))   # 유사도 행렬 n² 상한 (초과 시 균등 샘플)
+
+_SENTENCE_END = re.compile(r"(?<=[.!?。])\s+")
+
+
+def textrank_scores(
+    embeddings: np.ndarray, damping: float = 0.85, max_iter: int = 100, tol: float = 1e-6
+) -> np.ndarray:
+    """Centrality score per row of *embeddings* (n × d)."""
+    n = embeddings.shape[0]
+    if n == 0:
+        return np.zeros(0, dtype=np.float32)
+    if n == 1:
+        return np.ones(1, dtype=np.float32)
+
+    e = embeddings.astype(np.float32, copy=False)
+    norms = np.linalg.norm(e, axis=1, keepdims=True)
+    e = e / np.where(norms > 0, norms, 1.0)
+
+    sim = e @ e.T
+    np.fill_diagonal(sim, 0.0)
+    np.clip(sim, 0.0, None, out=sim)          # 음의 유사도는 간선으로 쓰지 않음
+
+    # row-stochastic 전이 행렬 (고립 노드는 균등 분포)
+    row_sum = sim.sum(axis=1, keepdims=True)
+    trans = np.divide(sim, row_sum, out=np.full_like(sim, 1.0 / n), where=row_sum > 0)
+
+    rank = np.full(n, 1.0 / n, dtype=np.float32)
+    teleport = (1.0 - damping) / n
+    for _ in range(max_iter):
+        nxt = teleport + damping * (trans.T @ rank)
+        if np.abs(nxt - rank).sum() < tol:
+            return nxt
+        rank = nxt
+    return rank
+
+
+def extractive_abstract(
+    texts: Sequence[str],
+    embeddings: Sequence[Sequence[float]],
+    max_chunks: int = ABSTRACT_MAX_CHUNKS,
+    max_chars: int = ABSTRACT_MAX_CHARS,
+    max_nodes: int = ABSTRACT_MAX_NODES,
+) -> str:
+    """Top-ranked chunks in document order, trimmed to ~*max_chars* total.
+
+    Documents with more than *max_nodes* chunks are ranked over an evenly
+    spaced sample of them, bounding the dense n × n similarity matrix.
+    CPU-bound — call it off the event loop.
+    """
+    if not texts:
+        return ""
+    idx = np.arange(len(texts))
+    if len(idx) > max_nodes:
+        idx = np.unique(np.linspace(0, len(texts) - 1, max_nodes).astype(int))  # 문서 전 구간에서 고르게
+    scores = textrank_scores(np.asarray([embeddings[i] for i in idx], dtype=np.float32))
+    k = min(max_chunks, len(idx))
+    top = idx[np.sort(np.argpartition(-scores, k - 1)[:k])]   # 문서 순서 유지
+
+    budget = max(1, max_chars // k)
+    parts: List[str] = [_trim(texts[i], budget) for i in top]
+    return "\n".join(p for p in parts if p)
+
+
+def _trim(text: str, limit: int) -> str:
+    """Cut *text* at the last sentence boundary before *limit* chars."""
+    text = " ".join(text.split())
+    if len(text) <= limit:
+        return text
+    head = text[:limit]
+    cut = max((m.end() for m in _SENTENCE_END.finditer(head)), default=0)
+    return head[:cut].strip() if cut > limit // 3 else head.strip() + "…"
@@ -0,0 +1,201 @@
+# app/utils/tracing.py
+"""요청 단위 경량 트레이싱 — span(시작/종료 시각, 속성, 부모) 수집 + OTLP/JSON export.
+
+* :func:`start_trace` – 요청(그래프 실행) 하나의 루트 span. 끝나면 ``OTEL_EXPORTER_OTLP_ENDPOINT``
+  가 설정된 경우 ``{endpoint}/v1/traces`` 로 OTLP/JSON 을 비동기 전송한다.
+* :func:`span`        – 현재 span 의 자식 span. contextvar 로 부모를 추적하므로
+  ``asyncio.gather`` / ``create_task`` 로 갈라진 호출도 올바른 부모에 붙는다.
+  진행 중인 trace 가 없으면 아무 것도 하지 않는다.
+* :meth:`Trace.waterfall` – 응답에 실을 수 있는 간단한 워터폴 (``?trace=1``)
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+import secrets
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+import httpx
+
+OTEL_EXPORTER_OTLP_ENDPOINT = os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT", "").rstrip("/")
+OTEL_SERVICE_NAME = os.getenv("OTEL_SERVICE_NAME", "multi-summary-api")
+TRACE_MAX_SPANS = int(os.getenv("TRACE_MAX_SPANS", "500"))  # 요청당 span 상한 (무한 루프 방지)
+
+
+class Span:
+    __slots__ = ("trace", "span_id", "parent_id", "name", "start_ns", "end_ns", "attrs", "error")
+
+    def __init__(self, trace: "Trace", name: str, parent_id: Optional[str], attrs: Dict[str, Any]):
+        self.trace = trace
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.name = name
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attrs = attrs
+        self.error: Optional[str] = None
+
+    def set(self, **attrs: Any) -> None:
+        self.attrs.update(attrs)
+
+    def end(self) -> None:
+        if self.end_ns is None:
+            self.end_ns = time.time_ns()
+
+
+class Trace:
+    def __init__(self, name: str, attrs: Dict[str, Any]):
+        self.trace_id = secrets.token_hex(16)
+        self.spans: List[Span] = []
+        self.dropped = 0
+        self.root = self._add(name, None, attrs)
+
+    def _add(self, name: str, parent_id: Optional[str], attrs: Dict[str, Any]) -> Optional[Span]:
+        if len(self.spans) >= TRACE_MAX_SPANS:
+            self.dropped += 1
+            return None
+        s = Span(self, name, parent_id, attrs)
+        self.spans.append(s)
+        return s
+
+    def waterfall(self) -> dict:
+        """Compact view: one row per span, offsets in ms from the root start."""
+        t0 = self.root.start_ns
+        depth: Dict[Optional[str], int] = {None: -1}
+        rows = []
+        for s in sorted(self.spans, key=lambda s: s.start_ns):
+            depth[s.span_id] = depth.get(s.parent_id, -1) + 1
+            end = s.end_ns if s.end_ns is not None else time.time_ns()
+            row = {
+                "name": s.name,
+                "depth": depth[s.span_id],
+                "start_ms": round((s.start_ns - t0) / 1e6, 1),
+                "ms": round((end - s.start_ns) / 1e6, 1),
+            }
+            if s.attrs:
+                row["attrs"] = s.attrs
+            if s.error:
+                row["error"] = s.error
+            rows.append(row)
+        return {"trace_id": self.trace_id, "dropped": self.dropped, "spans": rows}
+
+    def to_otlp(self) -> dict:
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": [_kv("service.name", OTEL_SERVICE_NAME)]},
+                "scopeSpans": [{
+                    "scope": {"name": "app.utils.tracing"},
+                    "spans": [
+                        {
+                            "traceId": self.trace_id,
+                            "spanId": s.span_id,
+                            **({"parentSpanId": s.parent_id} if s.parent_id else {}),
+                            "name": s.name,
+                            "kind": 1,  # INTERNAL
+                            "startTimeUnixNano": str(s.start_ns),
+                            "endTimeUnixNano": str(s.end_ns or s.start_ns),
+                            "attributes": [_kv(k, v) for k, v in s.attrs.items()],
+                            "status": {"code": 2, "message": s.error} if s.error else {"code": 1},
+                        }
+                        for s in self.spans
+                    ],
+                }],
+            }]
+        }
+
+
+_current: ContextVar[Optional[Span]] = ContextVar("trace_span", default=None)
+
+
+def current_trace() -> Optional[Trace]:
+    s = _current.get()
+    return s.trace if s is not None else None
+
+
+def annotate(**attrs: Any) -> None:
+    """Add attributes to the current span (no-op outside a trace)."""
+    s = _current.get()
+    if s is not None:
+        s.attrs.update(attrs)
+
+
+@contextmanager
+def start_trace(name: str, **attrs: Any) -> Iterator[Trace]:
+    """Root span of one request; exported when the block exits."""
+    trace = Trace(name, attrs)
+    token = _current.set(trace.root)
+    try:
+        yield trace
+    except BaseException as exc:
+        trace.root.error = repr(exc)
+        raise
+    finally:
+        try:
+            _current.reset(token)
+        except ValueError:
+            pass  # 스트리밍 응답 generator 가 다른 context 에서 닫힌 경우
+        trace.root.end()
+        if OTEL_EXPORTER_OTLP_ENDPOINT:
+            _export(trace)
+
+
+@contextmanager
+def span(name: str, **attrs: Any) -> Iterator[Optional[Span]]:
+    """Child span of the current span (no-op outside a trace)."""
+    parent = _current.get()
+    if parent is None:
+        yield None
+        return
+    s = parent.trace._add(name, parent.span_id, attrs)
+    if s is None:
+        yield None
+        return
+    token = _current.set(s)
+    try:
+        yield s
+    except BaseException as exc:
+        s.error = f"{type(exc).__name__}: {exc}"
+        raise
+    finally:
+        _current.reset(token)
+        s.end()
+
+
+# ---------------------------------------------------------------------------
+# OTLP/JSON export
+# ---------------------------------------------------------------------------
+_client: Optional[httpx.AsyncClient] = None
+_pending: set = set()
+
+
+def _kv(key: str, value: Any) -> dict:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+def _export(trace: Trace) -> None:
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    task = loop.create_task(_post(trace.to_otlp()))
+    _pending.add(task)  # fire-and-forget 태스크가 GC 되지 않도록 보관
+    task.add_done_callback(_pending.discard)
+
+
+async def _post(payload: dict) -> None:
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(timeout=5)
+    try:
+        await _client.post(f"{OTEL_EXPORTER_OTLP_ENDPOINT}/v1/traces", json=payload)
+    except Exception as exc:  # noqa: BLE001
+        print(f"[tracing] ⚠️ OTLP export failed: {exc}", flush=True)
@@ -5,7 +5,7 @@ import os
 import threading
 from datetime import datetime
 from functools import lru_cache
-from typing import List, Union
+from typing import List, Tuple, Union
 
 import chromadb
 from chromadb.config import Settings
@@ -74,90 +74,126 @@ class VectorDB:
     def _get_collection_name(self, file_id: str) -> str:
         return file_id
 
+    def _require_client(self) -> chromadb.HttpClient:
+        """연결 실패는 ConnectionError 로 — 서킷 브레이커가 장애로 집계한다."""
+        client = self.client
+        if client is None:
+            raise ConnectionError(f"Chroma client not available ({CHROMA_HOST}:{CHROMA_PORT})")
+        return client
+
+    @staticmethod
+    def _is_missing(exc: Exception) -> bool:
+        """컬렉션 없음 (chromadb 버전에 따라 NotFoundError / InvalidCollectionException / ValueError)"""
+        if type(exc).__name__ in ("NotFoundError", "InvalidCollectionException"):
+            return True
+        return isinstance(exc, ValueError) and "does not exist" in str(exc)
+
     def _get_vectorstore(self, file_id_or_col: str) -> Chroma:
         """file_id 또는 이미 collection_name 이 들어와도 동작."""
-        if self.client is None:
-            raise RuntimeError("Chroma client not available")
         return Chroma(
-            client=self.client,
+            client=self._require_client(),
             collection_name=file_id_or_col,
             embedding_function=self.embeddings,
             persist_directory=_PERSIST_DIR,
         )
 
     # ------------- CRUD 메서드 ----------------------------
+    # 아래 메서드는 VectorStore(@guarded("chroma")) 가 호출하므로 장애를 삼키지 않고 그대로
+    # 올린다 — 빈 결과로 바꾸면 브레이커가 실패를 보지 못한다. 컬렉션이 없는 것만 정상(빈 값).
     def store(self, content: Union[str, List[str]], file_id: str) -> None:
-        """`content` 가 문자열이면 → 청크로 분할, list[str] 이면 그대로 저장."""
-        try:
-            chunks = (
-                self.text_splitter.split_text(content)
-                if isinstance(content, str)
-                else content
+        """`content` 가 문자열이면 → 청크로 분할, list[str] 이면 그대로 저장.
+
+        청크 id 가 ``{file_id}:{chunk_index}`` 로 고정되어 재시도해도 중복 저장되지 않는다.
+        """
+        chunks = (
+            self.text_splitter.split_text(content)
+            if isinstance(content, str)
+            else content
+        )
+        if not chunks:
+            print(f"[VectorDB.store] ⚠️ no chunks for {file_id}")
+            return
+
+        today = datetime.now(ZoneInfo("Asia/Seoul")).strftime("%Y-%m-%d")
+        docs: List[Document] = [
+            Document(
+                page_content=ck,
+                metadata={
+                    "file_id": file_id,
+                    "chunk_index": idx,
+                    "date": today,
+                },
             )
-            if not chunks:
-                print(f"[VectorDB.store] ⚠️ no chunks for {file_id}")
-                return
-
-            today = datetime.now(ZoneInfo("Asia/Seoul")).strftime("%Y-%m-%d")
-            docs: List[Document] = [
-                Document(
-                    page_content=ck,
-                    metadata={
-                        "file_id": file_id,
-                        "chunk_index": idx,
-                        "date": today,
-                    },
-                )
-                for idx, ck in enumerate(chunks)
-            ]
-
-            vs = self._get_vectorstore(self._get_collection_name(file_id))
-            with self._lock:
-                for i in range(0, len(docs), _BATCH_SIZE):
-                    try:
-                        vs.add_documents(docs[i : i + _BATCH_SIZE])
-                    except Exception as e:
-                        print(f"[VectorDB.store] batch {i//_BATCH_SIZE} fail: {e}")
+            for idx, ck in enumerate(chunks)
+        ]
+        ids = [f"{file_id}:{idx}" for idx in range(len(docs))]
 
-            print(f"[VectorDB.store] ✅ stored {len(docs)} docs for {file_id}")
+        vs = self._get_vectorstore(self._get_collection_name(file_id))
+        with self._lock:
+            for i in range(0, len(docs), _BATCH_SIZE):
+                vs.add_documents(docs[i : i + _BATCH_SIZE], ids=ids[i : i + _BATCH_SIZE])
 
-        except Exception as e:
-            print(f"[VectorDB.store] ❌ {e}")
+        print(f"[VectorDB.store] ✅ stored {len(docs)} docs for {file_id}")
 
     def get_docs(self, file_id: str, query: str, k: int = 8) -> List[Document]:
+        return self._get_vectorstore(self._get_collection_name(file_id)).similarity_search(query, k=k)
+
+    def get_docs_with_scores(self, file_id: str, query: str, k: int = 8) -> List[Tuple[Document, float]]:
+        """(Document, 관련도 0~1) 목록. 관련도가 높을수록 질의와 가깝다."""
+        vs = self._get_vectorstore(self._get_collection_name(file_id))
+        return vs.similarity_search_with_relevance_scores(query, k=k)
+
+    def _get_collection(self, file_id: str):
+        """컬렉션 (없으면 None)."""
         try:
-            return self._get_vectorstore(self._get_collection_name(file_id)).similarity_search(query, k=k)
+            return self._require_client().get_collection(self._get_collection_name(file_id))
         except Exception as e:
-            print(f"[VectorDB.get_docs] ❌ {e}")
-            return []
+            if self._is_missing(e):
+                return None
+            raise
 
     def get_all_chunks(self, file_id: str) -> List[Document]:
         """chunk_index 기준 정렬 반환."""
-        try:
-            col = self.client.get_collection(self._get_collection_name(file_id))  # type: ignore
-            data = col.get(include=["documents", "metadatas"])
-            docs_raw  = data.get("documents", [])
-            metas_raw = data.get("metadatas", [{}] * len(docs_raw))
-
-            items = sorted(
-                zip(docs_raw, metas_raw),
-                key=lambda x: x[1].get("chunk_index", 0),
-            )
-            return [Document(page_content=d, metadata=m) for d, m in items]
-        except Exception as e:
-            print(f"[VectorDB.get_all_chunks] ❌ {e}")
+        col = self._get_collection(file_id)
+        if col is None:
             return []
+        data = col.get(include=["documents", "metadatas"])
+        docs_raw  = data.get("documents", [])
+        metas_raw = data.get("metadatas", [{}] * len(docs_raw))
+
+        items = sorted(
+            zip(docs_raw, metas_raw),
+            key=lambda x: x[1].get("chunk_index", 0),
+        )
+        return [Document(page_content=d, metadata=m) for d, m in items]
+
+    def get_all_chunks_with_embeddings(self, file_id: str) -> Tuple[List[str], List[List[float]]]:
+        """저장된 청크 본문과 임베딩 (chunk_index 순)."""
+        col = self._get_collection(file_id)
+        if col is None:
+            return [], []
+        data = col.get(include=["documents", "metadatas", "embeddings"])
+        docs_raw  = data.get("documents") or []
+        metas_raw = data.get("metadatas") or [{}] * len(docs_raw)
+        embs_raw  = data.get("embeddings")
+        if embs_raw is None:
+            embs_raw = []
+
+        items = sorted(
+            zip(docs_raw, metas_raw, embs_raw),
+            key=lambda x: (x[1] or {}).get("chunk_index", 0),
+        )
+        return [d for d, _, _ in items], [list(e) for _, _, e in items]
 
     def has_chunks(self, file_id: str) -> bool:
-        try:
-            return self.client.get_collection(self._get_collection_name(file_id)).count() > 0  # type: ignore
-        except Exception:
-            return False
+        col = self._get_collection(file_id)
+        return col is not None and col.count() > 0
 
     def delete_document(self, file_id: str) -> bool:
         try:
             with self._lock:
                 self.client.delete_collection(self._get_collection_name(file_id))  # type: ignore
+            self._invalidate_derived(file_id)
             self._log_vector_deletion(file_id)
             return True
         except Exception as e:
@@ -172,11 +208,17 @@ class VectorDB:
             return []
 
     # ------------- 유지보수/모니터링 -----------------------
-    def cleanup_unused_vectors(self) -> List[str]:
+    def cleanup_unused_vectors(self, cache=None) -> List[str]:
         deleted: List[str] = []
-        cache = get_cache_db()
+        cache = cache or get_cache_db()
+        live_ids = set(cache.get_all_file_ids())   # 전역 인덱스 1회 조회
         for fid in self.list_stored_documents():
-            if not cache.get_pdf(fid) and self.delete_document(fid):
+            if fid in live_ids:
+                continue
+            # 인덱스 도입 이전에 저장된 요약은 pdf:index 에 없음 → 삭제 전에 직접 확인
+            if cache.exists_pdf(fid):
+                continue
+            if self.delete_document(fid):
                 deleted.append(fid)
         return deleted
 
@@ -223,6 +265,15 @@ class VectorDB:
                     total += os.path.getsize(fp)
         return total
 
+    def _invalidate_derived(self, file_id: str):
+        """벡터가 사라지면 그 벡터에서 파생된 캐시(질의응답·추출 초록)도 무효화."""
+        try:
+            cache = get_cache_db()
+            cache.delete_answers(file_id)
+            cache.delete_abstract(file_id)
+        except Exception as e:
+            print(f"[VectorDB._invalidate_derived] ❌ {e}")
+
     def _log_vector_deletion(self, file_id: str):
         try:
             r = get_cache_db().r
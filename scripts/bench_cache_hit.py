@@ -0,0 +1,83 @@
+"""Requests/sec for cached SUMMARY_ALL requests: graph path vs fast path.
+
+Needs the same Redis / Chroma the API uses (run it next to the server)::
+
+    python scripts/bench_cache_hit.py --requests 2000 --concurrency 16 --lang en
+
+A summary and its ``--lang`` translation are seeded for a throwaway
+file_id, so neither path calls the LLM. The graph path still builds
+``SummaryState``, asks Chroma ``has_chunks`` and runs ``translate``; the fast
+path does two Redis round trips (metadata GET + one script). ``--lang ko``
+with a Korean summary measures the no-translation case. The seeded keys are deleted afterwards.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.cache.cache_db import get_cache_db  # noqa: E402
+from app.service.summary_service_graph import get_summary_service_graph  # noqa: E402
+
+SUMMARY = "이 문서는 새로운 어텐션 구조를 제안하고 메모리 사용량을 절반으로 줄였다. " * 20
+TRANSLATION = "The paper proposes a new attention layout that halves memory usage. " * 20
+
+
+async def _run(fast: bool, file_id: str, lang: str, n: int, concurrency: int) -> tuple[float, list[float]]:
+    service = get_summary_service_graph()
+    service.fast_path = fast
+    latencies: list[float] = []
+    sem = asyncio.Semaphore(concurrency)
+
+    async def one() -> None:
+        async with sem:
+            t0 = time.perf_counter()
+            body = await service.generate(file_id, "http://bench.invalid/doc.pdf", "SUMMARY_ALL", lang)
+            latencies.append(time.perf_counter() - t0)
+            assert body.get("cached") and body.get("summary"), body
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(n)))
+    return time.perf_counter() - t0, latencies
+
+
+def _pct(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))] * 1000
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--lang", default="en")
+    parser.add_argument("--warmup", type=int, default=50)
+    args = parser.parse_args()
+
+    db = get_cache_db()
+    file_id = f"bench-{uuid.uuid4().hex[:8]}"
+    db.set_pdf(file_id, SUMMARY)
+    db.set_translation(file_id, SUMMARY, args.lang, TRANSLATION)
+    try:
+        print(f"{'path':>6} {'req/s':>9} {'p50 ms':>8} {'p99 ms':>8}")
+        results = {}
+        for fast in (False, True):
+            await _run(fast, file_id, args.lang, args.warmup, args.concurrency)
+            elapsed, lat = await _run(fast, file_id, args.lang, args.requests, args.concurrency)
+            name = "fast" if fast else "graph"
+            results[name] = args.requests / elapsed
+            print(f"{name:>6} {results[name]:>9.1f} {statistics.median(lat) * 1000:>8.2f} {_pct(lat, 0.99):>8.2f}")
+        print(f"speed-up x{results['fast'] / results['graph']:.1f}")
+    finally:
+        db.delete_pdf(file_id)
+        db.r.delete(db._get_translation_key(file_id))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,70 @@
+"""Grade-node latency benchmark: sequential vs concurrent vs batch.
+
+Uses a fake LLM with a fixed per-call latency so the numbers isolate the
+scheduling strategy (no vLLM needed). A real batch prompt is longer than a
+single-chunk prompt, so its call is slower than shown here::
+
+    python scripts/bench_grade.py --latency 0.3 --chunks 8 13
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.service.chunk_grader import ChunkGrader  # noqa: E402
+
+
+class FakeLlm:
+    """Answers 'good' for every chunk after ``latency`` seconds."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.calls = 0
+
+    async def execute(self, prompt: str) -> str:
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        if "JSON array" in prompt:
+            n = sum(1 for line in prompt.splitlines() if line.lstrip().startswith("["))
+            return json.dumps(["good"] * n)
+        return "good"
+
+    async def summarize(self, docs):
+        return ""
+
+
+async def _run(mode: str, n: int, latency: float, concurrency: int) -> tuple[float, int]:
+    llm = FakeLlm(latency)
+    grader = ChunkGrader(llm, mode=mode, concurrency=concurrency)
+    chunks = [f"chunk {i} " * 20 for i in range(n)]
+    t0 = time.perf_counter()
+    kept = await grader.grade("what is attention?", "summary", chunks)
+    assert len(kept) == n
+    elapsed = time.perf_counter() - t0
+    # refine 루프 재진입: 캐시 적중이므로 LLM 호출 없음
+    await grader.grade("what is attention?", "summary", chunks)
+    return elapsed, llm.calls
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--latency", type=float, default=0.3, help="seconds per LLM call")
+    ap.add_argument("--chunks", type=int, nargs="+", default=[8, 13])
+    ap.add_argument("--concurrency", type=int, default=4)
+    args = ap.parse_args()
+
+    print(f"{'chunks':>6} {'mode':>11} {'wall(s)':>8} {'llm calls':>9}")
+    for n in args.chunks:
+        for mode in ("sequential", "concurrent", "batch"):
+            elapsed, calls = asyncio.run(_run(mode, n, args.latency, args.concurrency))
+            print(f"{n:>6} {mode:>11} {elapsed:>8.2f} {calls:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Accuracy and speed of the local language detector on mixed Korean/English text.
+
+    python scripts/bench_lang_detect.py
+
+Each sample is labelled with the language it is *written in* (``None`` when
+the mix is too even to skip translation safely). A "false skip" — saying a
+text is already in the target language when it is not — is the costly error,
+because the user then receives an untranslated answer.
+"""
+from __future__ import annotations
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.utils.lang_detect import detect_lang  # noqa: E402
+
+SAMPLES = [
+    # 순수 한국어
+    ("ko", "이 문서는 반도체 메모리 구조와 제조 공정을 설명합니다."),
+    ("ko", "요약: 저자들은 새로운 학습 방법을 제안하고 기존 방법보다 높은 정확도를 보였다."),
+    ("ko", "질문하신 내용은 문서의 3장에서 자세히 다루고 있습니다. 핵심은 비용 절감입니다."),
+    ("ko", "결론적으로 제안된 시스템은 응답 시간을 40% 단축했습니다."),
+    # 영어 용어가 섞인 한국어
+    ("ko", "Transformer 모델은 self-attention 메커니즘을 사용하여 문맥을 파악합니다."),
+    ("ko", "이 논문은 GPU 메모리 사용량을 줄이기 위해 FlashAttention 을 적용했다."),
+    ("ko", "BERT 와 GPT 의 차이는 encoder 와 decoder 구조에 있습니다. 자세한 내용은 Table 2 참고."),
+    ("ko", "RAG 파이프라인에서 retriever 가 top-k 문서를 가져오고 LLM 이 답변을 생성합니다."),
+    ("ko", "저자는 ResNet-50 backbone 위에 새로운 head 를 추가해 ImageNet 에서 평가했다."),
+    # 순수 영어
+    ("en", "The paper proposes a new attention mechanism that reduces memory usage."),
+    ("en", "In summary, the authors show that the model outperforms previous baselines on all tasks."),
+    ("en", "This document describes the installation steps for the API server and its dependencies."),
+    ("en", "The answer is not related to the content of the document."),
+    # 한국어 고유명사가 조금 섞인 영어
+    ("en", "The report from Seoul (서울) describes how the city reduced traffic by 20 percent."),
+    ("en", "Samsung's (삼성) new memory chip is described in the second section of the paper."),
+    # 일본어 / 중국어
+    ("ja", "この論文は新しい注意機構を提案し、メモリ使用量を削減します。"),
+    ("ja", "結論として、提案手法は従来手法よりも高い精度を達成した。"),
+    ("zh", "本文提出了一种新的注意力机制，可以减少内存使用。"),
+    ("zh", "总之，作者证明了该模型在所有任务上都优于以前的基线。"),
+    # 애매한 혼합 — 번역을 건너뛰면 안 됨
+    (None, "Attention is all you need 논문 요약"),
+    (None, "Results: accuracy 정확도 92.1, latency 지연 35ms, throughput 처리량 high"),
+    # 영어 외 라틴 문자 — 영어로 오인하면 안 됨
+    (None, "Le modèle proposé réduit l'utilisation de la mémoire de moitié."),
+    (None, "Das vorgeschlagene Modell reduziert den Speicherverbrauch deutlich."),
+]
+
+
+def main() -> None:
+    correct = false_skip = 0
+    for expected, text in SAMPLES:
+        got = detect_lang(text)
+        ok = got == expected
+        correct += ok
+        # 기대 언어와 다른 확정 판단 = 잘못된 번역 생략 위험
+        if got is not None and got != expected:
+            false_skip += 1
+        mark = "✅" if ok else "❌"
+        print(f"{mark} expected={str(expected):>4} got={str(got):>4}  {text[:50]}")
+
+    n = len(SAMPLES)
+    runs = 2000
+    t0 = time.perf_counter()
+    for _ in range(runs):
+        for _, text in SAMPLES:
+            detect_lang(text)
+    per_call_us = (time.perf_counter() - t0) / (runs * n) * 1e6
+
+    print()
+    print(f"accuracy      : {correct}/{n} ({correct / n:.1%})")
+    print(f"false skips   : {false_skip}")
+    print(f"latency       : {per_call_us:.1f} µs/call (avg {sum(len(t) for _, t in SAMPLES) // n} chars)")
+
+
+if __name__ == "__main__":
+    main()
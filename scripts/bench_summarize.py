@@ -0,0 +1,128 @@
+"""Map-reduce summarizer benchmark: total tokens and wall time per document size.
+
+Uses a fake LLM whose latency grows with prompt and output size, so the
+numbers show how packing and map concurrency behave without vLLM::
+
+    python scripts/bench_summarize.py --chunks 10 50 200 --concurrency 1 4 8
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.infra.map_reduce import MapReduceSummarizer  # noqa: E402
+
+CHUNK_CHARS = 2000            # PdfLoader 청크 크기
+
+
+def count_tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+class FakeLlm:
+    """Latency = base + prefill per input token + decode per output token."""
+
+    def __init__(self, base: float, prefill: float, decode: float, out_tokens: int):
+        self.base, self.prefill, self.decode, self.out_tokens = base, prefill, decode, out_tokens
+
+    async def __call__(self, prompt: str) -> str:
+        await asyncio.sleep(self.base + self.prefill * count_tokens(prompt) + self.decode * self.out_tokens)
+        digest = hashlib.sha1(prompt.encode("utf-8")).hexdigest()     # 입력마다 다른 요약
+        return (digest * (self.out_tokens * 4 // len(digest) + 1))[: self.out_tokens * 4]
+
+
+async def _run(n_chunks: int, concurrency: int, args) -> tuple:
+    llm = FakeLlm(args.base, args.prefill, args.decode, args.out_tokens)
+    summarizer = MapReduceSummarizer(
+        llm, count_tokens,
+        context_tokens=args.context, output_tokens=args.max_tokens, map_concurrency=concurrency,
+    )
+    docs = ["x" * CHUNK_CHARS for _ in range(n_chunks)]
+    _, stats = await summarizer.summarize_with_stats(docs)
+    return stats
+
+
+async def _run_baseline(n_chunks: int, args) -> tuple:
+    """LangChain map_reduce 기본 동작 근사: 청크당 map 1회(무제한 동시), 단일 combine."""
+    import time
+    llm = FakeLlm(args.base, args.prefill, args.decode, args.out_tokens)
+    docs = ["x" * CHUNK_CHARS for _ in range(n_chunks)]
+    t0 = time.perf_counter()
+    partials = await asyncio.gather(*(llm(d) for d in docs))
+    combine = "\n\n".join(partials)
+    await llm(combine)
+    prompt_tokens = sum(map(count_tokens, docs)) + count_tokens(combine)
+    return n_chunks + 1, prompt_tokens, count_tokens(combine), time.perf_counter() - t0
+
+
+class MemoryTree:
+    def __init__(self):
+        self.nodes = {}
+
+    def get_summary_nodes(self, doc_id, keys):
+        return [self.nodes.get((doc_id, k)) for k in keys]
+
+    def set_summary_nodes(self, doc_id, nodes):
+        self.nodes.update({(doc_id, k): v for k, v in nodes.items()})
+
+
+async def _run_incremental(n_chunks: int, args) -> None:
+    """전체 요약 → 청크 1개 수정 후 재요약 → 구간 요약 순으로 LLM 호출 수 비교."""
+    llm = FakeLlm(args.base, args.prefill, args.decode, args.out_tokens)
+    summarizer = MapReduceSummarizer(
+        llm, count_tokens, context_tokens=args.context, output_tokens=args.max_tokens,
+        map_concurrency=4, tree_store=MemoryTree(),
+    )
+    docs = [f"{i:04d}" + "x" * (CHUNK_CHARS - 4) for i in range(n_chunks)]
+    _, first = await summarizer.summarize_with_stats(docs, "doc")
+    docs[n_chunks // 2] = "y" * CHUNK_CHARS          # 같은 길이로 한 페이지 수정
+    _, again = await summarizer.summarize_with_stats(docs, "doc")
+    print(f"{n_chunks:>6} {first.calls:>10} {again.calls:>12} {again.reused:>7}")
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--chunks", type=int, nargs="+", default=[10, 50, 200])
+    ap.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8])
+    ap.add_argument("--context", type=int, default=8192)
+    ap.add_argument("--max-tokens", type=int, default=1000)
+    ap.add_argument("--out-tokens", type=int, default=250, help="fake summary length")
+    ap.add_argument("--base", type=float, default=0.05)
+    ap.add_argument("--prefill", type=float, default=0.00002)
+    ap.add_argument("--decode", type=float, default=0.002)
+    ap.add_argument("--baseline", action="store_true", help="also run the per-chunk map baseline")
+    ap.add_argument("--incremental", action="store_true", help="re-summarize after editing one chunk")
+    args = ap.parse_args()
+
+    if args.incremental:
+        print("summary tree reuse (one chunk edited between runs):")
+        print(f"{'chunks':>6} {'first_calls':>10} {'rerun_calls':>12} {'reused':>7}")
+        for n in args.chunks:
+            asyncio.run(_run_incremental(n, args))
+        print()
+
+    if args.baseline:
+        print("baseline (one map per chunk, unbounded, single combine):")
+        print(f"{'chunks':>6} {'calls':>5} {'prompt_tok':>10} {'combine_tok':>11} {'wall(s)':>7}")
+        for n in args.chunks:
+            calls, tok, combine_tok, wall = asyncio.run(_run_baseline(n, args))
+            flag = "  ⚠️ combine exceeds context" if combine_tok > args.context - args.max_tokens else ""
+            print(f"{n:>6} {calls:>5} {tok:>10} {combine_tok:>11} {wall:>7.2f}{flag}")
+        print()
+
+    print(f"{'chunks':>6} {'conc':>4} {'groups':>6} {'levels':>6} {'calls':>5} "
+          f"{'prompt_tok':>10} {'out_tok':>7} {'wall(s)':>7}")
+    for n in args.chunks:
+        for c in args.concurrency:
+            s = asyncio.run(_run(n, c, args))
+            print(f"{n:>6} {c:>4} {s.map_groups:>6} {s.levels:>6} {s.calls:>5} "
+                  f"{s.prompt_tokens:>10} {s.output_tokens:>7} {s.wall_sec:>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Calibrate the embedding web-router thresholds against the LLM router.
+
+1) Label questions with the LLM router and record the max relevance score
+   (needs Chroma, Redis and the LLM — run inside the API environment)::
+
+       python scripts/calibrate_web_router.py --questions questions.jsonl --dump pairs.jsonl
+
+   ``questions.jsonl`` lines look like ``{"file_id": "...", "query": "..."}``.
+
+2) Re-sweep thresholds offline from the recorded pairs::
+
+       python scripts/calibrate_web_router.py --pairs pairs.jsonl --target 0.95
+
+Prints the best single threshold (``WEB_ROUTER_THRESHOLD``) and the widest
+hybrid band (``WEB_ROUTER_LOW`` / ``WEB_ROUTER_HIGH``) meeting the target
+agreement, plus the share of questions that skip the LLM call.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+from typing import List, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.service.web_router import best_band, best_threshold  # noqa: E402
+
+
+async def _label(questions_path: str) -> List[Tuple[float, bool]]:
+    from app.infra.cache_store import CacheStore
+    from app.infra.llm_engine import LlmEngine
+    from app.infra.vector_store import VectorStore
+    from app.service.web_router import ROUTER_PROMPT
+
+    store, llm, cache = VectorStore(), LlmEngine(temperature=0), CacheStore()  # 운영 라우터와 같은 설정
+    samples: List[Tuple[float, bool]] = []
+    with open(questions_path, encoding="utf-8") as fp:
+        for line in fp:
+            if not line.strip():
+                continue
+            q = json.loads(line)
+            hits = await store.similarity_search_with_scores(q["file_id"], q["query"], k=1)
+            if not hits:
+                print(f"⚠️ no vectors for {q['file_id']} — skipped")
+                continue
+            score = max(s for _, s in hits)
+            summary = cache.get_summary(q["file_id"]) or ""
+            answer = await llm.execute(ROUTER_PROMPT.format(query=q["query"], summary=summary))
+            samples.append((score, "true" in answer.lower()))
+    return samples
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    src = ap.add_mutually_exclusive_group(required=True)
+    src.add_argument("--questions", help="JSONL of {file_id, query} to label with the LLM")
+    src.add_argument("--pairs", help="JSONL of {score, web} recorded earlier")
+    ap.add_argument("--dump", help="write labelled (score, web) pairs here")
+    ap.add_argument("--target", type=float, default=0.95, help="required agreement for hybrid band")
+    args = ap.parse_args()
+
+    if args.questions:
+        samples = asyncio.run(_label(args.questions))
+        if args.dump:
+            with open(args.dump, "w", encoding="utf-8") as fp:
+                for score, web in samples:
+                    fp.write(json.dumps({"score": score, "web": web}) + "\n")
+    else:
+        with open(args.pairs, encoding="utf-8") as fp:
+            samples = [(d["score"], d["web"]) for d in (json.loads(line) for line in fp if line.strip())]
+
+    if not samples:
+        print("❌ no samples")
+        return
+
+    web_share = sum(web for _, web in samples) / len(samples)
+    t, agree = best_threshold(samples)
+    low, high, band_agree, coverage = best_band(samples, args.target)
+    print(f"samples               : {len(samples)} (LLM says web for {web_share:.1%})")
+    print(f"embedding mode        : WEB_ROUTER_THRESHOLD={t:.2f}  agreement={agree:.1%}")
+    print(f"hybrid mode           : WEB_ROUTER_LOW={low:.2f} WEB_ROUTER_HIGH={high:.2f}")
+    print(f"  agreement (decided) : {band_agree:.1%}")
+    print(f"  LLM calls avoided   : {coverage:.1%}")
+
+
+if __name__ == "__main__":
+    main()